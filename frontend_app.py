@@ -11,8 +11,12 @@ import streamlit as st
 import sys
 import os
 import json
+import logging
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env
@@ -21,7 +25,14 @@ load_dotenv()
 # Add parent path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from odoo_dashboard import DashboardRefresher, PagedTable, invoice_frame, partner_frame
 from odoo_mcp_server import OdooMCPServer
+from odoo_records import Invoice, Partner
+
+logger = logging.getLogger(__name__)
+
+# Seconds a dashboard read stays cached when nothing is created through the chat
+DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", 60))
 
 # Page config
 st.set_page_config(
@@ -160,6 +171,30 @@ def get_odoo_server():
     return server
 
 
+@st.cache_resource
+def get_dashboard_refresher() -> DashboardRefresher:
+    """One background refresher per process; every session reads its snapshot."""
+    refresher = DashboardRefresher(
+        get_odoo_server(),
+        interval=float(os.getenv("DASHBOARD_REFRESH_INTERVAL", 30))
+    )
+    refresher.start()
+    return refresher
+
+
+@st.cache_resource
+def get_paged_tables() -> Dict[str, PagedTable]:
+    """Invoices and Customers tables paged by Odoo; cached pages are shared by all sessions."""
+    odoo = get_odoo_server()
+    page_size = int(os.getenv("DASHBOARD_PAGE_SIZE", 50))
+    return {
+        'invoices': PagedTable('invoices', lambda **kw: odoo.get_invoices(output='columns', **kw),
+                               invoice_frame, page_size=page_size, ttl=DASHBOARD_CACHE_TTL),
+        'partners': PagedTable('partners', lambda **kw: odoo.get_partners(output='columns', **kw),
+                               partner_frame, page_size=page_size, ttl=DASHBOARD_CACHE_TTL),
+    }
+
+
 @st.cache_resource
 def get_openai_client():
     api_key = os.getenv("OPENAI_API_KEY")
@@ -173,46 +208,98 @@ def get_openai_client():
     return None
 
 
-def get_invoices_data(odoo: OdooMCPServer, state: str = None, limit: int = 50) -> list:
-    """Get invoices from Odoo."""
-    result = odoo.get_invoices(state=state, limit=limit)
+class DataVersion:
+    """Token bumped whenever the chat tools change Odoo data, shared by all sessions."""
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def bump(self):
+        with self._lock:
+            self.value += 1
+
+
+@st.cache_resource
+def get_data_version() -> DataVersion:
+    return DataVersion()
+
+
+def mark_data_changed():
+    """Invalidate cached reads and wake the dashboard refresher after a write."""
+    get_data_version().bump()
+    get_dashboard_refresher().request_refresh()
+    for table in get_paged_tables().values():
+        table.invalidate()
+
+
+# Cached reads are keyed by their arguments plus the data version, so a
+# create through the chat makes every session fetch fresh data on its next
+# run; otherwise reruns (e.g. chat keystrokes) reuse the cached result.
+# The leading underscore keeps the server out of the cache key.
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _load_invoices(_odoo: OdooMCPServer, state: str, limit: int, version: int) -> List[Invoice]:
+    result = _odoo.get_invoices(state=state, limit=limit, output='records')
     if result.get('success'):
-        invoices = result.get('invoices', [])
-        normalized = []
-        for inv in invoices:
-            normalized.append({
-                'id': inv.get('id'),
-                'name': inv.get('name', 'N/A'),
-                'partner_id': inv.get('partner_id', [0, 'Unknown'])[0] if isinstance(inv.get('partner_id'), list) else inv.get('partner_id'),
-                'partner_name': inv.get('partner_id', [0, 'Unknown'])[1] if isinstance(inv.get('partner_id'), list) else inv.get('partner_name', 'Unknown'),
-                'invoice_date': inv.get('invoice_date', 'N/A'),
-                'due_date': inv.get('invoice_date_due', inv.get('due_date', 'N/A')),
-                'amount_total': inv.get('amount_total', 0),
-                'amount_residual': inv.get('amount_residual', 0),
-                'state': inv.get('state', 'draft'),
-                'payment_state': inv.get('payment_state', 'not_paid')
-            })
-        return normalized
+        return result.get('invoices', [])
     return []
 
 
-def get_partners_data(odoo: OdooMCPServer) -> list:
-    """Get partners/customers from Odoo."""
-    result = odoo.get_partners()
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _load_partners(_odoo: OdooMCPServer, version: int) -> List[Partner]:
+    result = _odoo.get_partners(output='records')
     if result.get('success'):
-        partners = result.get('partners', [])
-        normalized = []
-        for p in partners:
-            normalized.append({
-                'id': p.get('id'),
-                'name': p.get('name', 'Unknown'),
-                'email': p.get('email', 'N/A') or 'N/A',
-                'phone': p.get('phone', 'N/A') or 'N/A'
-            })
-        return normalized
+        return result.get('partners', [])
     return []
 
 
+def get_invoices_data(odoo: OdooMCPServer, state: str = None, limit: int = 50) -> List[Invoice]:
+    """Get invoices from Odoo as Invoice records (normalized by the server)."""
+    return _load_invoices(odoo, state, limit, get_data_version().value)
+
+
+def get_partners_data(odoo: OdooMCPServer) -> List[Partner]:
+    """Get partners/customers from Odoo as Partner records."""
+    return _load_partners(odoo, get_data_version().value)
+
+
+def render_paged_table(table: PagedTable, key: str, sorts: Dict[str, str], search_label: str,
+                       empty_message: str, default_desc: bool = False, column_config: Optional[dict] = None):
+    """Search and sort controls, the current page fetched from Odoo, and a pager."""
+    col_search, col_sort, col_desc = st.columns([3, 2, 1])
+    search = col_search.text_input(search_label, key=f"{key}_search")
+    sort_label = col_sort.selectbox("Sort by", list(sorts), key=f"{key}_sort")
+    descending = col_desc.toggle("Descending", value=default_desc, key=f"{key}_desc")
+    order = f"{sorts[sort_label]} desc" if descending else sorts[sort_label]
+
+    # A new search or sort starts from the first page
+    page_key = f"{key}_page"
+    if st.session_state.get(f"{key}_query") != (search, order):
+        st.session_state[f"{key}_query"] = (search, order)
+        st.session_state[page_key] = 1
+
+    number = st.session_state.get(page_key, 1)
+    try:
+        frame, total = table.page(number - 1, order, search)
+        pages = table.pages(total)
+        if number > pages:
+            # Fewer rows than when the page was picked
+            number = st.session_state[page_key] = pages
+            frame, total = table.page(number - 1, order, search)
+    except Exception as e:
+        st.error(f"Could not load {key}: {e}")
+        return
+
+    if not total:
+        st.info(f"No matches for '{search}'." if search.strip() else empty_message)
+        return
+
+    st.dataframe(frame, use_container_width=True, hide_index=True, column_config=column_config)
+    col_page, col_count = st.columns([1, 3])
+    col_page.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+    col_count.caption(f"{total:,} rows - page {number} of {pages}")
+
+
 def execute_tool(odoo: OdooMCPServer, tool_name: str, arguments: dict) -> str:
     """Execute an Odoo tool and return the result as a string."""
 
@@ -222,8 +309,8 @@ def execute_tool(odoo: OdooMCPServer, tool_name: str, arguments: dict) -> str:
             return "No invoices found. Try creating one first!"
         result = f"Found {len(invoices)} invoice(s):\n"
         for inv in invoices[:10]:
-            status = "PAID" if inv['payment_state'] == 'paid' else inv['state'].upper()
-            result += f"- {inv['name']}: {inv['partner_name']} - ${inv['amount_total']:,.2f} ({status})\n"
+            status = "PAID" if inv.payment_state == 'paid' else inv.state.upper()
+            result += f"- {inv.name or 'N/A'}: {inv.partner_name or 'Unknown'} - ${inv.amount_total:,.2f} ({status})\n"
         return result
 
     elif tool_name == "get_customers":
@@ -232,7 +319,7 @@ def execute_tool(odoo: OdooMCPServer, tool_name: str, arguments: dict) -> str:
             return "No customers found. Try creating one first with 'create a customer named XYZ'!"
         result = f"Found {len(partners)} customer(s):\n"
         for p in partners[:10]:
-            result += f"- {p['name']} (ID: {p['id']}, Email: {p['email']})\n"
+            result += f"- {p.name or 'Unknown'} (ID: {p.id}, Email: {p.email or 'N/A'})\n"
         return result
 
     elif tool_name == "create_customer":
@@ -243,6 +330,7 @@ def execute_tool(odoo: OdooMCPServer, tool_name: str, arguments: dict) -> str:
         result = odoo.create_partner(name, email, phone)
 
         if result.get('success'):
+            mark_data_changed()
             partner = result.get('partner', {})
             return f"✅ Customer created successfully!\n- Name: {name}\n- ID: {partner.get('id', result.get('partner_id'))}\n- Email: {partner.get('email', 'N/A')}"
         else:
@@ -254,14 +342,15 @@ def execute_tool(odoo: OdooMCPServer, tool_name: str, arguments: dict) -> str:
         description = arguments.get('description', 'Services')
         due_days = arguments.get('due_days', 30)
 
-        # Find customer
-        partners = get_partners_data(odoo)
-        partner = next((p for p in partners if customer_name.lower() in p['name'].lower()), None)
+        # Find customer via the partner name index (no full partner download)
+        resolution = odoo.resolve_partner(customer_name)
+        partner = resolution.get('match')
 
         # Auto-create customer if not found
         if not partner:
             create_result = odoo.create_partner(customer_name)
             if create_result.get('success'):
+                mark_data_changed()
                 partner = create_result.get('partner', {})
                 if not partner.get('id'):
                     partner['id'] = create_result.get('partner_id')
@@ -273,35 +362,76 @@ def execute_tool(odoo: OdooMCPServer, tool_name: str, arguments: dict) -> str:
         result = odoo.create_invoice(partner['id'], lines)
 
         if result.get('success'):
+            mark_data_changed()
             inv = result.get('invoice', {})
             return f"✅ Invoice created successfully!\n- Invoice: {inv.get('name', result.get('invoice_id'))}\n- Customer: {customer_name}\n- Amount: ${amount:,.2f}\n- Due in: {due_days} days"
         else:
             return f"❌ Failed to create invoice: {result.get('error', 'Unknown error')}"
 
     elif tool_name == "get_financial_summary":
-        invoices = get_invoices_data(odoo)
-        if not invoices:
+        # Totals are aggregated by Odoo over all invoices, not summed from a page of rows
+        summary = odoo.get_financial_summary()
+        invoice_counts = summary.get('invoices', {})
+        if not summary.get('success') or not invoice_counts.get('total_count'):
             return "No financial data available yet. Create some invoices first!"
 
-        total_revenue = sum(inv['amount_total'] for inv in invoices)
-        paid = sum(inv['amount_total'] for inv in invoices if inv['payment_state'] == 'paid')
-        pending = sum(inv['amount_total'] for inv in invoices if inv['state'] == 'posted' and inv['payment_state'] != 'paid')
-        outstanding = sum(inv['amount_residual'] for inv in invoices)
+        revenue = summary['revenue']
 
         return f"""📊 Financial Summary:
-- Total Invoiced: ${total_revenue:,.2f}
-- Collected (Paid): ${paid:,.2f}
-- Pending Payment: ${pending:,.2f}
-- Outstanding Balance: ${outstanding:,.2f}
-- Number of Invoices: {len(invoices)}"""
+- Total Invoiced: ${revenue['total_invoiced']:,.2f}
+- Collected (Paid): ${revenue['paid']:,.2f}
+- Pending Payment: ${revenue['pending']:,.2f}
+- Outstanding Balance: ${revenue['outstanding']:,.2f}
+- Number of Invoices: {invoice_counts['total_count']}"""
 
     return f"Unknown tool: {tool_name}"
 
 
-def generate_response_with_tools(prompt: str, odoo: OdooMCPServer, openai_client, message_history: list) -> str:
-    """Generate response using OpenAI with function calling."""
+def _stream_completion(stream, tool_calls: Dict[int, Dict[str, str]]) -> Iterator[str]:
+    """
+    Yield the text deltas of a streamed chat completion.
+
+    Tool call deltas arrive in fragments keyed by index; they are
+    accumulated into tool_calls ({index: {id, name, arguments}}).
+    """
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        for call in delta.tool_calls or []:
+            entry = tool_calls.setdefault(call.index, {"id": "", "name": "", "arguments": ""})
+            if call.id:
+                entry["id"] = call.id
+            if call.function:
+                entry["name"] += call.function.name or ""
+                entry["arguments"] += call.function.arguments or ""
+        if delta.content:
+            yield delta.content
+
+
+def generate_response_with_tools(prompt: str, odoo: OdooMCPServer, openai_client,
+                                 message_history: list) -> Iterator[str]:
+    """
+    Stream a response using OpenAI with function calling.
+
+    Both completions (the one that may request tools and the one after the
+    tool results) are streamed, so text is yielded as it arrives; render it
+    with st.write_stream. Time to first token is logged.
+    """
     if not openai_client:
-        return "OpenAI API not configured. Please set OPENAI_API_KEY."
+        yield "OpenAI API not configured. Please set OPENAI_API_KEY."
+        return
+
+    started = time.perf_counter()
+    first_token_ms = None
+
+    def timed(deltas: Iterator[str], phase: str) -> Iterator[str]:
+        nonlocal first_token_ms
+        for text in deltas:
+            if first_token_ms is None:
+                first_token_ms = (time.perf_counter() - started) * 1000
+                logger.info(f"Chat time to first token: {first_token_ms:.0f} ms ({phase})")
+            yield text
 
     try:
         # Build messages
@@ -320,49 +450,58 @@ Be helpful and concise."""
         messages.append({"role": "user", "content": prompt})
 
         # First call - may request tool use
-        response = openai_client.chat.completions.create(
+        stream = openai_client.chat.completions.create(
             model="gpt-4o-mini",
             max_tokens=500,
             messages=messages,
             tools=ODOO_TOOLS,
-            tool_choice="auto"
+            tool_choice="auto",
+            stream=True
         )
 
-        assistant_message = response.choices[0].message
+        tool_calls: Dict[int, Dict[str, str]] = {}
+        content = []
+        for text in timed(_stream_completion(stream, tool_calls), "direct"):
+            content.append(text)
+            yield text
 
         # Check if tool calls were made
-        if assistant_message.tool_calls:
-            # Execute each tool call
-            tool_results = []
-            for tool_call in assistant_message.tool_calls:
-                tool_name = tool_call.function.name
-                arguments = json.loads(tool_call.function.arguments)
-
-                result = execute_tool(odoo, tool_name, arguments)
-                tool_results.append({
-                    "tool_call_id": tool_call.id,
+        if tool_calls:
+            calls = [tool_calls[index] for index in sorted(tool_calls)]
+
+            # Add assistant message, then execute each tool call
+            messages.append({
+                "role": "assistant",
+                "content": "".join(content) or None,
+                "tool_calls": [
+                    {"id": call["id"], "type": "function",
+                     "function": {"name": call["name"], "arguments": call["arguments"]}}
+                    for call in calls
+                ]
+            })
+            for call in calls:
+                arguments = json.loads(call["arguments"] or "{}")
+                messages.append({
+                    "tool_call_id": call["id"],
                     "role": "tool",
-                    "content": result
+                    "content": execute_tool(odoo, call["name"], arguments)
                 })
 
-            # Add assistant message and tool results
-            messages.append(assistant_message)
-            messages.extend(tool_results)
-
-            # Get final response
-            final_response = openai_client.chat.completions.create(
+            # Stream the final response
+            stream = openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 max_tokens=500,
-                messages=messages
+                messages=messages,
+                stream=True
             )
-
-            return final_response.choices[0].message.content
-
-        # No tool calls, return direct response
-        return assistant_message.content
+            if content:
+                yield "\n\n"
+            yield from timed(_stream_completion(stream, {}), "after tools")
 
     except Exception as e:
-        return f"Error: {str(e)}"
+        yield f"Error: {str(e)}"
+
+    logger.info(f"Chat response finished in {(time.perf_counter() - started) * 1000:.0f} ms")
 
 
 odoo = get_odoo_server()
@@ -380,6 +519,15 @@ with st.sidebar:
 
     st.caption("Status")
     st.success(f"Odoo: {odoo.mode} mode")
+    if odoo.mode == "production" and odoo.cache is not None:
+        cache_stats = odoo.cache_stats()
+        st.caption(f"Odoo cache: {cache_stats['hit_rate']}% hits ({cache_stats['hits']}/{cache_stats['hits'] + cache_stats['misses']})")
+    if odoo.sync is not None:
+        ages = [m['age_seconds'] for m in odoo.sync.status().values()]
+        if None in ages:
+            st.caption("Local mirror: not fully synced")
+        else:
+            st.caption(f"Local mirror: synced {max(ages):.0f}s ago")
 
     if openai_client:
         st.success("OpenAI API: Connected")
@@ -399,21 +547,23 @@ with st.sidebar:
 st.title("AI Employee Dashboard")
 
 if mode in ["Dashboard", "Both"]:
-    invoices = get_invoices_data(odoo)
-    partners = get_partners_data(odoo)
+    # Latest snapshot from the background refresher; never waits on Odoo
+    snapshot = get_dashboard_refresher().snapshot
+    tables = get_paged_tables()
 
-    if not invoices:
+    if snapshot.error:
+        st.caption(f"⚠️ Showing data from {snapshot.refreshed_at or 'never'}: {snapshot.error}")
+    if not snapshot.invoice_count:
         st.warning("No invoices found. Create some invoices in Odoo or via chat!")
 
     col1, col2, col3, col4 = st.columns(4)
 
-    total_revenue = sum(inv['amount_total'] for inv in invoices) if invoices else 0
-    pending = [inv for inv in invoices if inv['state'] == 'posted']
-    paid = [inv for inv in invoices if inv['payment_state'] == 'paid']
+    total_revenue = snapshot.total_revenue
 
-    col1.metric("Total Invoices", len(invoices))
-    col2.metric("Pending", len(pending), f"${sum(i['amount_total'] for i in pending):,.0f}" if pending else "$0")
-    col3.metric("Paid", len(paid))
+    col1.metric("Total Invoices", snapshot.invoice_count)
+    col2.metric("Pending", snapshot.pending_count,
+                f"${snapshot.pending_amount:,.0f}" if snapshot.pending_count else "$0")
+    col3.metric("Paid", snapshot.paid_count)
     col4.metric("Revenue", f"${total_revenue:,.0f}")
 
     st.divider()
@@ -421,35 +571,30 @@ if mode in ["Dashboard", "Both"]:
     tab1, tab2, tab3 = st.tabs(["Invoices", "Customers", "Reports"])
 
     with tab1:
-        st.subheader("Recent Invoices")
-        if invoices:
-            invoice_data = []
-            for inv in invoices:
-                invoice_data.append({
-                    "Invoice": inv['name'],
-                    "Customer": inv['partner_name'],
-                    "Amount": f"${inv['amount_total']:,.2f}",
-                    "Due Date": str(inv['due_date']),
-                    "Status": inv['state'].upper(),
-                    "Balance": f"${inv['amount_residual']:,.2f}"
-                })
-            st.dataframe(invoice_data, use_container_width=True)
-        else:
-            st.info("No invoices yet. Try asking the chat to create one!")
+        st.subheader("Invoices")
+        render_paged_table(
+            tables['invoices'], 'invoices',
+            sorts={"Invoice date": "invoice_date", "Invoice": "name", "Customer": "customer",
+                   "Due Date": "due_date", "Amount": "amount_total", "Balance": "amount_residual",
+                   "Status": "state"},
+            search_label="Search customer",
+            empty_message="No invoices yet. Try asking the chat to create one!",
+            default_desc=True,
+            # Money is formatted by the grid, the frame keeps plain floats
+            column_config={
+                "Amount": st.column_config.NumberColumn(format="dollar"),
+                "Balance": st.column_config.NumberColumn(format="dollar"),
+            }
+        )
 
     with tab2:
         st.subheader("Customers")
-        if partners:
-            customer_data = []
-            for p in partners:
-                customer_data.append({
-                    "Name": p['name'],
-                    "Email": p['email'],
-                    "Phone": p['phone']
-                })
-            st.dataframe(customer_data, use_container_width=True)
-        else:
-            st.info("No customers yet.")
+        render_paged_table(
+            tables['partners'], 'partners',
+            sorts={"Name": "name", "Email": "email", "Phone": "phone"},
+            search_label="Search name",
+            empty_message="No customers yet."
+        )
 
     with tab3:
         st.subheader("Financial Summary")
@@ -457,15 +602,14 @@ if mode in ["Dashboard", "Both"]:
 
         with col1:
             st.markdown("### By Status")
-            if invoices:
-                status_data = {"Paid": len(paid), "Pending": len(pending)}
-                st.bar_chart(status_data)
+            if snapshot.invoice_count:
+                st.bar_chart(snapshot.status_chart)
 
         with col2:
             st.markdown("### Quick Stats")
-            if invoices:
-                st.info(f"**Average Invoice:** ${total_revenue/len(invoices):,.2f}")
-            st.info(f"**Total Customers:** {len(partners)}")
+            if snapshot.invoice_count:
+                st.info(f"**Average Invoice:** ${total_revenue / snapshot.invoice_count:,.2f}")
+            st.info(f"**Total Customers:** {snapshot.partner_count}")
 
 if mode in ["Chat", "Both"]:
     st.divider()
@@ -491,16 +635,19 @@ if mode in ["Chat", "Both"]:
 
     if prompt := st.chat_input("Ask about invoices, create invoices, get summaries..."):
         st.session_state.messages.append({"role": "user", "content": prompt})
+        version = get_data_version().value
         with st.chat_message("user"):
             st.markdown(prompt)
 
-        with st.spinner("Working..."):
-            response = generate_response_with_tools(prompt, odoo, openai_client, st.session_state.messages)
-
-        st.session_state.messages.append({"role": "assistant", "content": response})
+        # Tokens are rendered as they arrive; write_stream returns the full text
         with st.chat_message("assistant"):
-            st.markdown(response)
+            response = st.write_stream(
+                generate_response_with_tools(prompt, odoo, openai_client, st.session_state.messages)
+            )
+        st.session_state.messages.append({"role": "assistant", "content": response})
 
-        # Rerun to update dashboard if invoice was created
-        if "create" in prompt.lower() and "invoice" in prompt.lower():
+        # Rebuild the shared snapshot and rerun to update the dashboard
+        # (rendered above) only if a tool changed data
+        if get_data_version().value != version:
+            get_dashboard_refresher().refresh()
             st.rerun()
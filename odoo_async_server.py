@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Async Odoo MCP Server - asyncio-native variant of OdooMCPServer
+
+Exposes the same financial tools as OdooMCPServer as coroutines, so one
+process can serve many chat sessions or audit jobs concurrently without a
+thread per request.
+
+- Production: JSON-RPC over one shared aiohttp connection pool, with an
+  asyncio.Semaphore bounding in-flight Odoo requests
+- Local mirror: with ODOO_LOCAL_MIRROR set, invoices, partners, payments
+  and balances are read from the same synced copy OdooMCPServer uses
+- Sandbox: served from the same simulated data as OdooMCPServer, no
+  network or aiohttp needed
+
+Usage:
+    async with AsyncOdooMCPServer(mode='sandbox') as odoo:
+        invoices = await odoo.get_invoices(state='unpaid')
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from odoo_mcp_server import INVOICE_SORTS, PARTNER_SORTS, OdooMCPServer
+from odoo_metrics import rpc_label
+from odoo_resilience import CircuitOpenError, OdooRPCError, OdooUnavailableError, is_idempotent
+from odoo_stream import loads
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOdooMCPServer:
+    """
+    Asyncio MCP Server for Odoo Community financial operations.
+
+    Query building, result shaping and sandbox data are shared with
+    OdooMCPServer; only the transport is asynchronous.
+    """
+
+    def __init__(self, mode: str = "sandbox", config: Optional[Dict] = None):
+        """
+        Initialize Async Odoo MCP Server.
+
+        Args:
+            mode: 'sandbox' for testing, 'production' for real Odoo
+            config: Odoo connection config (url, db, username, password,
+                    pool_size, connect_timeout, read_timeout, max_concurrency)
+        """
+        self.mode = mode
+        self._server = OdooMCPServer(mode=mode, config=config)
+
+        # Concurrency limit for in-flight Odoo requests across all coroutines
+        self.max_concurrency = int((config or {}).get(
+            'max_concurrency', os.getenv('ODOO_ASYNC_MAX_CONCURRENCY', 20)
+        ))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session = None
+        self._session_lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+
+    @property
+    def uid(self) -> Optional[int]:
+        return self._server.uid
+
+    async def __aenter__(self) -> 'AsyncOdooMCPServer':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self):
+        """Get the shared aiohttp session, creating it on first use."""
+        if self._session is not None:
+            return self._session
+
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("aiohttp library required for async production mode: pip install aiohttp")
+
+        async with self._session_lock:
+            if self._session is None:
+                server = self._server
+                connector = aiohttp.TCPConnector(limit=server.pool_size, keepalive_timeout=60)
+                timeout = aiohttp.ClientTimeout(
+                    sock_connect=server.connect_timeout,
+                    sock_read=server.read_timeout
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=timeout,
+                    headers={'Content-Type': 'application/json', 'Accept-Encoding': 'gzip, deflate'}
+                )
+
+        return self._session
+
+    async def close(self):
+        """Close pooled HTTP connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._server.close()
+
+    async def _json_rpc_call(self, endpoint: str, method: str, params: Any) -> Any:
+        """
+        Make JSON-RPC 2.0 call to Odoo server.
+
+        For production mode only. At most max_concurrency calls are in flight.
+        Retries and the circuit breaker are shared with the sync server.
+        """
+        if self.mode == "sandbox":
+            raise RuntimeError("JSON-RPC calls not available in sandbox mode")
+
+        session = await self._get_session()
+        import aiohttp
+
+        server = self._server
+        payload = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": next(self._request_ids)
+        }
+
+        # aiohttp encodes json= with json.dumps, so this is the body size sent
+        sizes = [len(json.dumps(payload)), 0]
+
+        async def send(remaining: float):
+            timeout = aiohttp.ClientTimeout(
+                total=remaining,
+                sock_connect=min(server.connect_timeout, remaining),
+                sock_read=min(server.read_timeout, remaining)
+            )
+            async with self._semaphore:
+                async with session.post(f"{server.url}{endpoint}", json=payload, timeout=timeout) as response:
+                    body = await response.read()
+                    sizes[1] = len(body)
+                    response.raise_for_status()
+                    return loads(body, server.json_backend)
+
+        label = rpc_label(params)
+        started = time.perf_counter()
+        try:
+            result = await server.resilience.acall(send, is_idempotent(params), (aiohttp.ClientConnectionError,))
+        except Exception:
+            server.metrics.record_rpc([label], (time.perf_counter() - started) * 1000, *sizes, error=True)
+            raise
+        server.metrics.record_rpc([label], (time.perf_counter() - started) * 1000, *sizes)
+
+        if 'error' in result:
+            server.metrics.record_fault(label)
+            raise OdooRPCError(f"Odoo Error: {result['error']}")
+
+        return result.get('result')
+
+    async def _execute_kw(self, model: str, method: str, args: List,
+                          kwargs: Optional[Dict] = None) -> Any:
+        """
+        Call a model method through object.execute_kw, sharing the sync
+        server's read cache. Identical reads already in flight are joined.
+        """
+        server = self._server
+        cache_key = server._cache_key(model, method, args, kwargs)
+        if cache_key is not None:
+            hit, value = server.cache.get(cache_key)
+            if hit:
+                server.metrics.record_cache_hit(f"{model}.{method}")
+                return value
+
+        flight_key = server._flight_key(model, method, args, kwargs)
+        if flight_key is not None:
+            return await server.inflight.ado(flight_key, lambda: self._fetch(model, method, args, kwargs, cache_key))
+        return await self._fetch(model, method, args, kwargs, cache_key)
+
+    async def _fetch(self, model: str, method: str, args: List, kwargs: Optional[Dict],
+                     cache_key: Optional[Tuple]) -> Any:
+        """Send one execute_kw call, falling back to a stale cached read if Odoo is down."""
+        server = self._server
+        params = server._execute_kw_params(model, method, args, kwargs)
+        generation = server._cache_generation(model, cache_key)
+        try:
+            result = await self._json_rpc_call('/jsonrpc', 'call', params)
+        except OdooUnavailableError as e:
+            if method in server.WRITE_METHODS and not isinstance(e, CircuitOpenError):
+                # The write may have been applied before the connection failed
+                server._after_call(model, method, None, None)
+            hit, value = server._stale_read(cache_key, e)
+            if hit:
+                return value
+            raise
+        server._after_call(model, method, cache_key, result, generation)
+        return result
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get read cache hit/miss counters."""
+        return self._server.cache_stats()
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Get request coalescing counters."""
+        return self._server.coalescing_stats()
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Get retry, circuit breaker and stale-read counters."""
+        return self._server.resilience_stats()
+
+    def rpc_stats(self) -> Dict[str, Any]:
+        """Get per model/method call statistics (shared with the sync server)."""
+        return self._server.rpc_stats()
+
+    async def _local(self, read, *args) -> Optional[Dict[str, Any]]:
+        """
+        Serve a read from the sync server's local copy, as OdooMCPServer does.
+
+        read is one of OdooMCPServer's _local_* methods; it may refresh the
+        copy over the sync transport, so it runs in a worker thread.
+
+        Returns:
+            The read result, or None when there is no usable local copy
+        """
+        if self._server.sync is None:
+            return None
+        try:
+            return await asyncio.to_thread(read, *args)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    async def _read(self, query: Tuple[str, str, List, Dict], shape) -> Dict[str, Any]:
+        """Run a search_read query and shape its rows, reporting errors as results."""
+        try:
+            return shape(await self._execute_kw(*query))
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    async def _read_with_count(self, query: Tuple[str, str, List, Dict], shape) -> Dict[str, Any]:
+        """Run a search_read page and its search_count concurrently."""
+        try:
+            rows, total = await asyncio.gather(
+                self._execute_kw(*query),
+                self._execute_kw(*self._server._count_query(query))
+            )
+            return shape(rows, total)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    async def authenticate(self) -> Dict[str, Any]:
+        """
+        Authenticate with Odoo server.
+
+        Returns:
+            Authentication result with user ID
+        """
+        server = self._server
+        if self.mode == "sandbox":
+            return server.authenticate()
+
+        try:
+            server.uid = await self._json_rpc_call(
+                '/jsonrpc',
+                'call',
+                {
+                    'service': 'common',
+                    'method': 'authenticate',
+                    'args': [server.db, server.username, server.password, {}]
+                }
+            )
+
+            if server.uid:
+                return {
+                    'success': True,
+                    'uid': server.uid,
+                    'username': server.username,
+                    'message': 'Authentication successful'
+                }
+            return {
+                'success': False,
+                'message': 'Authentication failed - invalid credentials'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Authentication error: {str(e)}'
+            }
+
+    async def get_invoices(self, state: str = None, limit: int = 10, output: str = 'dicts',
+                           offset: int = 0, order: str = None, search: str = None) -> Dict[str, Any]:
+        """Get customer invoices from Odoo. See OdooMCPServer.get_invoices."""
+        if self.mode == "sandbox":
+            return self._server.get_invoices(state=state, limit=limit, output=output,
+                                             offset=offset, order=order, search=search)
+
+        server = self._server
+        try:
+            odoo_order, _ = server._sort_order(INVOICE_SORTS, order)
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        local = await self._local(server._local_invoices, state, limit, offset, odoo_order, search, output)
+        if local is not None:
+            return local
+        return await self._read_with_count(server._invoices_query(state, limit, offset, odoo_order, search),
+                                           lambda rows, total: server._invoices_response(rows, total, output))
+
+    async def get_partners(self, is_customer: bool = True, limit: int = None, output: str = 'dicts',
+                           offset: int = 0, order: str = None, search: str = None) -> Dict[str, Any]:
+        """Get customers/partners from Odoo. See OdooMCPServer.get_partners."""
+        if self.mode == "sandbox":
+            return self._server.get_partners(is_customer=is_customer, limit=limit, output=output,
+                                             offset=offset, order=order, search=search)
+
+        server = self._server
+        try:
+            odoo_order, _ = server._sort_order(PARTNER_SORTS, order)
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        local = await self._local(server._local_partners, is_customer, limit, offset, odoo_order, search, output)
+        if local is not None:
+            return local
+        query = server._partners_query(is_customer, limit, offset, odoo_order, search)
+        if limit is None and not offset:
+            return await self._read(query, lambda rows: server._partners_response(rows, output=output))
+        return await self._read_with_count(query, lambda rows, total: server._partners_response(rows, total, output))
+
+    async def get_payments(self, days: int = 30, output: str = 'dicts') -> Dict[str, Any]:
+        """Get recent payments from Odoo. See OdooMCPServer.get_payments."""
+        if self.mode == "sandbox":
+            return self._server.get_payments(days=days, output=output)
+
+        server = self._server
+        local = await self._local(server._local_payments, days, output)
+        if local is not None:
+            return local
+        return await self._read(server._payments_query(days),
+                                lambda rows: server._payments_response(rows, days, output))
+
+    async def get_account_balances(self) -> Dict[str, Any]:
+        """Get account balances from Odoo. See OdooMCPServer.get_account_balances."""
+        if self.mode == "sandbox":
+            return self._server.get_account_balances()
+
+        server = self._server
+        local = await self._local(server._local_balances)
+        if local is not None:
+            return local
+        return await self._read(server._balances_query(), server._balances_response)
+
+    async def get_financial_summary(self, period: str = 'month') -> Dict[str, Any]:
+        """
+        Get comprehensive financial summary.
+
+        In production the read_group aggregations and balance read run
+        concurrently; a failed read yields a partial summary rather than an error.
+        """
+        if self.mode == "sandbox":
+            return self._server.get_financial_summary(period=period)
+
+        server = self._server
+        days = {'week': 7, 'month': 30, 'quarter': 90}.get(period, 30)
+        groups = lambda rows: {'success': True, 'groups': rows}
+        invoices, expenses, payments, balances = await asyncio.gather(
+            self._read(server._invoice_groups_query('out_invoice'), groups),
+            self._read(server._invoice_groups_query('in_invoice', days), groups),
+            self._read(server._payment_groups_query(days), groups),
+            self.get_account_balances(),
+        )
+        return server._summary_response(period, {
+            'invoices': invoices,
+            'expenses': expenses,
+            'payments': payments,
+            'balances': balances,
+        })
+
+    async def create_invoice(self, partner_id: int, lines: List[Dict],
+                             invoice_date: str = None) -> Dict[str, Any]:
+        """Create a new customer invoice in Odoo. See OdooMCPServer.create_invoice."""
+        if self.mode == "sandbox":
+            return self._server.create_invoice(partner_id, lines, invoice_date)
+
+        if not invoice_date:
+            invoice_date = datetime.now().strftime('%Y-%m-%d')
+
+        try:
+            invoice_id = await self._execute_kw(
+                'account.move', 'create',
+                [self._server._invoice_vals(partner_id, lines, invoice_date)]
+            )
+
+            return {
+                'success': True,
+                'invoice_id': invoice_id,
+                'message': f'Invoice created with ID {invoice_id}',
+                'mode': 'production'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    async def create_invoices_bulk(self, specs: List[Dict], chunk_size: int = None) -> Dict[str, Any]:
+        """
+        Create many invoices. See OdooMCPServer.create_invoices_bulk.
+
+        A handful of chunked create calls, so it runs on the blocking client
+        in a worker thread rather than duplicating the chunk/retry logic.
+        """
+        return await asyncio.to_thread(self._server.create_invoices_bulk, specs, chunk_size)
+
+    async def upsert_partners(self, records: List[Dict], chunk_size: int = None) -> Dict[str, Any]:
+        """Import customers without duplicates. See OdooMCPServer.upsert_partners."""
+        return await asyncio.to_thread(self._server.upsert_partners, records, chunk_size)
+
+    async def resolve_partner(self, name: str, limit: int = 5) -> Dict[str, Any]:
+        """Find the customer a name refers to. See OdooMCPServer.resolve_partner."""
+        return await asyncio.to_thread(self._server.resolve_partner, name, limit)
+
+    async def create_partner(self, name: str, email: str = None, phone: str = None) -> Dict[str, Any]:
+        """Create a new customer/partner in Odoo. See OdooMCPServer.create_partner."""
+        if self.mode == "sandbox":
+            return self._server.create_partner(name, email, phone)
+
+        try:
+            partner_id = await self._execute_kw(
+                'res.partner', 'create',
+                [{
+                    'name': name,
+                    'email': email,
+                    'phone': phone,
+                    'customer_rank': 1,
+                }]
+            )
+
+            return {
+                'success': True,
+                'partner_id': partner_id,
+                'partner': {'id': partner_id, 'name': name, 'email': email, 'phone': phone},
+                'message': f'Customer {name} created with ID {partner_id}',
+                'mode': 'production'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def get_tools_definition(self) -> List[Dict]:
+        """Get MCP tools definition (same tools as OdooMCPServer)."""
+        return self._server.get_tools_definition()
+
+    async def execute_tool(self, tool_name: str, params: Dict) -> Dict[str, Any]:
+        """
+        Execute an MCP tool by name.
+
+        Args:
+            tool_name: Name of the tool to execute
+            params: Tool parameters
+
+        Returns:
+            Tool execution result
+        """
+        tool_map = {
+            'odoo_get_invoices': lambda p: self.get_invoices(
+                state=p.get('state'),
+                limit=p.get('limit', 10),
+                offset=p.get('offset', 0),
+                order=p.get('order'),
+                search=p.get('search')
+            ),
+            'odoo_create_invoice': lambda p: self.create_invoice(
+                partner_id=p['partner_id'],
+                lines=p['lines'],
+                invoice_date=p.get('invoice_date')
+            ),
+            'odoo_create_invoices_bulk': lambda p: self.create_invoices_bulk(p['invoices']),
+            'odoo_get_payments': lambda p: self.get_payments(
+                days=p.get('days', 30)
+            ),
+            'odoo_get_balances': lambda p: self.get_account_balances(),
+            'odoo_get_summary': lambda p: self.get_financial_summary(
+                period=p.get('period', 'month')
+            ),
+            'odoo_get_partners': lambda p: self.get_partners(
+                is_customer=p.get('is_customer', True),
+                limit=p.get('limit'),
+                offset=p.get('offset', 0),
+                order=p.get('order'),
+                search=p.get('search')
+            ),
+            'odoo_resolve_partner': lambda p: self.resolve_partner(
+                name=p['name'],
+                limit=p.get('limit', 5)
+            ),
+            'odoo_upsert_partners': lambda p: self.upsert_partners(p['partners']),
+            'odoo_batch': self._execute_batch_tool
+        }
+
+        if tool_name not in tool_map:
+            return {
+                'success': False,
+                'error': f'Unknown tool: {tool_name}'
+            }
+
+        started = time.perf_counter()
+        result = None
+        try:
+            result = await tool_map[tool_name](params)
+            return result
+        finally:
+            self._server.metrics.record_tool(tool_name, (time.perf_counter() - started) * 1000,
+                                             error=not (isinstance(result, dict) and result.get('success')))
+
+    async def _execute_batch_tool(self, params: Dict) -> Dict[str, Any]:
+        calls = [(c['tool'], c.get('params', {})) for c in params.get('calls', [])]
+        return {
+            'success': True,
+            'results': await self.execute_tools(calls)
+        }
+
+    async def execute_tools(self, calls: List[Tuple[str, Dict]]) -> List[Dict[str, Any]]:
+        """
+        Execute several MCP tools concurrently.
+
+        Args:
+            calls: List of (tool_name, params) pairs
+
+        Returns:
+            Tool execution results in the same order as calls
+        """
+        async def run(name, params):
+            try:
+                return await self.execute_tool(name, params)
+            except Exception as e:
+                return {'success': False, 'error': str(e)}
+
+        return list(await asyncio.gather(*(run(name, params) for name, params in calls)))
+
+
+async def _demo():
+    """Run a few tools concurrently against the sandbox."""
+    async with AsyncOdooMCPServer(mode='sandbox') as odoo:
+        await odoo.authenticate()
+        invoices, summary, partners = await odoo.execute_tools([
+            ('odoo_get_invoices', {'state': 'unpaid'}),
+            ('odoo_get_summary', {'period': 'month'}),
+            ('odoo_get_partners', {}),
+        ])
+
+    print("\n⏳ Unpaid Invoices:")
+    for inv in invoices['invoices']:
+        print(f"  • {inv['name']} | {inv['partner_name']} | Outstanding: ${inv['amount_residual']:,.2f}")
+    print(f"\n📊 Net Position: ${summary['balances']['net_position']:,.2f}")
+    print(f"👥 Customers: {partners['total_count']}")
+
+
+if __name__ == '__main__':
+    asyncio.run(_demo())
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Odoo MCP Server Benchmarks
+
+Measures the production JSON-RPC path of OdooMCPServer against the local
+fake Odoo server (odoo_fake_server), so results can be reproduced offline.
+Set ODOO_SANDBOX_SNAPSHOT to benchmark against a generated dataset.
+A run stops with exit status 1 as soon as a measured call fails.
+
+Usage:
+    python odoo_benchmark.py pool                # Pooled session vs bare requests.post
+    python odoo_benchmark.py pool --calls 500    # More iterations
+    python odoo_benchmark.py batch               # Sequential vs batched execute_kw
+    python odoo_benchmark.py fanout              # Sequential vs concurrent reads
+    python odoo_benchmark.py async               # Many sessions: sync loop vs AsyncOdooMCPServer
+    python odoo_benchmark.py cache               # Dashboard reads with and without the read cache
+    python odoo_benchmark.py stream              # Full-body vs streamed search_read decoding (peak memory)
+    python odoo_benchmark.py dashboard           # Dashboard KPI refresh and table page on a 100k ledger
+"""
+
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+from odoo_fake_server import start_fake_odoo
+from odoo_mcp_server import OdooMCPServer
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+class BenchmarkError(RuntimeError):
+    """A benchmarked call failed, so its timing would be meaningless."""
+
+
+def _check(result: Any) -> Any:
+    """
+    Raise BenchmarkError if result, or any result in a batch, is a failed response.
+
+    Server methods report errors as {'success': False, ...} instead of
+    raising, and a failing call is usually fast, so it must not be timed.
+    """
+    if isinstance(result, dict) and result.get('success') is False:
+        raise BenchmarkError(result.get('error') or result.get('message') or 'call failed')
+    if isinstance(result, (list, tuple)):
+        for item in result:
+            _check(item)
+    return result
+
+
+def _time_calls(fn: Callable[[], Any], calls: int) -> List[float]:
+    """Run fn `calls` times and return per-call latencies in milliseconds."""
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        _check(fn())
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: List[float]) -> Dict[str, float]:
+    """Print and return latency statistics."""
+    stats = {
+        'mean_ms': statistics.mean(latencies),
+        'p50_ms': statistics.median(latencies),
+        'p95_ms': sorted(latencies)[int(len(latencies) * 0.95) - 1],
+    }
+    print(f"  {label:<28} mean {stats['mean_ms']:7.3f} ms | "
+          f"p50 {stats['p50_ms']:7.3f} ms | p95 {stats['p95_ms']:7.3f} ms")
+    return stats
+
+
+def _production_server(url: str, **config) -> OdooMCPServer:
+    """Create an authenticated production-mode server pointed at url."""
+    server = OdooMCPServer(mode='production', config={'url': url, 'password': 'bench', **config})
+    _check(server.authenticate())
+    return server
+
+
+@contextmanager
+def _fake_odoo_process(sandbox) -> Iterator[str]:
+    """
+    Serve sandbox tables from a fake Odoo in a child process and yield its URL.
+
+    Keeps the server's allocations out of this process, for memory benchmarks.
+    """
+    from odoo_sandbox import save_snapshot
+
+    with tempfile.TemporaryDirectory() as snapshot, socket.socket() as probe:
+        save_snapshot(sandbox, snapshot)
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        process = subprocess.Popen(
+            [sys.executable, str(Path(__file__).with_name('odoo_fake_server.py')),
+             '--port', str(port), '--snapshot', snapshot],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            deadline = time.monotonic() + 60
+            while True:
+                try:
+                    socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                    break
+                except OSError:
+                    if process.poll() is not None or time.monotonic() > deadline:
+                        raise RuntimeError("Fake Odoo process did not start")
+                    time.sleep(0.1)
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            process.terminate()
+            process.wait()
+
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+def bench_pool(calls: int = 200) -> Dict[str, Dict[str, float]]:
+    """Compare a bare requests.post per call with the pooled session."""
+    import requests
+
+    httpd = start_fake_odoo()
+    url = httpd.url
+    server = _production_server(url, cache=False)
+
+    payload_params = {
+        'service': 'object',
+        'method': 'execute_kw',
+        'args': [server.db, server.uid, server.password, 'account.move', 'search_read',
+                 [[('move_type', '=', 'out_invoice')]], {'limit': 10}]
+    }
+
+    def bare_call():
+        # Baseline: what _json_rpc_call did before pooling
+        response = requests.post(
+            f"{url}/jsonrpc",
+            json={'jsonrpc': '2.0', 'method': 'call', 'params': payload_params, 'id': 1},
+            headers={'Content-Type': 'application/json', 'Connection': 'close'}
+        )
+        response.raise_for_status()
+        response.json()
+
+    def pooled_call():
+        # Same execute_kw as the baseline, so only the transport differs
+        server._json_rpc_call('/jsonrpc', 'call', payload_params)
+
+    print(f"\n🔌 Connection pooling ({calls} calls, fake Odoo at {url})")
+    try:
+        results = {
+            'bare': _report('bare requests.post', _time_calls(bare_call, calls)),
+            'pooled': _report('pooled keep-alive session', _time_calls(pooled_call, calls)),
+        }
+    finally:
+        server.close()
+        httpd.shutdown()
+
+    gain = results['bare']['mean_ms'] - results['pooled']['mean_ms']
+    print(f"\n  Latency gain per call: {gain:.3f} ms "
+          f"({results['bare']['mean_ms'] / results['pooled']['mean_ms']:.1f}x)")
+    return results
+
+
+def bench_batch(calls: int = 200, latency_ms: float = 5) -> Dict[str, Dict[str, float]]:
+    """Compare three sequential execute_kw calls with one batched round trip."""
+    httpd = start_fake_odoo(latency_ms=latency_ms)
+    url = httpd.url
+    server = _production_server(url, cache=False)
+
+    def sequential():
+        return (server.get_invoices(limit=100),
+                server.get_payments(days=30),
+                server.get_account_balances())
+
+    def batched():
+        return server.execute_tools([
+            ('odoo_get_invoices', {'limit': 100}),
+            ('odoo_get_payments', {'days': 30}),
+            ('odoo_get_balances', {}),
+        ])
+
+    print(f"\n📦 JSON-RPC batching ({calls} x 3 reads, {latency_ms} ms simulated round trip)")
+    try:
+        results = {
+            'sequential': _report('3 sequential calls', _time_calls(sequential, calls)),
+            'batched': _report('1 batched call', _time_calls(batched, calls)),
+        }
+    finally:
+        server.close()
+        httpd.shutdown()
+
+    print(f"\n  Speedup: {results['sequential']['mean_ms'] / results['batched']['mean_ms']:.1f}x")
+    return results
+
+
+def bench_fanout(calls: int = 50, latency_ms: float = 20) -> Dict[str, Dict[str, float]]:
+    """Compare the weekly audit's four reads run sequentially and via fan_out()."""
+    httpd = start_fake_odoo(latency_ms=latency_ms)
+    url = httpd.url
+    server = _production_server(url, cache=False)
+
+    tools = [
+        ('odoo_get_summary', {'period': 'week'}),
+        ('odoo_get_balances', {}),
+        ('odoo_get_payments', {'days': 7}),
+        ('odoo_get_invoices', {'state': 'unpaid'}),
+    ]
+
+    def sequential():
+        return [server.execute_tool(name, params) for name, params in tools]
+
+    def concurrent():
+        return server.execute_tools(tools, parallel=True)
+
+    print(f"\n🧵 Concurrent fan-out ({calls} audits, {latency_ms} ms simulated round trip, "
+          f"max_concurrency={server.max_concurrency})")
+    try:
+        results = {
+            'sequential': _report('sequential reads', _time_calls(sequential, calls)),
+            'fan_out': _report('fan-out reads', _time_calls(concurrent, calls)),
+        }
+    finally:
+        server.close()
+        httpd.shutdown()
+
+    print(f"\n  Speedup: {results['sequential']['mean_ms'] / results['fan_out']['mean_ms']:.1f}x")
+    return results
+
+
+def bench_async(calls: int = 200, latency_ms: float = 20) -> Dict[str, float]:
+    """Serve `calls` concurrent get_invoices requests from one process."""
+    import asyncio
+    from odoo_async_server import AsyncOdooMCPServer
+
+    httpd = start_fake_odoo(latency_ms=latency_ms)
+    url = httpd.url
+    # Coalescing off: identical concurrent reads would otherwise share one
+    # request and this would measure single-flight rather than asyncio
+    config = {'url': url, 'password': 'bench', 'cache': False, 'coalesce': False}
+    server = _production_server(url, cache=False, coalesce=False)
+
+    async def serve_all():
+        async with AsyncOdooMCPServer(mode='production', config=config) as odoo:
+            _check(await odoo.authenticate())
+            start = time.perf_counter()
+            _check(await asyncio.gather(*(odoo.get_invoices(limit=10) for _ in range(calls))))
+            return (time.perf_counter() - start) * 1000
+
+    print(f"\n⚡ Async client ({calls} concurrent requests, {latency_ms} ms simulated round trip)")
+    try:
+        start = time.perf_counter()
+        for _ in range(calls):
+            _check(server.get_invoices(limit=10))
+        results = {
+            'sync_ms': (time.perf_counter() - start) * 1000,
+            'async_ms': asyncio.run(serve_all()),
+        }
+    finally:
+        server.close()
+        httpd.shutdown()
+
+    print(f"  {'sync, one at a time':<28} {results['sync_ms']:9.1f} ms total")
+    print(f"  {'AsyncOdooMCPServer':<28} {results['async_ms']:9.1f} ms total")
+    print(f"\n  Speedup: {results['sync_ms'] / results['async_ms']:.1f}x")
+    return results
+
+
+def bench_cache(calls: int = 200, latency_ms: float = 5) -> Dict[str, Dict[str, float]]:
+    """Measure dashboard reruns (invoices + partners) with the cache off and on."""
+    httpd = start_fake_odoo(latency_ms=latency_ms)
+    url = httpd.url
+    uncached = _production_server(url, cache=False)
+    cached = _production_server(url)
+
+    def rerun(server):
+        return lambda: (server.get_invoices(limit=50), server.get_partners())
+
+    print(f"\n🗄️  Read cache ({calls} dashboard reruns, {latency_ms} ms simulated round trip)")
+    try:
+        results = {
+            'uncached': _report('cache disabled', _time_calls(rerun(uncached), calls)),
+            'cached': _report('read-through cache', _time_calls(rerun(cached), calls)),
+        }
+        stats = cached.cache_stats()
+    finally:
+        uncached.close()
+        cached.close()
+        httpd.shutdown()
+
+    print(f"\n  Hits: {stats['hits']} | Misses: {stats['misses']} | Hit rate: {stats['hit_rate']}%")
+    return results
+
+
+def bench_stream(calls: int = 3, invoices: int = 50000) -> Dict[str, Dict[str, float]]:
+    """Compare decoding one large search_read whole with streaming it record by record."""
+    from odoo_dataset import generate_dataset
+
+    print(f"\n🌊 Streaming JSON decoding ({invoices:,} invoices in one search_read, {calls} runs)")
+    with _fake_odoo_process(generate_dataset(partners=2000, invoices=invoices, expenses=0)) as url:
+        server = _production_server(url, cache=False)
+        try:
+            results = _measure_stream(server, calls)
+        finally:
+            server.close()
+
+    best = min((r for key, r in results.items() if key.startswith('stream')), key=lambda r: r['peak_mb'])
+    print(f"\n  Peak memory: {results['full']['peak_mb'] / best['peak_mb']:.1f}x lower when streamed")
+    return results
+
+
+def _measure_stream(server: OdooMCPServer, calls: int) -> Dict[str, Dict[str, float]]:
+    """Time and trace peak memory of a full-body vs streamed read of every invoice."""
+    model, _, args, kwargs = server._invoices_query()
+
+    def full():
+        rows = server._execute_kw(model, 'search_read', [args[0]], {'fields': kwargs['fields'], 'order': 'id asc'})
+        return sum(row['amount_total'] for row in rows)
+
+    def streamed():
+        return sum(row['amount_total'] for row in server.iter_invoices(stream=True))
+
+    def measure(label: str, fn: Callable[[], float]) -> Dict[str, float]:
+        latencies = _time_calls(fn, calls)
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = {'mean_ms': statistics.mean(latencies), 'peak_mb': peak / 1024 / 1024}
+        print(f"  {label:<28} mean {stats['mean_ms']:9.1f} ms | peak {stats['peak_mb']:7.1f} MB")
+        return stats
+
+    results = {}
+    for key, label, backend, fn in (
+            ('full', 'whole body, json', 'json', full),
+            ('full_orjson', 'whole body, orjson', 'orjson', full),
+            ('stream_json', 'streamed, stdlib scanner', 'json', streamed),
+            ('stream_ijson', 'streamed, ijson', 'ijson', streamed)):
+        server.json_backend = backend
+        try:
+            results[key] = measure(label, fn)
+        except ImportError as e:
+            print(f"  {label:<28} skipped ({e})")
+    return results
+
+
+def bench_dashboard(calls: int = 20, invoices: int = 100000) -> Dict[str, Dict[str, float]]:
+    """Time what a dashboard render waits on for a large ledger: the KPI snapshot and one table page."""
+    from odoo_dashboard import DashboardRefresher, invoice_frame
+    from odoo_dataset import generate_dataset
+
+    print(f"\n📊 Dashboard data ({invoices:,} invoices, {calls} runs)")
+    with _fake_odoo_process(generate_dataset(partners=2000, invoices=invoices, expenses=0)) as url:
+        server = _production_server(url, cache=False)
+        refresher = DashboardRefresher(server)
+
+        def refresh():
+            snapshot = refresher.refresh()
+            if snapshot.error:
+                raise BenchmarkError(snapshot.error)
+            return snapshot
+
+        def page():
+            result = _check(server.get_invoices(output='columns', limit=50, order='amount_total desc'))
+            return invoice_frame(result['invoices'])
+
+        try:
+            results = {
+                'refresh': _report('KPI snapshot (read_group)', _time_calls(refresh, calls)),
+                'page': _report('invoice page (50 rows)', _time_calls(page, calls)),
+            }
+        finally:
+            server.close()
+
+    print(f"\n  Ledger rows fetched per render: 0 for the KPIs, 50 for the table "
+          f"({refresher.snapshot.invoice_count:,} invoices counted)")
+    return results
+
+
+BENCHMARKS = {
+    'pool': bench_pool,
+    'batch': bench_batch,
+    'fanout': bench_fanout,
+    'async': bench_async,
+    'cache': bench_cache,
+    'stream': bench_stream,
+    'dashboard': bench_dashboard,
+}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Odoo MCP Server benchmarks')
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS), help='Benchmark to run')
+    parser.add_argument('--calls', type=int, help='Iterations per measurement (default: 200, stream: 3, dashboard: 20)')
+
+    args = parser.parse_args()
+    try:
+        BENCHMARKS[args.benchmark](**({'calls': args.calls} if args.calls else {}))
+    except BenchmarkError as e:
+        print(f"\n❌ Benchmark aborted, a measured call failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Odoo Read Cache - TTL + LRU cache for search_read results
+
+Used by OdooMCPServer to avoid re-fetching unchanged Odoo data on every
+dashboard rerun:
+- Keyed by (model, domain, fields, limit, offset)
+- Per-model TTL, size-bounded LRU eviction
+- Whole-model invalidation when a write touches that model, with a
+  per-model generation so a read that was in flight during the write
+  cannot store its pre-write result afterwards
+- Expired entries kept (until evicted) as a fallback while Odoo is down
+- Hit/miss/eviction counters for tuning
+
+Also home to SingleFlight, which collapses identical concurrent reads
+into one in-flight Odoo request.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Seconds a cached search_read stays fresh, per model
+DEFAULT_MODEL_TTLS = {
+    'account.move': 30,
+    'account.payment': 30,
+    'account.account': 60,
+    'res.partner': 300,
+}
+
+
+class OdooReadCache:
+    """
+    Thread-safe read-through cache for Odoo search_read results.
+
+    Entries are stored per model so a write to one model drops only that
+    model's entries. Cached lists are returned as shallow copies; the
+    record dicts themselves are shared and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 30,
+                 model_ttls: Optional[Dict[str, float]] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached results before LRU eviction
+            default_ttl: TTL in seconds for models without an explicit TTL
+            model_ttls: Per-model TTL overrides in seconds (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.model_ttls = {**DEFAULT_MODEL_TTLS, **(model_ttls or {})}
+
+        self._entries: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(model: str, domain: List, fields: Optional[List] = None,
+                 limit: Optional[int] = None, offset: int = 0, order: Optional[str] = None) -> Tuple:
+        """Build a hashable cache key from search_read arguments."""
+        return (model, json.dumps(domain, default=str), json.dumps(fields, default=str), limit, offset or 0, order)
+
+    def ttl_for(self, model: str) -> float:
+        return self.model_ttls.get(model, self.default_ttl)
+
+    def generation(self, model: str) -> int:
+        """Number of times a model has been invalidated; read it before fetching, pass it to put()."""
+        with self._lock:
+            return self._generations.get(model, 0)
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (hit, value) - value is None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, list(value) if isinstance(value, list) else value
+            self.misses += 1
+            return False, None
+
+    def get_stale(self, key: Tuple) -> Tuple[bool, Any]:
+        """
+        Look up a result whether or not it has expired.
+
+        Only for serving the last known value while Odoo is unreachable;
+        entries dropped by invalidate() after a write are never returned.
+
+        Returns:
+            (hit, value) - value is None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            value = entry[1]
+            return True, list(value) if isinstance(value, list) else value
+
+    def put(self, key: Tuple, value: Any, generation: Optional[int] = None):
+        """
+        Store a result, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key (model first)
+            value: Result to store
+            generation: The model's generation() when the fetch started; the
+                        result is dropped if the model was invalidated since
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key[0], 0):
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, model: str) -> int:
+        """Drop every cached result for a model. Returns number of entries removed."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == model]
+            for key in stale:
+                del self._entries[key]
+            self._generations[model] = self._generations.get(model, 0) + 1
+            self.invalidations += 1
+            return len(stale)
+
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters for tuning."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'model_ttls': dict(self.model_ttls),
+            }
+
+
+class _Flight:
+    """One in-flight call and the outcome its waiters share."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Request coalescing for identical concurrent reads.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait and share its result (or exception) instead of sending
+    the same request again. Nothing is kept once the call completes -
+    reuse over time is the read cache's job. Shared list results are
+    returned as shallow copies; the records themselves are read-only.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._tasks: Dict[Hashable, 'asyncio.Future'] = {}
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> Tuple:
+        """Build a hashable key from call arguments (domains, kwargs, ...)."""
+        return tuple(json.dumps(part, default=str, sort_keys=True) for part in parts)
+
+    @staticmethod
+    def _share(value: Any) -> Any:
+        return list(value) if isinstance(value, list) else value
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the identical call already in flight on another thread."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._share(flight.result)
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine variant of do(): coroutines on one event loop share a single task."""
+        with self._lock:
+            task = self._tasks.get(key)
+            leader = task is None
+            if leader:
+                task = self._tasks[key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda _: self._tasks.pop(key, None))
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        # Shielded so one cancelled caller does not cancel the call for the others
+        result = await asyncio.shield(task)
+        return result if leader else self._share(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing counters: calls sent and calls saved."""
+        with self._lock:
+            requests = self.calls + self.coalesced
+            return {
+                'calls': self.calls,
+                'calls_saved': self.coalesced,
+                'saved_rate': round(self.coalesced / requests * 100, 1) if requests else 0,
+                'in_flight': len(self._flights) + len(self._tasks),
+            }
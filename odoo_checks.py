@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Odoo MCP Server Consistency Checks
+
+Runs the production read paths of OdooMCPServer against the local fake
+Odoo server (odoo_fake_server) and checks that every way of serving a
+read gives the same answer, so regressions show up offline.
+
+Usage:
+    python odoo_checks.py sorts                  # Every sort key: RPC vs memory vs sqlite mirror
+    python odoo_checks.py sorts --invoices 5000  # Larger generated dataset
+
+Each check prints one line per case and exits with status 1 on any mismatch.
+"""
+
+import os
+import sys
+import tempfile
+from typing import Callable, Dict, List, Tuple
+
+from odoo_fake_server import start_fake_odoo
+from odoo_mcp_server import INVOICE_SORTS, PARTNER_SORTS, OdooMCPServer
+
+# (offset, limit) pages compared per sort: the whole table and one inner page
+PAGES = ((0, None), (7, 20))
+
+
+def _servers(url: str, mirror_dir: str) -> Dict[str, OdooMCPServer]:
+    """Authenticated production servers reading over RPC and from each local mirror."""
+    config = {'url': url, 'password': 'check', 'cache': False}
+    servers = {
+        'rpc': OdooMCPServer(mode='production', config=config),
+        'memory': OdooMCPServer(mode='production', config={**config, 'local_mirror': 'memory'}),
+        'sqlite': OdooMCPServer(mode='production', config={
+            **config, 'local_mirror': 'sqlite', 'mirror_path': os.path.join(mirror_dir, 'mirror.db')
+        }),
+    }
+    for name, server in servers.items():
+        auth = server.authenticate()
+        if not auth.get('success'):
+            raise RuntimeError(f"{name}: {auth.get('message')}")
+    return servers
+
+
+def check_sorts(invoices: int = 1000) -> int:
+    """
+    Compare every INVOICE_SORTS/PARTNER_SORTS order across RPC and both mirrors.
+
+    Sorted column values are compared rather than ids, as rows that tie on
+    the sort column may come back in any order.
+
+    Returns:
+        Number of failed cases
+    """
+    from odoo_dataset import generate_dataset
+
+    tools: List[Tuple[str, Dict[str, Tuple[str, str]], str, Callable]] = [
+        ('invoices', INVOICE_SORTS, 'invoices',
+         lambda server, **kw: server.get_invoices(output='records', **kw)),
+        ('partners', PARTNER_SORTS, 'partners',
+         lambda server, **kw: server.get_partners(output='records', **kw)),
+    ]
+
+    httpd = start_fake_odoo(sandbox=generate_dataset(partners=max(invoices // 10, 10), invoices=invoices, expenses=0))
+    print(f"\n🔀 Sort consistency ({invoices:,} invoices, fake Odoo at {httpd.url})")
+    failures = 0
+    with tempfile.TemporaryDirectory() as mirror_dir:
+        servers = _servers(httpd.url, mirror_dir)
+        try:
+            for label, sorts, key, read in tools:
+                for sort, (_, column) in sorts.items():
+                    for direction in ('asc', 'desc'):
+                        for offset, limit in PAGES:
+                            order = f"{sort} {direction}"
+                            results = {name: read(server, order=order, offset=offset, limit=limit or invoices)
+                                       for name, server in servers.items()}
+                            errors = {name: r['error'] for name, r in results.items() if not r.get('success')}
+                            values = {name: [getattr(row, column) for row in r[key]]
+                                      for name, r in results.items() if r.get('success')}
+                            sources = '/'.join(r.get('source', 'rpc') for r in results.values() if r.get('success'))
+                            ok = not errors and all(v == values['rpc'] for v in values.values())
+                            failures += not ok
+                            print(f"  {'✅' if ok else '❌'} {label:<9} {order:<22} "
+                                  f"offset {offset:<2} ({sources})")
+                            for name, error in errors.items():
+                                print(f"      {name}: {error}")
+                            if not errors and not ok:
+                                for name, v in values.items():
+                                    print(f"      {name}: {v[:8]}")
+        finally:
+            for server in servers.values():
+                server.close()
+            httpd.shutdown()
+
+    print(f"\n  {failures} failed case(s)")
+    return failures
+
+
+CHECKS = {
+    'sorts': check_sorts,
+}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Odoo MCP Server consistency checks')
+    parser.add_argument('check', choices=sorted(CHECKS), help='Check to run')
+    parser.add_argument('--invoices', type=int, help='Invoices in the generated dataset (default: 1000)')
+
+    args = parser.parse_args()
+    failures = CHECKS[args.check](**({'invoices': args.invoices} if args.invoices else {}))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Odoo Dashboard - background-refreshed snapshot for the Streamlit dashboard
+
+One worker thread per process reads invoice totals and the customer count
+from Odoo every few seconds and publishes an immutable DashboardSnapshot
+with the KPIs already computed, so:
+- Page renders never wait on Odoo (they read the latest snapshot)
+- Many concurrent viewers cost one fetch per interval, not one per rerun
+- Sessions swap in a whole snapshot at once, never a half-updated one
+- The KPIs cover the whole ledger: Odoo aggregates it with read_group,
+  so only a handful of group rows are fetched however large it grows
+
+The Invoices and Customers tables are PagedTables instead: each page is
+fetched sorted and filtered by Odoo (or the sandbox/local copy), cached,
+and the next page prefetched, so table cost does not grow with the ledger.
+
+Used by frontend_app.py (DASHBOARD_REFRESH_INTERVAL, DASHBOARD_PAGE_SIZE).
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from odoo_cache import OdooReadCache, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Table columns: source field -> dashboard heading
+INVOICE_COLUMNS = {
+    'name': 'Invoice',
+    'partner_name': 'Customer',
+    'amount_total': 'Amount',
+    'due_date': 'Due Date',
+    'state': 'Status',
+    'amount_residual': 'Balance',
+}
+PARTNER_COLUMNS = {'name': 'Name', 'email': 'Email', 'phone': 'Phone'}
+
+
+def _pandas():
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("pandas library required for the dashboard: pip install pandas")
+    return pd
+
+
+def invoice_frame(columns: Dict[str, List]) -> Any:
+    """
+    Invoice table frame (INVOICE_COLUMNS headings) from get_invoices(output='columns').
+
+    Low-cardinality text is categorical: upper-casing and comparisons
+    touch each distinct value once, and the grid ships each string once.
+    Amounts stay floats for the grid to format.
+    """
+    pd = _pandas()
+    dtypes = {'amount_total': float, 'amount_residual': float, 'partner_name': 'category', 'state': 'category'}
+    frame = pd.DataFrame({
+        heading: pd.Series(columns.get(field, []), dtype=dtypes.get(field, object))
+        for field, heading in INVOICE_COLUMNS.items()
+    })
+    status = frame['Status'].cat
+    frame['Status'] = status.rename_categories([c.upper() for c in status.categories])
+    customer = frame['Customer'].cat
+    if 'Unknown' not in customer.categories:
+        frame['Customer'] = customer.add_categories('Unknown')
+    return frame.fillna({'Invoice': 'N/A', 'Customer': 'Unknown', 'Due Date': 'N/A'})
+
+
+def partner_frame(columns: Dict[str, List]) -> Any:
+    """Customer table frame (PARTNER_COLUMNS headings) from get_partners(output='columns')."""
+    pd = _pandas()
+    frame = pd.DataFrame({
+        heading: pd.Series(columns.get(field, []), dtype=object) for field, heading in PARTNER_COLUMNS.items()
+    })
+    return frame.fillna({'Name': 'Unknown', 'Email': 'N/A', 'Phone': 'N/A'})
+
+
+class DashboardSnapshot(NamedTuple):
+    partner_count: int
+    invoice_count: int
+    total_revenue: float
+    pending_count: int
+    pending_amount: float
+    paid_count: int
+    status_chart: Dict[str, int]
+    refreshed_at: Optional[str]
+    error: Optional[str] = None
+
+
+def build_snapshot(totals: Dict[str, Any], partner_count: int,
+                   error: Optional[str] = None) -> DashboardSnapshot:
+    """
+    Compute the dashboard KPIs.
+
+    Args:
+        totals: Whole-ledger invoice totals (OdooMCPServer.get_invoice_totals())
+        partner_count: Number of customers
+        error: Refresh error to show alongside the data
+
+    Returns:
+        DashboardSnapshot
+    """
+    revenue = totals.get('revenue', {})
+    counts = totals.get('invoices', {})
+    pending_count = counts.get('pending_count', 0)
+    paid_count = counts.get('paid_count', 0)
+
+    return DashboardSnapshot(
+        partner_count=partner_count,
+        invoice_count=counts.get('total_count', 0),
+        total_revenue=float(revenue.get('total_invoiced', 0)),
+        pending_count=pending_count,
+        pending_amount=float(revenue.get('pending', 0)),
+        paid_count=paid_count,
+        status_chart={"Paid": paid_count, "Pending": pending_count},
+        refreshed_at=datetime.now().isoformat(),
+        error=error,
+    )
+
+
+def empty_snapshot() -> DashboardSnapshot:
+    """Snapshot shown before the first successful refresh."""
+    snapshot = build_snapshot({}, 0)
+    return snapshot._replace(refreshed_at=None)
+
+
+class DashboardRefresher:
+    """
+    Keeps a DashboardSnapshot fresh from a daemon thread.
+
+    Usage:
+        refresher = DashboardRefresher(odoo, interval=30)
+        refresher.start()
+        snapshot = refresher.snapshot   # never blocks
+        refresher.refresh()             # after a write, rebuild right away
+    """
+
+    def __init__(self, odoo, interval: float = 30.0):
+        """
+        Initialize refresher.
+
+        Args:
+            odoo: OdooMCPServer to read from
+            interval: Seconds between refreshes
+        """
+        self.odoo = odoo
+        self.interval = interval
+
+        # Replaced as a whole, so readers always see one consistent snapshot
+        self.snapshot: DashboardSnapshot = empty_snapshot()
+        self.refreshes = 0
+        self.last_duration = 0.0
+
+        self._refresh_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> DashboardSnapshot:
+        """Fetch from Odoo and publish a new snapshot (the previous data is kept on failure)."""
+        with self._refresh_lock:
+            started = time.perf_counter()
+            totals = self.odoo.get_invoice_totals()
+            # Only the count is shown; the Customers table pages through partners itself
+            partners = self.odoo.get_partners(limit=1, output='columns')
+
+            errors = [r.get('error', 'Unknown error') for r in (totals, partners) if not r.get('success')]
+            if errors:
+                logger.warning(f"Dashboard refresh failed: {'; '.join(errors)}")
+                self.snapshot = self.snapshot._replace(error='; '.join(errors))
+            else:
+                self.snapshot = build_snapshot(totals, partners.get('total_count', 0))
+
+            self.refreshes += 1
+            self.last_duration = time.perf_counter() - started
+            return self.snapshot
+
+    def request_refresh(self):
+        """Wake the worker to refresh now instead of at the next interval."""
+        self._wake.set()
+
+    def start(self):
+        """Build the first snapshot, then keep refreshing in the background."""
+        if self._thread is not None:
+            return
+        self._safe_refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='dashboard-refresher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if not self._stop.is_set():
+                self._safe_refresh()
+
+    def _safe_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.warning(f"Dashboard refresh failed: {e}")
+            self.snapshot = self.snapshot._replace(error=str(e))
+
+
+class PagedTable:
+    """
+    Server-side paged, sorted and filtered table with cached pages.
+
+    Only the requested page is fetched (get_invoices/get_partners with
+    offset, limit, order and search). Pages are kept in an OdooReadCache
+    (TTL + LRU), identical concurrent fetches share one request, and after
+    a page is served the next one is fetched in the background so paging
+    forward does not wait on Odoo.
+
+    Usage:
+        table = PagedTable('invoices', lambda **kw: odoo.get_invoices(output='columns', **kw), invoice_frame)
+        frame, total = table.page(0, order='amount_total desc', search='acme')
+    """
+
+    def __init__(self, name: str, fetch: Callable[..., Dict[str, Any]], to_frame: Callable[[Dict], Any],
+                 page_size: int = 50, ttl: float = 30, max_pages: int = 64):
+        """
+        Initialize paged table.
+
+        Args:
+            name: Result key holding the rows ('invoices' or 'partners')
+            fetch: Read method taking offset, limit, order and search keywords
+                   and returning columns (output='columns')
+            to_frame: Builds the display frame from one page of columns
+            page_size: Rows per page
+            ttl: Seconds a cached page stays fresh
+            max_pages: Cached pages before LRU eviction
+        """
+        self.name = name
+        self.fetch = fetch
+        self.to_frame = to_frame
+        self.page_size = page_size
+
+        self.cache = OdooReadCache(max_entries=max_pages, model_ttls={name: ttl})
+        self._inflight = SingleFlight()
+        self._prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'{name}-prefetch')
+
+    def _key(self, number: int, order: Optional[str], search: Optional[str]) -> Tuple:
+        return (self.name, number, order, (search or '').strip().lower())
+
+    def _load(self, number: int, order: Optional[str], search: Optional[str]) -> Tuple[Any, int]:
+        key = self._key(number, order, search)
+        hit, value = self.cache.get(key)
+        if hit:
+            return value
+
+        def fetch_page() -> Tuple[Any, int]:
+            generation = self.cache.generation(self.name)
+            result = self.fetch(offset=number * self.page_size, limit=self.page_size,
+                                order=order, search=(search or '').strip() or None)
+            if not result.get('success'):
+                raise Exception(result.get('error', 'Unknown error'))
+            value = (self.to_frame(result[self.name]), result.get('total_count', 0))
+            self.cache.put(key, value, generation)  # Dropped if invalidated meanwhile
+            return value
+
+        return self._inflight.do(key, fetch_page)
+
+    def _prefetch(self, number: int, order: Optional[str], search: Optional[str]):
+        try:
+            self._load(number, order, search)
+        except Exception as e:
+            logger.debug(f"Prefetch of {self.name} page {number} failed: {e}")
+
+    def page(self, number: int, order: Optional[str] = None,
+             search: Optional[str] = None) -> Tuple[Any, int]:
+        """
+        Get one page.
+
+        Args:
+            number: Zero-based page number
+            order: Sort key, optionally suffixed with ' desc'
+            search: Name filter
+
+        Returns:
+            (page frame, total matching rows)
+        """
+        frame, total = self._load(number, order, search)
+        if (number + 1) * self.page_size < total:
+            self._prefetcher.submit(self._prefetch, number + 1, order, search)
+        return frame, total
+
+    def pages(self, total: int) -> int:
+        """Number of pages for a total row count (at least 1)."""
+        return max(1, -(-total // self.page_size))
+
+    def invalidate(self):
+        """Drop cached pages after the underlying data changed."""
+        self.cache.invalidate(self.name)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
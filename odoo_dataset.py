@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Synthetic Odoo Dataset Generator - scale testing for sandbox mode
+
+Builds a seeded, realistic dataset straight into the columnar sandbox
+tables (odoo_sandbox) and snapshots it to disk so benchmark runs reload
+it in a fraction of the generation time:
+- Partners with a long-tail share of invoices (a few large customers)
+- Log-normal invoice amounts, 15-60 day payment terms
+- Payment state driven by invoice age; payments posted for paid/partial invoices
+- Vendor bills across expense categories
+- Account balances derived from the generated activity
+
+Usage:
+    python odoo_mcp_server.py generate --invoices 1000000 --partners 20000
+    python odoo_dataset.py --invoices 100000 --out sandbox_snapshot
+    ODOO_SANDBOX_SNAPSHOT=sandbox_snapshot python odoo_mcp_server.py summary
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from odoo_sandbox import ColumnarTable, create_sandbox_tables, save_snapshot
+
+DEFAULT_SNAPSHOT = 'sandbox_snapshot'
+
+NAME_PREFIXES = ['Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon', 'Summit', 'Harbor', 'Vertex', 'Nova',
+                 'Atlas', 'Pioneer', 'Cedar', 'Granite', 'Bright', 'Blue', 'Silver', 'Northern',
+                 'Pacific', 'Union', 'Crown', 'Orbit', 'Lumen', 'Quantum', 'Redwood', 'Sterling']
+NAME_CORES = ['Industries', 'Solutions', 'Services', 'Tech', 'Logistics', 'Consulting', 'Labs',
+              'Retail', 'Foods', 'Health', 'Media', 'Energy', 'Systems', 'Partners', 'Capital']
+NAME_SUFFIXES = ['Corp', 'Inc', 'LLC', 'Ltd', 'Group', 'Co', 'GmbH', 'SA']
+
+# (category, share of bills, median amount)
+EXPENSE_CATEGORIES = [
+    ('Software & Hosting', 0.25, 180),
+    ('Office Supplies', 0.20, 90),
+    ('Marketing', 0.15, 900),
+    ('Contractors', 0.15, 2200),
+    ('Travel', 0.10, 450),
+    ('Utilities', 0.10, 300),
+    ('Legal & Accounting', 0.05, 1500),
+]
+
+PAYMENT_TERMS = [15, 30, 30, 30, 45, 60]
+
+
+def _partner_names(rng: random.Random, count: int) -> List[str]:
+    """Unique company names; numbered once the word combinations run out."""
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = f"{rng.choice(NAME_PREFIXES)} {rng.choice(NAME_CORES)} {rng.choice(NAME_SUFFIXES)}"
+        if name in seen:
+            name = f"{name} {len(names) + 1}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def generate_dataset(partners: int = 1000, invoices: int = 10000, expenses: int = 2000,
+                     days: int = 365, seed: int = 42,
+                     today: Optional[date] = None) -> Dict[str, ColumnarTable]:
+    """
+    Generate a seeded dataset into fresh sandbox tables.
+
+    Args:
+        partners: Number of customers
+        invoices: Number of customer invoices
+        expenses: Number of vendor bills
+        days: History window invoices and bills are spread over
+        seed: Random seed; the same arguments always give the same data
+        today: Reference date (defaults to the current date)
+
+    Returns:
+        Sandbox tables ready for OdooMCPServer.load_sandbox() or save_snapshot()
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    dates = [(today - timedelta(days=offset)).isoformat() for offset in range(days + 120)]
+    tables = create_sandbox_tables()
+
+    # Partners
+    names = _partner_names(rng, partners)
+    partner_ids = list(range(1, partners + 1))
+    tables['partners'].load_columns(partner_ids, {
+        'name': names,
+        'email': [f"billing{pid}@{name.split()[0].lower()}.example.com" for pid, name in zip(partner_ids, names)],
+        'phone': [f"+1-555-{pid % 10000:04d}" for pid in partner_ids],
+    })
+
+    # Invoices: Pareto weights give a few large customers most of the volume
+    weights = [rng.paretovariate(1.2) for _ in partner_ids]
+    invoice_partners = rng.choices(partner_ids, weights=weights, k=invoices)
+    columns: Dict[str, list] = {key: [] for key in (
+        'name', 'partner_id', 'partner_name', 'invoice_date', 'due_date',
+        'amount_total', 'amount_residual', 'state', 'payment_state')}
+    payment_rows: List[tuple] = []
+    invoice_ids = list(range(1001, 1001 + invoices))
+
+    for invoice_id, partner_id in zip(invoice_ids, invoice_partners):
+        age = int(rng.random() ** 1.5 * days)  # more recent invoices than old ones
+        terms = rng.choice(PAYMENT_TERMS)
+        total = round(min(rng.lognormvariate(7.2, 0.9), 250000), 2)
+
+        roll = rng.random()
+        if roll < 0.03:
+            state, payment_state, residual = 'cancel', 'not_paid', total
+        elif age < 10 and roll < 0.25:
+            state, payment_state, residual = 'draft', 'not_paid', total
+        else:
+            # The older the invoice, the likelier it has been paid
+            paid_odds = min(0.97, 0.15 + age / (terms + 30))
+            roll = rng.random()
+            if roll < paid_odds:
+                state, payment_state, residual = 'posted', 'paid', 0.0
+            elif roll < paid_odds + 0.08:
+                state, payment_state = 'posted', 'partial'
+                residual = round(total * rng.uniform(0.2, 0.8), 2)
+            else:
+                state, payment_state, residual = 'posted', 'not_paid', total
+
+            if payment_state != 'not_paid':
+                paid_age = max(0, age - int(rng.expovariate(1 / terms)))
+                payment_rows.append((partner_id, paid_age, round(total - residual, 2), invoice_id, age))
+
+        columns['name'].append(f"INV/{dates[age][:4]}/{invoice_id - 1000:04d}")
+        columns['partner_id'].append(partner_id)
+        columns['partner_name'].append(names[partner_id - 1])
+        columns['invoice_date'].append(dates[age])
+        columns['due_date'].append((today - timedelta(days=age - terms)).isoformat())
+        columns['amount_total'].append(total)
+        columns['amount_residual'].append(residual)
+        columns['state'].append(state)
+        columns['payment_state'].append(payment_state)
+    tables['invoices'].load_columns(invoice_ids, columns)
+
+    # Payments for paid and partially paid invoices, in payment date order
+    payment_rows.sort(key=lambda row: -row[1])
+    payment_ids = list(range(2001, 2001 + len(payment_rows)))
+    tables['payments'].load_columns(payment_ids, {
+        'name': [f"PAY/{dates[row[1]][:4]}/{pid - 2000:05d}" for pid, row in zip(payment_ids, payment_rows)],
+        'partner_id': [row[0] for row in payment_rows],
+        'partner_name': [names[row[0] - 1] for row in payment_rows],
+        'payment_date': [dates[row[1]] for row in payment_rows],
+        'amount': [row[2] for row in payment_rows],
+        'payment_type': ['inbound'] * len(payment_rows),
+        'state': ['posted'] * len(payment_rows),
+        'ref': [f"INV/{dates[row[4]][:4]}/{row[3] - 1000:04d}" for row in payment_rows],
+    })
+
+    # Vendor bills
+    categories = [c for c, _, _ in EXPENSE_CATEGORIES]
+    bill_categories = rng.choices(categories, weights=[share for _, share, _ in EXPENSE_CATEGORIES], k=expenses)
+    medians = {c: median for c, _, median in EXPENSE_CATEGORIES}
+    vendors = {c: [f"{rng.choice(NAME_PREFIXES)} {c.split()[0]} {rng.choice(NAME_SUFFIXES)}" for _ in range(8)]
+               for c in categories}
+    expense_ids = list(range(3001, 3001 + expenses))
+    bill_ages = [int(rng.random() * days) for _ in expense_ids]
+    bill_amounts = [round(medians[c] * rng.lognormvariate(0, 0.6), 2) for c in bill_categories]
+    tables['expenses'].load_columns(expense_ids, {
+        'name': [f"BILL/{dates[age][:4]}/{eid - 3000:05d}" for eid, age in zip(expense_ids, bill_ages)],
+        'partner_name': [rng.choice(vendors[c]) for c in bill_categories],
+        'invoice_date': [dates[age] for age in bill_ages],
+        'amount_total': bill_amounts,
+        'state': ['paid' if age > 20 or rng.random() < 0.5 else 'posted' for age in bill_ages],
+        'category': bill_categories,
+    })
+
+    # Balances consistent with the activity above
+    received = sum(row[2] for row in payment_rows)
+    bills = tables['expenses'].aggregate(['state'], ['amount_total'])
+    bills_by_state = {g['state']: g['amount_total'] for g in bills}
+    receivable = tables['invoices'].sum('amount_residual', [('state', '=', 'posted')])
+    bank = round(25000 + received - bills_by_state.get('paid', 0), 2)
+    tables['accounts'].load_columns([1, 2, 3, 4], {
+        'name': ['Bank Account', 'Cash', 'Accounts Receivable', 'Accounts Payable'],
+        'code': ['1010', '1020', '1200', '2100'],
+        'balance': [bank, 1200.0, round(receivable, 2), -round(bills_by_state.get('posted', 0), 2)],
+        'type': ['asset', 'asset', 'asset', 'liability'],
+    })
+
+    return tables
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: generate a dataset and snapshot it to disk."""
+    parser = argparse.ArgumentParser(description='Generate a synthetic Odoo sandbox dataset')
+    parser.add_argument('--partners', type=int, default=1000, help='Customers (default: 1000)')
+    parser.add_argument('--invoices', type=int, default=10000, help='Customer invoices (default: 10000)')
+    parser.add_argument('--expenses', type=int, default=2000, help='Vendor bills (default: 2000)')
+    parser.add_argument('--days', type=int, default=365, help='History window in days (default: 365)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--out', default=DEFAULT_SNAPSHOT, help=f'Snapshot directory (default: {DEFAULT_SNAPSHOT})')
+    args = parser.parse_args(argv)
+
+    print(f"\n🧪 Generating {args.invoices:,} invoices for {args.partners:,} customers (seed {args.seed})...")
+    started = time.perf_counter()
+    tables = generate_dataset(args.partners, args.invoices, args.expenses, args.days, args.seed)
+    generated = time.perf_counter() - started
+
+    save_snapshot(tables, args.out, info=vars(args))
+    saved = time.perf_counter() - started - generated
+
+    print(f"  ✅ Generated in {generated:.1f}s, snapshot written in {saved:.1f}s → {args.out}/")
+    for name, table in tables.items():
+        print(f"    • {name}: {len(table):,} rows")
+    print(f"\n  Use it with: ODOO_SANDBOX_SNAPSHOT={args.out} python odoo_mcp_server.py summary")
+
+
+if __name__ == '__main__':
+    main()
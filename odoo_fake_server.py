@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Fake Odoo JSON-RPC Server - offline stand-in for the production path
+
+Stdlib-only /jsonrpc endpoint that answers OdooMCPServer's production
+calls from the sandbox dataset (seed data, or a generated snapshot via
+ODOO_SANDBOX_SNAPSHOT), so pooling, batching, caching and sync can be
+exercised and benchmarked without a real Odoo:
+- common.authenticate / common.version
+- object.execute_kw: search_read, search, search_count, read_group,
+  create, name_search on account.move, res.partner, account.payment
+  and account.account
+- Odoo-style prefix domains ('|', '&'), many2one [id, name] values
+- JSON-RPC 2.0 batch arrays, keep-alive, gzip responses
+- Injected latency/jitter, JSON-RPC fault rate and HTTP 503 rate
+
+Usage:
+    python odoo_fake_server.py --port 8069 --latency-ms 20 --error-rate 0.01
+    ODOO_URL=http://127.0.0.1:8069 ODOO_PASSWORD=x streamlit run frontend_app.py
+"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from odoo_sandbox import ColumnarTable
+
+FAKE_UID = 2
+
+# Odoo-shaped tables served by the fake: columns and indexed columns
+MODEL_SCHEMAS = {
+    'account.move': {
+        'columns': {
+            'name': 'text', 'move_type': 'category', 'partner_id': 'int', 'partner_name': 'category',
+            'invoice_date': 'date', 'invoice_date_due': 'date', 'amount_total': 'float',
+            'amount_residual': 'float', 'state': 'category', 'payment_state': 'category',
+            'write_date': 'datetime',
+        },
+        'indexed': ('move_type', 'state', 'payment_state', 'partner_id'),
+    },
+    'res.partner': {
+        'columns': {'name': 'text', 'email': 'text', 'phone': 'text', 'customer_rank': 'int',
+                    'write_date': 'datetime'},
+        'indexed': (),
+    },
+    'account.payment': {
+        'columns': {
+            'name': 'text', 'partner_id': 'int', 'partner_name': 'category', 'payment_date': 'date',
+            'amount': 'float', 'payment_type': 'category', 'state': 'category', 'ref': 'text',
+            'write_date': 'datetime',
+        },
+        'indexed': ('partner_id', 'state'),
+    },
+    'account.account': {
+        'columns': {'name': 'text', 'code': 'text', 'account_type': 'category', 'current_balance': 'float',
+                    'write_date': 'datetime'},
+        'indexed': ('account_type',),
+    },
+}
+
+# many2one fields -> column holding the display name
+MANY2ONE = {'partner_id': 'partner_name'}
+
+SANDBOX_ACCOUNT_TYPES = {'asset': 'asset_current', 'liability': 'liability_current'}
+
+
+class OdooFault(Exception):
+    """Error returned to the client as an Odoo JSON-RPC fault."""
+
+
+def _now() -> str:
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def build_odoo_tables(sandbox: Dict[str, ColumnarTable]) -> Dict[str, ColumnarTable]:
+    """
+    Reshape sandbox tables into the Odoo models the production path reads.
+
+    Sandbox shortcuts are mapped to Odoo semantics: invoices and vendor
+    bills share account.move (told apart by move_type), a 'paid' state
+    becomes posted + payment_state paid, and account types get Odoo names.
+    """
+    stamp = _now()
+    tables = {model: ColumnarTable(model, spec['columns'], spec['indexed'])
+              for model, spec in MODEL_SCHEMAS.items()}
+
+    partners = sandbox['partners']
+    tables['res.partner'].load_columns(partners.column('id'), {
+        'name': partners.column('name'),
+        'email': partners.column('email'),
+        'phone': partners.column('phone'),
+        'customer_rank': [1] * len(partners),
+        'write_date': [stamp] * len(partners),
+    })
+
+    invoices = sandbox['invoices']
+    tables['account.move'].load_columns(invoices.column('id'), {
+        'name': invoices.column('name'),
+        'move_type': ['out_invoice'] * len(invoices),
+        'partner_id': invoices.column('partner_id'),
+        'partner_name': invoices.column('partner_name'),
+        'invoice_date': invoices.column('invoice_date'),
+        'invoice_date_due': invoices.column('due_date'),
+        'amount_total': invoices.column('amount_total'),
+        'amount_residual': invoices.column('amount_residual'),
+        'state': ['posted' if state == 'paid' else state for state in invoices.column('state')],
+        'payment_state': invoices.column('payment_state'),
+        'write_date': [stamp] * len(invoices),
+    })
+
+    expenses = sandbox['expenses']
+    bill_states = expenses.column('state')
+    bill_totals = expenses.column('amount_total')
+    # Bills live in account.move too; renumber them if their ids clash with invoices
+    bill_ids = expenses.column('id')
+    if set(bill_ids) & set(invoices.column('id')):
+        first = tables['account.move'].next_id()
+        bill_ids = list(range(first, first + len(bill_ids)))
+    tables['account.move'].load_columns(bill_ids, {
+        'name': expenses.column('name'),
+        'move_type': ['in_invoice'] * len(expenses),
+        'partner_name': expenses.column('partner_name'),
+        'invoice_date': expenses.column('invoice_date'),
+        'amount_total': bill_totals,
+        'amount_residual': [0.0 if state == 'paid' else total for state, total in zip(bill_states, bill_totals)],
+        'state': ['posted' if state == 'paid' else state for state in bill_states],
+        'payment_state': ['paid' if state == 'paid' else 'not_paid' for state in bill_states],
+        'write_date': [stamp] * len(expenses),
+    })
+
+    payments = sandbox['payments']
+    tables['account.payment'].load_columns(payments.column('id'), {
+        **{column: payments.column(column) for column in (
+            'name', 'partner_id', 'partner_name', 'payment_date', 'amount', 'payment_type', 'state', 'ref')},
+        'write_date': [stamp] * len(payments),
+    })
+
+    accounts = sandbox['accounts']
+    tables['account.account'].load_columns(accounts.column('id'), {
+        'name': accounts.column('name'),
+        'code': accounts.column('code'),
+        'account_type': [SANDBOX_ACCOUNT_TYPES.get(t, t) for t in accounts.column('type')],
+        'current_balance': accounts.column('balance'),
+        'write_date': [stamp] * len(accounts),
+    })
+    return tables
+
+
+class FakeOdoo:
+    """
+    JSON-RPC dispatcher over Odoo-shaped columnar tables.
+
+    Thread-safe: tables lock internally, and creates are serialized.
+    """
+
+    def __init__(self, tables: Dict[str, ColumnarTable], password: Optional[str] = None,
+                 error_rate: float = 0, seed: Optional[int] = None):
+        """
+        Initialize dispatcher.
+
+        Args:
+            tables: Tables from build_odoo_tables()
+            password: Required password for authenticate (None accepts any)
+            error_rate: Fraction of calls answered with an injected Odoo fault
+            seed: Random seed for fault injection
+        """
+        self.tables = tables
+        self.password = password
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats: Counter = Counter()
+
+    def count(self, *labels: str, amount: int = 1):
+        """Bump request/call counters (thread-safe)."""
+        with self._stats_lock:
+            for label in labels:
+                self.stats[label] += amount
+
+    # ----- JSON-RPC -----
+
+    def handle(self, request: Dict) -> Dict:
+        """Answer one JSON-RPC request object."""
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+        params = request.get('params') or {}
+        service, method = params.get('service'), params.get('method')
+        args = params.get('args') or []
+        label = f"{service}.{method}" if service != 'object' else f"object.{args[4] if len(args) > 4 else '?'}"
+        self.count('calls', label)
+
+        try:
+            if self.error_rate and self._random.random() < self.error_rate:
+                raise OdooFault('Injected failure')
+            if service == 'common':
+                response['result'] = self._common(method, args)
+            elif service == 'object' and method == 'execute_kw':
+                response['result'] = self._execute_kw(args)
+            else:
+                raise OdooFault(f"Unsupported call {service}.{method}")
+        except Exception as e:
+            self.count('errors')
+            response['error'] = {
+                'code': 200,
+                'message': 'Odoo Server Error',
+                'data': {'name': f"odoo.exceptions.{type(e).__name__}", 'message': str(e)},
+            }
+        return response
+
+    def _common(self, method: str, args: List) -> Any:
+        if method == 'version':
+            return {'server_version': '17.0-fake', 'protocol_version': 1}
+        if method in ('authenticate', 'login'):
+            password = args[2] if len(args) > 2 else None
+            ok = password and (self.password is None or password == self.password)
+            return FAKE_UID if ok else False
+        raise OdooFault(f"Unsupported call common.{method}")
+
+    def _execute_kw(self, args: List) -> Any:
+        if len(args) < 5:
+            raise OdooFault('execute_kw expects db, uid, password, model, method')
+        model, method = args[3], args[4]
+        positional = args[5] if len(args) > 5 else []
+        kwargs = args[6] if len(args) > 6 else {}
+
+        table = self.tables.get(model)
+        if table is None:
+            raise OdooFault(f"Object {model} doesn't exist")
+
+        if method == 'search_read':
+            domain = positional[0] if positional else kwargs.get('domain', [])
+            return self.search_read(table, domain, kwargs.get('fields'), kwargs.get('offset', 0),
+                                    kwargs.get('limit'), kwargs.get('order'))
+        if method == 'search':
+            positions = self._order(table, self._search(table, positional[0] if positional else []),
+                                    kwargs.get('order'))
+            positions = self._page(positions, kwargs.get('offset', 0), kwargs.get('limit'))
+            return [table.ids[p] for p in positions]
+        if method == 'search_count':
+            return len(self._search(table, positional[0] if positional else []))
+        if method == 'read_group':
+            domain = positional[0] if positional else kwargs.get('domain', [])
+            fields = positional[1] if len(positional) > 1 else kwargs.get('fields', [])
+            groupby = positional[2] if len(positional) > 2 else kwargs.get('groupby', [])
+            return self.read_group(table, domain, fields, groupby)
+        if method == 'create':
+            return self.create(model, table, positional[0] if positional else kwargs.get('vals_list'))
+        if method == 'name_search':
+            name = positional[0] if positional else kwargs.get('name', '')
+            return self.name_search(table, name, kwargs.get('limit', 100))
+        raise OdooFault(f"Method {model}.{method} is not supported by the fake server")
+
+    # ----- queries -----
+
+    def _leaf(self, table: ColumnarTable, leaf: Sequence) -> Tuple[str, str, Any]:
+        field, op, value = leaf
+        if op == '=?':
+            op = '='
+        if op in ('=like', '=ilike', 'like'):
+            op = 'ilike'
+            value = str(value).replace('%', '')
+        if field != 'id' and field not in table.columns:
+            raise OdooFault(f"Invalid field {table.name}.{field} in leaf {tuple(leaf)}")
+        if op == 'ilike' and field in MANY2ONE:
+            field = MANY2ONE[field]  # Odoo matches many2one ilike against the display name
+        if isinstance(value, list) and len(value) == 2 and field in MANY2ONE and op in ('=', '!='):
+            value = value[0]
+        if value is False and op in ('=', '!='):
+            value = None if table.kinds.get(field) in ('text', 'category') else 0
+        return field, op, value
+
+    def _search(self, table: ColumnarTable, domain: List) -> Sequence[int]:
+        """Row positions matching an Odoo prefix-notation domain."""
+        domain = list(domain or [])
+        if not any(isinstance(term, str) for term in domain):
+            return table.positions([self._leaf(table, leaf) for leaf in domain])
+
+        def parse(index: int):
+            term = domain[index]
+            if term in ('|', '&'):
+                left, index = parse(index + 1)
+                right, index = parse(index)
+                return (term, left, right), index
+            if term == '!':
+                raise OdooFault("'!' domains are not supported by the fake server")
+            return ('leaf', self._leaf(table, term)), index + 1
+
+        def evaluate(node) -> set:
+            if node[0] == 'leaf':
+                return set(table.positions([node[1]]))
+            left, right = evaluate(node[1]), evaluate(node[2])
+            return left | right if node[0] == '|' else left & right
+
+        matched, index = None, 0
+        while index < len(domain):
+            node, index = parse(index)
+            positions = evaluate(node)
+            matched = positions if matched is None else matched & positions
+        return sorted(matched or ())
+
+    @staticmethod
+    def _order(table: ColumnarTable, positions: Sequence[int], order: Optional[str]) -> Sequence[int]:
+        # Rows are stored in id order, so only the leading sort key matters
+        if not order:
+            return positions
+        first = order.split(',')[0].strip()
+        field, _, direction = first.partition(' ')
+        if field == 'id' and not first.lower().endswith('desc'):
+            return positions
+        if field in MANY2ONE:
+            # Odoo orders many2one fields by the related record's name
+            first = f"{MANY2ONE[field]} {direction}".strip()
+        return table._order(positions, first)
+
+    @staticmethod
+    def _page(positions: Sequence[int], offset: int = 0, limit: Optional[int] = None) -> Sequence[int]:
+        offset = offset or 0
+        return positions[offset:offset + limit] if limit else positions[offset:]
+
+    def _record(self, table: ColumnarTable, position: int, fields: Optional[List[str]]) -> Dict:
+        row = table.row(position)
+        names = fields or [f for f in table.columns if f not in MANY2ONE.values()]
+        record = {'id': row['id']}
+        for field in names:
+            if field == 'id':
+                continue
+            if field in MANY2ONE and field in row:
+                record[field] = [row[field], row.get(MANY2ONE[field])] if row[field] else False
+            elif field in row:
+                value = row[field]
+                record[field] = False if value is None else value
+            else:
+                raise OdooFault(f"Invalid field '{field}' on model '{table.name}'")
+        return record
+
+    def search_read(self, table: ColumnarTable, domain: List, fields: Optional[List[str]] = None,
+                    offset: int = 0, limit: Optional[int] = None, order: Optional[str] = None) -> List[Dict]:
+        positions = self._page(self._order(table, self._search(table, domain), order), offset, limit)
+        return [self._record(table, p, fields) for p in positions]
+
+    def read_group(self, table: ColumnarTable, domain: List, fields: List[str],
+                   groupby: List[str]) -> List[Dict]:
+        """Aggregate like read_group(lazy=False): one row per group with '__count'."""
+        groupby = [groupby] if isinstance(groupby, str) else list(groupby)
+        sums = []
+        for spec in fields:
+            name, _, aggregate = spec.partition(':')
+            if name in groupby or name in ('__count', 'id'):
+                continue
+            if aggregate and aggregate != 'sum':
+                raise OdooFault(f"Aggregate {aggregate} is not supported by the fake server")
+            if table.kinds.get(name) in ('int', 'float'):
+                sums.append(name)
+
+        if any(isinstance(term, str) for term in domain):
+            raise OdooFault("read_group with '|' domains is not supported by the fake server")
+
+        columns = [g.split(':')[0] for g in groupby]
+        for column in columns:
+            if column not in table.columns:
+                raise OdooFault(f"Invalid groupby field {table.name}.{column}")
+        # many2one groups come back as [id, display name]
+        names = [MANY2ONE[c] for c in columns if c in MANY2ONE]
+        groups = table.aggregate(columns + names, sums, [self._leaf(table, leaf) for leaf in domain])
+        for group in groups:
+            for column in columns:
+                if column in MANY2ONE:
+                    name = group.pop(MANY2ONE[column])
+                    group[column] = [group[column], name] if group[column] else False
+                elif group[column] is None:
+                    group[column] = False
+        return groups
+
+    def name_search(self, table: ColumnarTable, name: str, limit: int = 100) -> List[List]:
+        positions = table.positions([('name', 'ilike', name)] if name else [])
+        return [[table.ids[p], table.columns['name'][p]] for p in positions[:limit]]
+
+    # ----- writes -----
+
+    def create(self, model: str, table: ColumnarTable, vals: Any) -> Any:
+        """Create one record (vals dict) or many (list of dicts); returns id(s)."""
+        many = isinstance(vals, list)
+        records = [self._create_values(model, v) for v in (vals if many else [vals])]
+        with self._write_lock:
+            ids = [row['id'] for row in table.extend(records)]
+        self.count('created', amount=len(ids))
+        return ids if many else ids[0]
+
+    def _create_values(self, model: str, vals: Dict) -> Dict:
+        if not isinstance(vals, dict):
+            raise OdooFault(f"create expects a dict of values, got {type(vals).__name__}")
+        record = {'write_date': _now()}
+        if model == 'account.move':
+            partner = self.tables['res.partner'].get(vals.get('partner_id'))
+            if partner is None:
+                raise OdooFault(f"Record res.partner({vals.get('partner_id')}) does not exist")
+            lines = [cmd[2] for cmd in vals.get('invoice_line_ids', []) if len(cmd) == 3 and cmd[0] == 0]
+            total = round(sum((line.get('quantity') or 1) * (line.get('price_unit') or 0) for line in lines), 2)
+            record.update({
+                'name': '/',
+                'move_type': vals.get('move_type', 'out_invoice'),
+                'partner_id': partner['id'],
+                'partner_name': partner['name'],
+                'invoice_date': vals.get('invoice_date') or None,
+                'invoice_date_due': vals.get('invoice_date_due') or vals.get('invoice_date') or None,
+                'amount_total': total,
+                'amount_residual': total,
+                'state': 'draft',
+                'payment_state': 'not_paid',
+            })
+            return record
+        if model == 'res.partner':
+            if not vals.get('name'):
+                raise OdooFault('Contacts require a name')
+            record.update({
+                'name': vals['name'],
+                'email': vals.get('email') or None,
+                'phone': vals.get('phone') or None,
+                'customer_rank': vals.get('customer_rank', 0),
+            })
+            return record
+        raise OdooFault(f"create on {model} is not supported by the fake server")
+
+
+class _FakeOdooHandler(BaseHTTPRequestHandler):
+    """/jsonrpc endpoint; accepts single requests and JSON-RPC 2.0 batch arrays."""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive support
+    disable_nagle_algorithm = True  # Headers and body are separate writes
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server: 'FakeOdooServer' = self.server
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length))
+        server.odoo.count('requests')
+
+        delay = server.latency_ms + (server._random.uniform(0, server.jitter_ms) if server.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+
+        if server.http_error_rate and server._random.random() < server.http_error_rate:
+            server.odoo.count('http_errors')
+            self._send(503, b'Service Unavailable', 'text/plain')
+            return
+
+        if isinstance(request, list):
+            response = [server.odoo.handle(r) for r in request]
+        else:
+            response = server.odoo.handle(request)
+        self._send(200, json.dumps(response).encode(), 'application/json')
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if 'gzip' in self.headers.get('Accept-Encoding', '') and len(body) > 512:
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeOdooServer(ThreadingHTTPServer):
+    """Threaded HTTP server hosting a FakeOdoo dispatcher."""
+
+    daemon_threads = True
+    request_queue_size = 128  # Default backlog of 5 drops concurrent connects
+
+    def __init__(self, address: Tuple[str, int], odoo: FakeOdoo, latency_ms: float = 0,
+                 jitter_ms: float = 0, http_error_rate: float = 0, seed: Optional[int] = None):
+        super().__init__(address, _FakeOdooHandler)
+        self.odoo = odoo
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.http_error_rate = http_error_rate
+        self._random = random.Random(seed)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_fake_odoo(latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0,
+                    http_error_rate: float = 0, sandbox: Optional[Dict[str, ColumnarTable]] = None,
+                    password: Optional[str] = None, port: int = 0, seed: Optional[int] = None,
+                    background: bool = True) -> FakeOdooServer:
+    """
+    Start a fake Odoo server on localhost.
+
+    Args:
+        latency_ms: Simulated network round trip added to every HTTP request
+        jitter_ms: Extra uniform random delay on top of latency_ms
+        error_rate: Fraction of JSON-RPC calls answered with an Odoo fault
+        http_error_rate: Fraction of HTTP requests answered with 503
+        sandbox: Sandbox tables to serve (default: OdooMCPServer sandbox data,
+                 which honors ODOO_SANDBOX_SNAPSHOT)
+        password: Password authenticate() must receive (None accepts any)
+        port: TCP port, 0 picks a free one
+        seed: Random seed for latency jitter and fault injection
+        background: Serve from a daemon thread (False leaves serve_forever to the caller)
+
+    Returns:
+        The running server; use .url for OdooMCPServer's config and .shutdown() to stop it
+    """
+    if sandbox is None:
+        from odoo_mcp_server import OdooMCPServer
+        sandbox = OdooMCPServer(mode='sandbox').sandbox
+
+    odoo = FakeOdoo(build_odoo_tables(sandbox), password=password, error_rate=error_rate, seed=seed)
+    httpd = FakeOdooServer(('127.0.0.1', port), odoo, latency_ms=latency_ms, jitter_ms=jitter_ms,
+                           http_error_rate=http_error_rate, seed=seed)
+    if background:
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fake Odoo JSON-RPC server backed by the sandbox dataset')
+    parser.add_argument('--port', type=int, default=8069, help='Port to listen on (default: 8069)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Added delay per HTTP request')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Extra random delay per HTTP request')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of calls failing with an Odoo fault')
+    parser.add_argument('--http-error-rate', type=float, default=0, help='Fraction of HTTP requests failing with 503')
+    parser.add_argument('--snapshot', help='Serve a generated dataset snapshot (see odoo_dataset.py)')
+    parser.add_argument('--password', help='Require this password (default: accept any)')
+    parser.add_argument('--seed', type=int, help='Random seed for jitter and fault injection')
+    args = parser.parse_args()
+
+    sandbox = None
+    if args.snapshot:
+        from odoo_sandbox import load_snapshot
+        sandbox = load_snapshot(args.snapshot)
+
+    httpd = start_fake_odoo(args.latency_ms, args.jitter_ms, args.error_rate, args.http_error_rate,
+                            sandbox=sandbox, password=args.password, port=args.port, seed=args.seed,
+                            background=False)
+    moves = len(httpd.odoo.tables['account.move'])
+    print(f"🧪 Fake Odoo at {httpd.url}/jsonrpc ({moves:,} moves, "
+          f"{args.latency_ms} ms latency, {args.error_rate:.0%} faults)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n📊 {dict(httpd.odoo.stats)}")
+
+
+if __name__ == '__main__':
+    main()
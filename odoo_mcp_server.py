@@ -16,19 +16,174 @@ Odoo External API Reference:
 https://www.odoo.com/documentation/19.0/developer/reference/external_api.html
 """
 
+import itertools
 import json
 import logging
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from odoo_cache import OdooReadCache, SingleFlight
+from odoo_metrics import DEFAULT_STATS_LOG, OdooMetrics, format_snapshot, read_last_snapshot, rpc_label
+from odoo_partner_index import PartnerNameIndex, normalize_name
+from odoo_records import OUTPUTS, Invoice, Partner, Payment, shape
+from odoo_resilience import (IDEMPOTENT_METHODS, CircuitBreaker, CircuitOpenError, OdooResilience,
+                             OdooRPCError, OdooUnavailableError, RetryPolicy, is_idempotent)
+from odoo_sandbox import ColumnarTable, create_sandbox_tables, load_snapshot
+from odoo_store import MIRROR_TABLES, SqliteStore
+from odoo_stream import CHUNK_SIZE, iter_result, loads
+from odoo_sync import MemoryStore, OdooSyncEngine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sort keys accepted by get_invoices/get_partners(order=...): key -> (Odoo field, sandbox column)
+INVOICE_SORTS = {
+    'invoice_date': ('invoice_date', 'invoice_date'),
+    'name': ('name', 'name'),
+    'customer': ('partner_id', 'partner_name'),
+    'due_date': ('invoice_date_due', 'due_date'),
+    'amount_total': ('amount_total', 'amount_total'),
+    'amount_residual': ('amount_residual', 'amount_residual'),
+    'state': ('state', 'state'),
+}
+PARTNER_SORTS = {
+    'name': ('name', 'name'),
+    'email': ('email', 'email'),
+    'phone': ('phone', 'phone'),
+}
+
+
+class OdooBatchCall:
+    """
+    One execute_kw call queued in an OdooBatch.
+
+    The result is filled in when the batch is sent; reading it before
+    then raises RuntimeError.
+    """
+
+    def __init__(self, request_id: int, model: str, method: str):
+        self.id = request_id
+        self.model = model
+        self.method = method
+        self.done = False
+        self.error = None
+        self.cache_key = None
+        self.flight_key = None
+        self.generation = None
+        self._result = None
+
+    @property
+    def ok(self) -> bool:
+        return self.done and self.error is None
+
+    @property
+    def result(self) -> Any:
+        if not self.done:
+            raise RuntimeError(f"Batch call {self.model}.{self.method} has not been sent yet")
+        if self.error is not None:
+            raise OdooRPCError(f"Odoo Error: {self.error}")
+        return self._result
+
+    def _resolve(self, result: Any = None, error: Any = None):
+        self._result = result
+        self.error = error
+        self.done = True
+
+
+class OdooBatch:
+    """
+    Queue of execute_kw calls sent to Odoo as one JSON-RPC 2.0 batch array.
+
+    Usage:
+        with odoo.batch() as batch:
+            invoices = batch.execute_kw('account.move', 'search_read', [domain], {...})
+            payments = batch.execute_kw('account.payment', 'search_read', [domain], {...})
+        rows = invoices.result
+    """
+
+    def __init__(self, server: 'OdooMCPServer'):
+        self.server = server
+        self.calls: List[OdooBatchCall] = []
+        self._payloads: List[Dict] = []
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    def execute_kw(self, model: str, method: str, args: List,
+                   kwargs: Optional[Dict] = None) -> OdooBatchCall:
+        """Queue an execute_kw call and return its placeholder."""
+        payload = self.server._rpc_payload(
+            'call', self.server._execute_kw_params(model, method, args, kwargs)
+        )
+        call = OdooBatchCall(payload['id'], model, method)
+        call.flight_key = self.server._flight_key(model, method, args, kwargs)
+        self.calls.append(call)
+
+        # Cached reads resolve immediately and never go on the wire
+        call.cache_key = self.server._cache_key(model, method, args, kwargs)
+        if call.cache_key is not None:
+            hit, value = self.server.cache.get(call.cache_key)
+            if hit:
+                self.server.metrics.record_cache_hit(f"{model}.{method}")
+                call._resolve(result=value)
+                return call
+        call.generation = self.server._cache_generation(model, call.cache_key)
+
+        self._payloads.append(payload)
+        return call
+
+    def send(self) -> List[OdooBatchCall]:
+        """Send all queued calls in one round trip and demultiplex results by id."""
+        if not self._payloads:
+            return self.calls
+
+        pending = [call for call in self.calls if not call.done]
+
+        def round_trip() -> List[Optional[Dict]]:
+            responses = self.server._json_rpc_batch('/jsonrpc', self._payloads)
+            return [responses.get(call.id) for call in pending]
+
+        # Batches of the same reads sent concurrently share one round trip;
+        # responses are matched to calls by position since request ids differ
+        flight_keys = [call.flight_key for call in pending]
+        try:
+            if None in flight_keys:
+                responses = round_trip()
+            else:
+                responses = self.server.inflight.do(('batch',) + tuple(flight_keys), round_trip)
+        except OdooUnavailableError as e:
+            # Odoo is down: answer what the cache still has, fail the rest
+            for call in self.calls:
+                if not call.done:
+                    hit, value = self.server._stale_read(call.cache_key, e)
+                    if hit:
+                        call._resolve(result=value)
+                    else:
+                        call._resolve(error=str(e))
+            self._payloads = []
+            return self.calls
+
+        for call, response in zip(pending, responses):
+            if response is None:
+                call._resolve(error=f'No response for request id {call.id}')
+            elif 'error' in response:
+                self.server.metrics.record_fault(f"{call.model}.{call.method}")
+                call._resolve(error=response['error'])
+            else:
+                call._resolve(result=response.get('result'))
+                self.server._after_call(call.model, call.method, call.cache_key, call._result, call.generation)
+
+        self._payloads = []
+        return self.calls
+
 
 class OdooMCPServer:
     """
@@ -54,6 +209,84 @@ class OdooMCPServer:
         self.username = self.config.get('username', os.getenv('ODOO_USERNAME', 'admin'))
         self.password = self.config.get('password', os.getenv('ODOO_PASSWORD', ''))
 
+        # HTTP connection pool settings (production only)
+        self.pool_size = int(self.config.get('pool_size', os.getenv('ODOO_POOL_SIZE', 10)))
+        self.connect_timeout = float(self.config.get('connect_timeout', os.getenv('ODOO_CONNECT_TIMEOUT', 5)))
+        self.read_timeout = float(self.config.get('read_timeout', os.getenv('ODOO_READ_TIMEOUT', 30)))
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Retries for idempotent reads and a circuit breaker that fails fast while Odoo is down
+        self.resilience = OdooResilience(
+            retry=RetryPolicy(
+                max_retries=int(self.config.get('retries', os.getenv('ODOO_RETRIES', 2))),
+                deadline=float(self.config.get('retry_deadline', os.getenv('ODOO_RETRY_DEADLINE', 45)))
+            ),
+            breaker=CircuitBreaker(
+                failure_threshold=int(self.config.get('breaker_threshold', os.getenv('ODOO_BREAKER_THRESHOLD', 5))),
+                reset_timeout=float(self.config.get('breaker_reset', os.getenv('ODOO_BREAKER_RESET', 30)))
+            )
+        )
+
+        # JSON-RPC batching (falls back to sequential calls if the server rejects arrays)
+        self.batch_enabled = str(self.config.get('batch', os.getenv('ODOO_BATCH_RPC', 'true'))).lower() != 'false'
+        # JSON decoder: 'json', 'orjson' (faster whole bodies) or 'ijson' (streams), see odoo_stream
+        self.json_backend = self.config.get('json_backend', os.getenv('ODOO_JSON_BACKEND', 'json'))
+        self._request_ids = itertools.count(1)
+
+        # Read-through cache for production search_read results
+        cache_enabled = str(self.config.get('cache', os.getenv('ODOO_CACHE', 'true'))).lower() != 'false'
+        self.cache = OdooReadCache(
+            max_entries=int(self.config.get('cache_size', os.getenv('ODOO_CACHE_SIZE', 256))),
+            default_ttl=float(self.config.get('cache_ttl', os.getenv('ODOO_CACHE_TTL', 30))),
+            model_ttls=self.config.get('cache_ttls')
+        ) if cache_enabled else None
+
+        # Identical reads issued concurrently (e.g. several dashboard sessions
+        # sharing this server) wait on one in-flight request
+        coalesce = str(self.config.get('coalesce', os.getenv('ODOO_COALESCE', 'true'))).lower() != 'false'
+        self.inflight = SingleFlight() if coalesce else None
+        self._write_generations: Dict[str, int] = {}  # Per model, when there is no cache to count them
+        self._generation_lock = threading.Lock()
+
+        # Per model/method and per tool call statistics, optionally appended
+        # to a JSONL log every stats_interval seconds (0 = off)
+        self.metrics = OdooMetrics()
+        self.stats_log = self.config.get('stats_log', os.getenv('ODOO_STATS_LOG', DEFAULT_STATS_LOG))
+        stats_interval = float(self.config.get('stats_interval', os.getenv('ODOO_STATS_INTERVAL', 0)))
+        if stats_interval > 0:
+            self.metrics.start_dumper(self.stats_log, stats_interval, extra=lambda: {
+                'mode': self.mode,
+                'cache': self.cache_stats(),
+                'coalescing': self.coalescing_stats(),
+                'resilience': self.resilience_stats(),
+            })
+
+        # Upper bound on concurrent Odoo reads issued by fan_out(), across all callers
+        self.max_concurrency = int(self.config.get('max_concurrency', os.getenv('ODOO_MAX_CONCURRENCY', 4)))
+        self._fanout_executor: Optional[ThreadPoolExecutor] = None
+        self._fanout_lock = threading.Lock()
+        self._fanout_worker = threading.local()
+
+        # Partner name index behind resolve_partner(), refreshed incrementally
+        self.partner_index = PartnerNameIndex()
+        self.partner_index_ttl = float(self.config.get('partner_index_ttl', os.getenv('ODOO_PARTNER_INDEX_TTL', 60)))
+        self._partner_index_checked = 0.0
+
+        # Optional incrementally synced local copy that read methods serve from:
+        # 'true'/'memory' keeps it in-process, 'sqlite' persists it to ODOO_MIRROR_PATH
+        self.sync = None
+        local_mirror = str(self.config.get('local_mirror', os.getenv('ODOO_LOCAL_MIRROR', 'false'))).lower()
+        if local_mirror in ('true', 'memory', 'sqlite') and self.mode == "production":
+            if local_mirror == 'sqlite':
+                store = SqliteStore(self.config.get('mirror_path', os.getenv('ODOO_MIRROR_PATH', 'odoo_mirror.db')))
+            else:
+                store = MemoryStore()
+            self.attach_sync(OdooSyncEngine(
+                self, store=store,
+                max_age=float(self.config.get('sync_max_age', os.getenv('ODOO_SYNC_MAX_AGE', 60)))
+            ))
+
         self.uid = None  # User ID after authentication
 
         # Sandbox data for testing
@@ -64,9 +297,15 @@ class OdooMCPServer:
 
     def _init_sandbox_data(self):
         """Initialize simulated data for sandbox mode."""
+        # A generated dataset snapshot (see odoo_dataset) replaces the seed records
+        snapshot = self.config.get('sandbox_snapshot', os.getenv('ODOO_SANDBOX_SNAPSHOT'))
+        if snapshot:
+            self.load_sandbox(load_snapshot(snapshot))
+            logger.info(f"Loaded sandbox snapshot {snapshot} ({len(self.invoices)} invoices)")
+            return
 
         # Simulated customers/partners
-        self.partners = [
+        partners = [
             {'id': 1, 'name': 'Client Alpha Corp', 'email': 'billing@alphacorp.com', 'phone': '+1-555-0101'},
             {'id': 2, 'name': 'Beta Industries', 'email': 'accounts@beta.io', 'phone': '+1-555-0102'},
             {'id': 3, 'name': 'Gamma Solutions', 'email': 'finance@gamma.com', 'phone': '+1-555-0103'},
@@ -75,7 +314,7 @@ class OdooMCPServer:
         ]
 
         # Simulated invoices
-        self.invoices = [
+        invoices = [
             {
                 'id': 1001,
                 'name': 'INV/2026/0001',
@@ -139,7 +378,7 @@ class OdooMCPServer:
         ]
 
         # Simulated payments
-        self.payments = [
+        payments = [
             {
                 'id': 2001,
                 'name': 'PAY/2026/0001',
@@ -165,7 +404,7 @@ class OdooMCPServer:
         ]
 
         # Simulated expenses (vendor bills)
-        self.expenses = [
+        expenses = [
             {
                 'id': 3001,
                 'name': 'BILL/2026/0001',
@@ -196,44 +435,501 @@ class OdooMCPServer:
         ]
 
         # Account balances
-        self.accounts = [
+        accounts = [
             {'id': 1, 'name': 'Bank Account', 'code': '1010', 'balance': 18500.00, 'type': 'asset'},
             {'id': 2, 'name': 'Cash', 'code': '1020', 'balance': 1200.00, 'type': 'asset'},
             {'id': 3, 'name': 'Accounts Receivable', 'code': '1200', 'balance': 14050.00, 'type': 'asset'},
             {'id': 4, 'name': 'Accounts Payable', 'code': '2100', 'balance': -800.00, 'type': 'liability'},
         ]
 
-    def _json_rpc_call(self, endpoint: str, method: str, params: List) -> Any:
+        # Columnar tables with secondary indexes, so load tests scale (see odoo_sandbox)
+        tables = create_sandbox_tables()
+        for table, records in (('partners', partners), ('invoices', invoices), ('payments', payments),
+                               ('expenses', expenses), ('accounts', accounts)):
+            tables[table].extend(records)
+        self.load_sandbox(tables)
+
+    def load_sandbox(self, tables: Dict[str, ColumnarTable]):
         """
-        Make JSON-RPC 2.0 call to Odoo server.
+        Swap in a new set of sandbox tables (e.g. a generated dataset).
 
-        For production mode only.
+        Args:
+            tables: Tables from odoo_sandbox.create_sandbox_tables() or load_snapshot()
         """
-        if self.mode == "sandbox":
-            raise RuntimeError("JSON-RPC calls not available in sandbox mode")
+        self.sandbox = tables
+        self.partners = tables['partners']
+        self.invoices = tables['invoices']
+        self.payments = tables['payments']
+        self.expenses = tables['expenses']
+        self.accounts = tables['accounts']
+        self.partner_index = PartnerNameIndex()
+
+    def _get_session(self):
+        """
+        Get the pooled HTTP session, creating it on first use.
+
+        The session keeps connections alive between calls so repeated
+        search_read requests skip the TCP/TLS handshake. One session is
+        shared by every caller of this server instance.
+        """
+        if self._session is not None:
+            return self._session
 
         try:
             import requests
+            from requests.adapters import HTTPAdapter
         except ImportError:
             raise ImportError("requests library required for production mode: pip install requests")
 
-        url = f"{self.url}{endpoint}"
-        payload = {
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({
+                    'Content-Type': 'application/json',
+                    'Accept-Encoding': 'gzip, deflate',
+                    'Connection': 'keep-alive',
+                })
+                self._session = session
+
+        return self._session
+
+    def close(self):
+        """Close pooled HTTP connections and the fan-out workers."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+        with self._fanout_lock:
+            if self._fanout_executor is not None:
+                self._fanout_executor.shutdown(wait=False)
+                self._fanout_executor = None
+
+    def _rpc_payload(self, method: str, params: Any) -> Dict[str, Any]:
+        """Build a JSON-RPC 2.0 request with a unique id."""
+        return {
             "jsonrpc": "2.0",
             "method": method,
             "params": params,
-            "id": random.randint(1, 1000000)
+            "id": next(self._request_ids)
         }
 
-        response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'})
-        response.raise_for_status()
+    def _post(self, endpoint: str, payload: Any, idempotent: bool = False) -> Any:
+        """
+        POST a JSON payload through the pooled session and decode the body.
+
+        Runs under self.resilience: the breaker fails fast while Odoo is
+        down, transient failures of idempotent requests are retried with
+        backoff, and no attempt's read timeout outlasts the call deadline.
+
+        Raises:
+            OdooUnavailableError: Odoo could not be reached
+        """
+        session = self._get_session()
+        import requests
+
+        sizes = [0, 0]
+
+        def send(remaining: float):
+            response = session.post(f"{self.url}{endpoint}", json=payload,
+                                    timeout=(min(self.connect_timeout, remaining), min(self.read_timeout, remaining)))
+            sizes[:] = len(response.request.body or b''), len(response.content)
+            response.raise_for_status()
+            return loads(response.content, self.json_backend)
+
+        labels = [rpc_label(p.get('params')) for p in payload] if isinstance(payload, list) \
+            else [rpc_label(payload.get('params'))]
+        started = time.perf_counter()
+        try:
+            result = self.resilience.call(send, idempotent, (requests.ConnectionError, requests.Timeout))
+        except Exception:
+            self.metrics.record_rpc(labels, (time.perf_counter() - started) * 1000, *sizes, error=True)
+            raise
+        self.metrics.record_rpc(labels, (time.perf_counter() - started) * 1000, *sizes)
+        return result
+
+    def _json_rpc_call(self, endpoint: str, method: str, params: List) -> Any:
+        """
+        Make JSON-RPC 2.0 call to Odoo server.
+
+        For production mode only. Requests go through a pooled keep-alive
+        session with connect/read timeouts; reads are retried on transient
+        failures (see _post).
+        """
+        if self.mode == "sandbox":
+            raise RuntimeError("JSON-RPC calls not available in sandbox mode")
 
-        result = response.json()
+        result = self._post(endpoint, self._rpc_payload(method, params), is_idempotent(params))
         if 'error' in result:
-            raise Exception(f"Odoo Error: {result['error']}")
+            self.metrics.record_fault(rpc_label(params))
+            raise OdooRPCError(f"Odoo Error: {result['error']}")
 
         return result.get('result')
 
+    def _json_rpc_stream(self, endpoint: str, method: str, params: Any) -> Iterator[Any]:
+        """
+        Make a JSON-RPC 2.0 call whose result array is decoded as it arrives.
+
+        For production mode only. Elements are yielded one by one (see
+        odoo_stream), so the raw body and the full parsed list are never held
+        at once. Retries and the circuit breaker cover the request up to the
+        response headers; a failure while reading the body reaches the caller.
+        Decoder: ODOO_JSON_BACKEND (see odoo_stream).
+        """
+        if self.mode == "sandbox":
+            raise RuntimeError("JSON-RPC calls not available in sandbox mode")
+
+        session = self._get_session()
+        import requests
+
+        payload = self._rpc_payload(method, params)
+
+        def send(remaining: float):
+            response = session.post(f"{self.url}{endpoint}", json=payload, stream=True,
+                                    timeout=(min(self.connect_timeout, remaining), min(self.read_timeout, remaining)))
+            try:
+                response.raise_for_status()
+            except Exception:
+                response.close()
+                raise
+            return response
+
+        sizes = [0, 0]
+
+        def counted(chunks: Iterator[bytes]) -> Iterator[bytes]:
+            for chunk in chunks:
+                sizes[1] += len(chunk)
+                yield chunk
+
+        started = time.perf_counter()
+        error = True
+        try:
+            response = self.resilience.call(send, is_idempotent(params), (requests.ConnectionError, requests.Timeout))
+            sizes[0] = len(response.request.body or b'')
+            with response:
+                yield from iter_result(counted(response.iter_content(CHUNK_SIZE)), self.json_backend)
+            error = False
+        except GeneratorExit:
+            error = False  # The caller stopped reading early
+            raise
+        finally:
+            # Time to the last record, including the caller's work between records
+            self.metrics.record_rpc([rpc_label(params)], (time.perf_counter() - started) * 1000, *sizes, error=error)
+
+    def _json_rpc_batch(self, endpoint: str, payloads: List[Dict]) -> Dict[int, Dict]:
+        """
+        Send several JSON-RPC 2.0 requests as one batch array.
+
+        Returns:
+            Responses keyed by request id
+
+        If the server does not accept batch arrays, batching is disabled for
+        this server and the requests are sent one by one over the pooled session.
+        """
+        if self.mode == "sandbox":
+            raise RuntimeError("JSON-RPC calls not available in sandbox mode")
+
+        if self.batch_enabled and len(payloads) > 1:
+            idempotent = all(is_idempotent(p['params']) for p in payloads)
+            responses = self._post(endpoint, payloads, idempotent)
+            if isinstance(responses, list):
+                return {r.get('id'): r for r in responses if isinstance(r, dict)}
+            logger.warning("Odoo rejected JSON-RPC batch request, falling back to sequential calls")
+            self.batch_enabled = False
+
+        return {p['id']: self._post(endpoint, p, is_idempotent(p['params'])) for p in payloads}
+
+    def _execute_kw_params(self, model: str, method: str, args: List,
+                           kwargs: Optional[Dict] = None) -> Dict[str, Any]:
+        """Build params for an object.execute_kw call."""
+        call_args = [self.db, self.uid, self.password, model, method, args]
+        if kwargs is not None:
+            call_args.append(kwargs)
+        return {
+            'service': 'object',
+            'method': 'execute_kw',
+            'args': call_args
+        }
+
+    def _execute_kw(self, model: str, method: str, args: List,
+                    kwargs: Optional[Dict] = None) -> Any:
+        """
+        Call a model method through object.execute_kw.
+
+        search_read results are served from the read cache when fresh;
+        writes invalidate the cached reads of the model they touch. While
+        Odoo is unreachable, a read falls back to its last cached result.
+        Identical reads already in flight are joined rather than resent.
+        """
+        cache_key = self._cache_key(model, method, args, kwargs)
+        if cache_key is not None:
+            hit, value = self.cache.get(cache_key)
+            if hit:
+                self.metrics.record_cache_hit(f"{model}.{method}")
+                return value
+
+        flight_key = self._flight_key(model, method, args, kwargs)
+        if flight_key is not None:
+            return self.inflight.do(flight_key, lambda: self._fetch(model, method, args, kwargs, cache_key))
+        return self._fetch(model, method, args, kwargs, cache_key)
+
+    def _fetch(self, model: str, method: str, args: List, kwargs: Optional[Dict],
+               cache_key: Optional[Tuple]) -> Any:
+        """Send one execute_kw call, falling back to a stale cached read if Odoo is down."""
+        generation = self._cache_generation(model, cache_key)
+        try:
+            result = self._json_rpc_call('/jsonrpc', 'call', self._execute_kw_params(model, method, args, kwargs))
+        except OdooUnavailableError as e:
+            if method in self.WRITE_METHODS and not isinstance(e, CircuitOpenError):
+                # The write may have been applied before the connection failed
+                self._after_call(model, method, None, None)
+            hit, value = self._stale_read(cache_key, e)
+            if hit:
+                return value
+            raise
+        self._after_call(model, method, cache_key, result, generation)
+        return result
+
+    def _flight_key(self, model: str, method: str, args: List,
+                    kwargs: Optional[Dict] = None) -> Optional[Tuple]:
+        """Get the request coalescing key for a call, or None if it must not be shared."""
+        if self.inflight is None or method not in IDEMPOTENT_METHODS:
+            return None
+        # A read issued after a write must not join a flight sent before it
+        return SingleFlight.make_key(model, method, args, kwargs, self._write_generation(model))
+
+    def _stale_read(self, cache_key: Optional[Tuple], error: Exception) -> Tuple[bool, Any]:
+        """Look up the last cached result for a read Odoo could not answer."""
+        if cache_key is None:
+            return False, None
+        hit, value = self.cache.get_stale(cache_key)
+        if hit:
+            self.resilience.served_stale()
+            logger.warning(f"Serving stale {cache_key[0]} read: {error}")
+        return hit, value
+
+    WRITE_METHODS = ('create', 'write', 'unlink')
+
+    @staticmethod
+    def _count_query(query: Tuple[str, str, List, Dict]) -> Tuple[str, str, List, Optional[Dict]]:
+        """Build the search_count call matching a search_read query's domain."""
+        model, _, args, _ = query
+        return (model, 'search_count', args, None)
+
+    def _cache_key(self, model: str, method: str, args: List,
+                   kwargs: Optional[Dict] = None) -> Optional[Tuple]:
+        """Get the read cache key for a call, or None if it is not cacheable."""
+        if self.cache is None or method not in ('search_read', 'search_count', 'read_group'):
+            return None
+        kwargs = kwargs or {}
+        fields = kwargs.get('fields')
+        if method == 'search_count':
+            fields = [method]
+        elif method == 'read_group':
+            fields = [method, fields, kwargs.get('groupby'), kwargs.get('lazy', True)]
+        return OdooReadCache.make_key(
+            model, args[0] if args else [], fields,
+            kwargs.get('limit'), kwargs.get('offset', 0), kwargs.get('order')
+        )
+
+    def _write_generation(self, model: str) -> int:
+        """Count of writes seen for a model (its cache generation when the cache is on)."""
+        if self.cache is not None:
+            return self.cache.generation(model)
+        return self._write_generations.get(model, 0)
+
+    def _cache_generation(self, model: str, cache_key: Optional[Tuple]) -> Optional[int]:
+        """Get the model's cache generation before a cacheable read is sent (None if not cacheable)."""
+        return self.cache.generation(model) if cache_key is not None else None
+
+    def _after_call(self, model: str, method: str, cache_key: Optional[Tuple], result: Any,
+                    generation: Optional[int] = None):
+        """
+        Store a fresh read result, or invalidate cached/synced copies after a write.
+
+        A read whose model was invalidated while it was in flight (its
+        generation is out of date) is not stored: it may predate the write.
+        """
+        if method in self.WRITE_METHODS:
+            if self.cache is not None:
+                self.cache.invalidate(model)
+            else:
+                with self._generation_lock:
+                    self._write_generations[model] = self._write_generations.get(model, 0) + 1
+            if self.sync is not None:
+                self.sync.mark_stale(model)
+        elif cache_key is not None:
+            self.cache.put(cache_key, result, generation)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get read cache hit/miss counters."""
+        if self.cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.cache.stats()}
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Get request coalescing counters (calls_saved = reads that joined an in-flight call)."""
+        if self.inflight is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.inflight.stats()}
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Get retry, circuit breaker and stale-read counters."""
+        return self.resilience.stats()
+
+    def rpc_stats(self) -> Dict[str, Any]:
+        """
+        Get per model/method and per tool call statistics.
+
+        Returns:
+            Counts, latency histograms, bytes, errors and cache hits
+            (see odoo_metrics), slowest first, plus the cache, coalescing
+            and resilience counters
+        """
+        return {
+            **self.metrics.snapshot(),
+            'mode': self.mode,
+            'cache': self.cache_stats(),
+            'coalescing': self.coalescing_stats(),
+            'resilience': self.resilience_stats(),
+        }
+
+    def _fanout_pool(self) -> ThreadPoolExecutor:
+        """Get the worker pool shared by every fan_out() call, creating it on first use."""
+        with self._fanout_lock:
+            if self._fanout_executor is None:
+                self._fanout_executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                           thread_name_prefix='odoo-fanout')
+            return self._fanout_executor
+
+    def fan_out(self, tasks: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run independent Odoo reads concurrently with bounded concurrency.
+
+        All calls share one pool of max_concurrency workers, so concurrent
+        callers together never run more than that many reads. A fan_out()
+        from inside a task (e.g. get_financial_summary run by
+        execute_tools(parallel=True)) queues its tasks on the same pool and
+        runs any that no free worker has picked up itself, so nesting
+        neither exceeds the limit nor deadlocks waiting for a worker.
+
+        Each task is isolated: an exception becomes that task's
+        {'success': False, 'error': ...} result instead of failing the rest.
+
+        Args:
+            tasks: Mapping of name to zero-argument callable returning a result dict
+
+        Returns:
+            Results keyed by task name
+        """
+        def run(task):
+            try:
+                return task()
+            except Exception as e:
+                return {'success': False, 'error': str(e)}
+
+        def run_in_worker(task):
+            self._fanout_worker.active = True
+            return run(task)
+
+        # Sandbox reads are in-memory, threads would only add overhead
+        if self.mode == "sandbox" or self.max_concurrency <= 1 or len(tasks) <= 1:
+            return {name: run(task) for name, task in tasks.items()}
+
+        futures = {name: self._fanout_pool().submit(run_in_worker, task) for name, task in tasks.items()}
+        if getattr(self._fanout_worker, 'active', False):
+            # This thread holds a worker slot: use it rather than block on the queue
+            return {name: run(tasks[name]) if future.cancel() else future.result()
+                    for name, future in futures.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    @contextmanager
+    def batch(self):
+        """
+        Queue execute_kw calls and send them as a single JSON-RPC batch.
+
+        The batch is sent when the with-block exits without an exception.
+        """
+        batch = OdooBatch(self)
+        yield batch
+        batch.send()
+
+    def attach_sync(self, engine: OdooSyncEngine):
+        """Serve read methods from engine's local copy (production mode)."""
+        self.sync = engine
+
+    def _local_select(self, model: str, filters: List, order: str = None,
+                      limit: int = None, offset: int = 0) -> Optional[Tuple[List[Dict], int]]:
+        """
+        Query the synced local copy, refreshing it incrementally if stale.
+
+        Returns:
+            (rows, total), or None when there is no usable local copy
+        """
+        if self.sync is None or self.mode != "production":
+            return None
+        self.sync.ensure_fresh(model)
+        if self.sync.age(model) is None:
+            return None  # Never synced successfully, fall back to RPC
+        return self.sync.store.select(model, filters, order=order, limit=limit, offset=offset)
+
+    @staticmethod
+    def _sort_order(sorts: Dict[str, Tuple[str, str]], order: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Translate a 'key' or 'key desc' sort into Odoo and sandbox order strings.
+
+        Raises:
+            ValueError: Unknown sort key
+        """
+        if not order:
+            return None, None
+        key, _, direction = order.strip().partition(' ')
+        if key not in sorts:
+            raise ValueError(f"Unknown sort {key!r}, expected one of {', '.join(sorts)}")
+        suffix = ' desc' if direction.strip().lower() == 'desc' else ' asc'
+        odoo_field, sandbox_column = sorts[key]
+        return f"{odoo_field}{suffix}", f"{sandbox_column}{suffix}"
+
+    @staticmethod
+    def _local_sortable(model: str, order: Optional[str]) -> bool:
+        """Whether the local copy can apply an Odoo order (it only has the mirrored columns)."""
+        if not order:
+            return True
+        field = order.split()[0]
+        if field.endswith('_id'):
+            return False  # Odoo sorts many2one fields by name; the copy only has the id
+        return field == 'id' or field in MIRROR_TABLES[model][1]
+
+    def _local_meta(self, model: str) -> Dict[str, Any]:
+        """Staleness indicator added to results served from the local copy."""
+        age = self.sync.age(model)
+        return {
+            'source': 'local',
+            'synced_age_seconds': round(age, 1) if age is not None else None,
+            'stale': age is None or age > self.sync.max_age,
+        }
+
+    def sync_local_mirror(self, models: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Explicitly refresh the local copy from Odoo.
+
+        Returns:
+            Per-model sync counts and current staleness status
+        """
+        if self.sync is None:
+            return {
+                'success': False,
+                'error': 'Local mirror not enabled (set ODOO_LOCAL_MIRROR)'
+            }
+        results = self.sync.sync(models)
+        return {
+            'success': not any('error' in r for r in results.values()),
+            'results': results,
+            'status': self.sync.status()
+        }
+
     def authenticate(self) -> Dict[str, Any]:
         """
         Authenticate with Odoo server.
@@ -280,74 +976,198 @@ class OdooMCPServer:
                 'message': f'Authentication error: {str(e)}'
             }
 
-    def get_invoices(self, state: str = None, limit: int = 10) -> Dict[str, Any]:
+    def get_invoices(self, state: str = None, limit: int = 10, output: str = 'dicts',
+                     offset: int = 0, order: str = None, search: str = None) -> Dict[str, Any]:
         """
         Get customer invoices from Odoo.
 
+        Paging, sorting and the customer search run in Odoo (or the sandbox
+        table), so a table page costs one page of rows however large the
+        ledger is.
+
         Args:
             state: Filter by state ('draft', 'posted', 'paid', 'cancel')
             limit: Maximum number of invoices to return
+            output: 'dicts' (raw rows), 'records' (Invoice tuples) or
+                    'columns' (parallel lists per Invoice field)
+            offset: Matching invoices to skip
+            order: INVOICE_SORTS key, optionally suffixed with ' desc'
+            search: Case-insensitive substring of the customer name
 
         Returns:
-            List of invoices with details
+            List of invoices with details; total_count counts all matches
         """
-        if self.mode == "sandbox":
-            invoices = self.invoices
-            if state:
-                if state == 'paid':
-                    invoices = [i for i in invoices if i['payment_state'] == 'paid']
-                elif state == 'unpaid':
-                    invoices = [i for i in invoices if i['payment_state'] in ('not_paid', 'partial')]
-                else:
-                    invoices = [i for i in invoices if i['state'] == state]
+        try:
+            odoo_order, sandbox_order = self._sort_order(INVOICE_SORTS, order)
 
-            return {
-                'success': True,
-                'invoices': invoices[:limit],
-                'total_count': len(invoices),
-                'mode': 'sandbox'
-            }
+            if self.mode == "sandbox":
+                filters = self._sandbox_invoice_filters(state)
+                if search:
+                    filters.append(('partner_name', 'ilike', search))
+                invoices, total = self._sandbox_select(self.invoices, Invoice, filters, limit, output,
+                                                       order=sandbox_order, offset=offset)
 
-        # Production: call Odoo API
-        try:
-            domain = [('move_type', '=', 'out_invoice')]
-            if state:
-                if state == 'unpaid':
-                    domain.append(('payment_state', 'in', ['not_paid', 'partial']))
-                elif state == 'paid':
-                    domain.append(('payment_state', '=', 'paid'))
-                else:
-                    domain.append(('state', '=', state))
-
-            result = self._json_rpc_call(
-                '/jsonrpc',
-                'call',
-                {
-                    'service': 'object',
-                    'method': 'execute_kw',
-                    'args': [
-                        self.db, self.uid, self.password,
-                        'account.move', 'search_read',
-                        [domain],
-                        {'fields': ['name', 'partner_id', 'invoice_date', 'amount_total',
-                                   'amount_residual', 'state', 'payment_state'],
-                         'limit': limit}
-                    ]
+                return {
+                    'success': True,
+                    'invoices': invoices,
+                    'total_count': total,
+                    'mode': 'sandbox'
                 }
-            )
 
-            return {
-                'success': True,
-                'invoices': result,
-                'total_count': len(result),
-                'mode': 'production'
-            }
+            # Production: call Odoo API (or the synced local copy)
+            local = self._local_invoices(state, limit, offset, odoo_order, search, output)
+            if local is not None:
+                return local
+
+            # Page and real total in one round trip
+            query = self._invoices_query(state, limit, offset, odoo_order, search)
+            with self.batch() as batch:
+                rows = batch.execute_kw(*query)
+                count = batch.execute_kw(*self._count_query(query))
+            return self._invoices_response(rows.result, count.result, output)
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
 
+    def _local_invoices(self, state: Optional[str], limit: int, offset: int, odoo_order: Optional[str],
+                        search: Optional[str], output: str) -> Optional[Dict[str, Any]]:
+        """get_invoices served from the local copy, or None when it cannot answer."""
+        # The local copy has no customer names to search, nor every sortable column
+        if search or not self._local_sortable('account.move', odoo_order):
+            return None
+        filters = []
+        if state == 'paid':
+            filters.append(('payment_state', '=', 'paid'))
+        elif state == 'unpaid':
+            filters.append(('payment_state', 'in', ('not_paid', 'partial')))
+        elif state:
+            filters.append(('state', '=', state))
+        local = self._local_select('account.move', filters, order=odoo_order or 'invoice_date desc',
+                                   limit=limit, offset=offset)
+        if local is None:
+            return None
+        rows, total = local
+        return {**self._invoices_response(rows, total, output), **self._local_meta('account.move')}
+
+    def _sandbox_select(self, table: ColumnarTable, record_type, filters: Optional[List] = None,
+                        limit: int = None, output: str = 'dicts', order: str = None,
+                        offset: int = 0) -> Tuple[Any, int]:
+        """
+        Select sandbox rows in the requested output shape.
+
+        Records and columns are read straight from the table columns,
+        without building a dict per row.
+
+        Returns:
+            (rows in the output shape, total matching count)
+        """
+        if output not in OUTPUTS:
+            raise ValueError(f"Unknown output {output!r}, expected one of {', '.join(OUTPUTS)}")
+        if output == 'dicts':
+            return table.select(filters, order=order, limit=limit, offset=offset)
+
+        positions, total = table.page(filters, order=order, limit=limit, offset=offset)
+        columns = {field: table.column(field, positions) for field in record_type._fields}
+        if output == 'columns':
+            return columns, total
+        return [record_type._make(values) for values in zip(*columns.values())], total
+
+    def _sandbox_invoice_filters(self, state: str = None) -> List[Tuple[str, str, Any]]:
+        """Sandbox table filters equivalent to the production domain."""
+        if state == 'paid':
+            return [('payment_state', '=', 'paid')]
+        if state == 'unpaid':
+            return [('payment_state', 'in', ('not_paid', 'partial'))]
+        if state:
+            return [('state', '=', state)]
+        return []
+
+    def iter_invoices(self, state: str = None, page_size: int = 200, stream: bool = False) -> Iterator[Dict]:
+        """
+        Stream customer invoices page by page in constant memory.
+
+        Args:
+            state: Filter by state, as in get_invoices
+            page_size: Records fetched per round trip
+            stream: Fetch everything in one search_read and decode records
+                    as the response arrives, instead of paging (production)
+
+        Yields:
+            Invoice records in id order
+        """
+        if self.mode == "sandbox":
+            positions = self.invoices.positions(self._sandbox_invoice_filters(state))
+            for start in range(0, len(positions), page_size):
+                yield from self.invoices.rows(positions[start:start + page_size])
+            return
+
+        model, _, args, kwargs = self._invoices_query(state)
+        if stream:
+            yield from self._stream_search_read(model, args[0], kwargs['fields'])
+            return
+        yield from self._iter_search_read(model, args[0], kwargs['fields'], page_size)
+
+    def _iter_search_read(self, model: str, domain: List, fields: List[str],
+                          page_size: int) -> Iterator[Dict]:
+        """
+        Page through a search_read with an id cursor.
+
+        Unlike offset paging, records created while iterating cannot shift
+        later pages. Pages bypass the read cache.
+        """
+        last_id = 0
+        while True:
+            page = self._json_rpc_call('/jsonrpc', 'call', self._execute_kw_params(
+                model, 'search_read', [domain + [('id', '>', last_id)]],
+                {'fields': fields, 'order': 'id asc', 'limit': page_size}
+            ))
+            yield from page
+            if len(page) < page_size:
+                return
+            last_id = page[-1]['id']
+
+    def _stream_search_read(self, model: str, domain: List, fields: List[str]) -> Iterator[Dict]:
+        """One unpaged search_read in id order, decoded incrementally. Bypasses the read cache."""
+        return self._json_rpc_stream('/jsonrpc', 'call', self._execute_kw_params(
+            model, 'search_read', [domain], {'fields': fields, 'order': 'id asc'}
+        ))
+
+    def _invoices_query(self, state: str = None, limit: int = 10, offset: int = 0,
+                        order: str = None, search: str = None) -> Tuple[str, str, List, Dict]:
+        """Build the execute_kw call for get_invoices (order is an Odoo order string)."""
+        domain = [('move_type', '=', 'out_invoice')]
+        if state:
+            if state == 'unpaid':
+                domain.append(('payment_state', 'in', ['not_paid', 'partial']))
+            elif state == 'paid':
+                domain.append(('payment_state', '=', 'paid'))
+            else:
+                domain.append(('state', '=', state))
+        if search:
+            domain.append(('partner_id', 'ilike', search))
+
+        kwargs = {'fields': ['name', 'partner_id', 'invoice_date', 'invoice_date_due', 'amount_total',
+                             'amount_residual', 'state', 'payment_state'],
+                  'limit': limit}
+        if offset:
+            kwargs['offset'] = offset
+        if order:
+            # id as tie-breaker keeps pages stable when many rows share a value
+            kwargs['order'] = f"{order}, id"
+        return ('account.move', 'search_read', [domain], kwargs)
+
+    def _invoices_response(self, result: List[Dict], total_count: int = None,
+                           output: str = 'dicts') -> Dict[str, Any]:
+        """Shape search_read rows (and optional search_count) into the get_invoices result."""
+        return {
+            'success': True,
+            'invoices': shape(Invoice, result, output),
+            'total_count': len(result) if total_count is None else total_count,
+            'mode': 'production'
+        }
+
     def create_invoice(self, partner_id: int, lines: List[Dict],
                        invoice_date: str = None) -> Dict[str, Any]:
         """
@@ -365,76 +1185,30 @@ class OdooMCPServer:
             invoice_date = datetime.now().strftime('%Y-%m-%d')
 
         if self.mode == "sandbox":
-            # Generate new invoice in sandbox
-            new_id = max(i['id'] for i in self.invoices) + 1
-            invoice_num = f"INV/2026/{new_id - 1000:04d}"
-
             # Find partner
-            partner = next((p for p in self.partners if p['id'] == partner_id), None)
+            partner = self.partners.get(partner_id)
             if not partner:
                 return {
                     'success': False,
                     'error': f'Partner ID {partner_id} not found'
                 }
 
-            # Calculate total
-            total = sum(line.get('quantity', 1) * line.get('price', 0) for line in lines)
-
-            # Due date = invoice date + 30 days
-            inv_date = datetime.strptime(invoice_date, '%Y-%m-%d')
-            due_date = (inv_date + timedelta(days=30)).strftime('%Y-%m-%d')
-
-            new_invoice = {
-                'id': new_id,
-                'name': invoice_num,
-                'partner_id': partner_id,
-                'partner_name': partner['name'],
-                'invoice_date': invoice_date,
-                'due_date': due_date,
-                'amount_total': total,
-                'amount_residual': total,
-                'state': 'draft',
-                'payment_state': 'not_paid',
-                'lines': lines
-            }
-
-            self.invoices.append(new_invoice)
+            new_invoice = self.invoices.insert(
+                self._sandbox_invoice(self.invoices.next_id(), partner, lines, invoice_date)
+            )
 
             return {
                 'success': True,
                 'invoice': new_invoice,
-                'message': f'Invoice {invoice_num} created successfully',
+                'message': f"Invoice {new_invoice['name']} created successfully",
                 'mode': 'sandbox'
             }
 
         # Production: create invoice via Odoo API
         try:
-            # Prepare invoice lines for Odoo
-            invoice_lines = []
-            for line in lines:
-                invoice_lines.append((0, 0, {
-                    'name': line.get('product', 'Service'),
-                    'quantity': line.get('quantity', 1),
-                    'price_unit': line.get('price', 0),
-                }))
-
-            invoice_id = self._json_rpc_call(
-                '/jsonrpc',
-                'call',
-                {
-                    'service': 'object',
-                    'method': 'execute_kw',
-                    'args': [
-                        self.db, self.uid, self.password,
-                        'account.move', 'create',
-                        [{
-                            'move_type': 'out_invoice',
-                            'partner_id': partner_id,
-                            'invoice_date': invoice_date,
-                            'invoice_line_ids': invoice_lines,
-                        }]
-                    ]
-                }
+            invoice_id = self._execute_kw(
+                'account.move', 'create',
+                [self._invoice_vals(partner_id, lines, invoice_date)]
             )
 
             return {
@@ -449,71 +1223,208 @@ class OdooMCPServer:
                 'error': str(e)
             }
 
-    def get_payments(self, days: int = 30) -> Dict[str, Any]:
+    # Invoices per multi-record create call in create_invoices_bulk()
+    BULK_CHUNK_SIZE = 100
+
+    def create_invoices_bulk(self, specs: List[Dict], chunk_size: int = None) -> Dict[str, Any]:
         """
-        Get recent payments from Odoo.
+        Create many customer invoices with one create call per chunk.
+
+        Each chunk is a single account.move create with a list of vals. Odoo
+        creates a chunk atomically, so when it rejects one (a JSON-RPC error)
+        its invoices are retried one by one to pin the failure on the
+        offending spec. A chunk that failed without an answer (timeout,
+        connection error) may have been created and is never resent: its
+        items fail with outcome_unknown set.
 
         Args:
-            days: Number of days to look back
+            specs: Invoice specs [{'partner_id': int, 'lines': [...], 'invoice_date': str}]
+            chunk_size: Invoices per create call, defaults to BULK_CHUNK_SIZE
 
         Returns:
-            List of payments with details
+            Per-item results in input order plus created/failed counts
         """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        today = datetime.now().strftime('%Y-%m-%d')
+        results: List[Optional[Dict]] = [None] * len(specs)
+
+        valid = []
+        for index, spec in enumerate(specs):
+            if not spec.get('partner_id'):
+                results[index] = {'index': index, 'success': False, 'error': 'partner_id is required'}
+            elif not spec.get('lines'):
+                results[index] = {'index': index, 'success': False, 'error': 'At least one invoice line is required'}
+            else:
+                valid.append((index, spec['partner_id'], spec['lines'], spec.get('invoice_date') or today))
+
         if self.mode == "sandbox":
-            # Filter payments by date
-            cutoff = datetime.now() - timedelta(days=days)
-            cutoff_str = cutoff.strftime('%Y-%m-%d')
+            for start in range(0, len(valid), chunk_size):
+                created = []
+                for index, partner_id, lines, invoice_date in valid[start:start + chunk_size]:
+                    partner = self.partners.get(partner_id)
+                    if not partner:
+                        results[index] = {'index': index, 'success': False,
+                                          'error': f'Partner ID {partner_id} not found'}
+                        continue
+                    invoice = self._sandbox_invoice(self.invoices.next_id(), partner, lines, invoice_date)
+                    created.append(invoice)
+                    results[index] = {'index': index, 'success': True,
+                                      'invoice_id': invoice['id'], 'name': invoice['name']}
+                self.invoices.extend(created)
+        else:
+            for start in range(0, len(valid), chunk_size):
+                chunk = valid[start:start + chunk_size]
+                vals = [self._invoice_vals(partner_id, lines, invoice_date)
+                        for _, partner_id, lines, invoice_date in chunk]
+                try:
+                    ids = self._execute_kw('account.move', 'create', [vals])
+                    for (index, *_), invoice_id in zip(chunk, ids):
+                        results[index] = {'index': index, 'success': True, 'invoice_id': invoice_id}
+                except OdooRPCError as e:
+                    # Odoo rejected the chunk and rolled it back: find the offending invoices
+                    logger.warning(f"Bulk invoice chunk failed ({e}), retrying {len(chunk)} invoices individually")
+                    for (index, *_), invoice_vals in zip(chunk, vals):
+                        try:
+                            invoice_id = self._execute_kw('account.move', 'create', [invoice_vals])
+                            results[index] = {'index': index, 'success': True, 'invoice_id': invoice_id}
+                        except Exception as item_error:
+                            results[index] = self._bulk_failure(index, item_error)
+                except Exception as e:
+                    # Timeout or lost connection: Odoo may have created the whole
+                    # chunk, so resending it could duplicate every invoice in it
+                    logger.error(f"Bulk invoice chunk of {len(chunk)} failed without an Odoo answer ({e}), not retried")
+                    for index, *_ in chunk:
+                        results[index] = self._bulk_failure(index, e)
+
+        created_count = sum(1 for r in results if r['success'])
+        return {
+            'success': created_count == len(specs),
+            'created': created_count,
+            'failed': len(specs) - created_count,
+            'results': results,
+            'mode': self.mode
+        }
 
-            recent_payments = [
-                p for p in self.payments
-                if p['payment_date'] >= cutoff_str
-            ]
+    @staticmethod
+    def _bulk_failure(index: int, error: Exception) -> Dict[str, Any]:
+        """Per-item result for a failed bulk create, flagging creates that may have gone through."""
+        if isinstance(error, (OdooRPCError, CircuitOpenError)):
+            return {'index': index, 'success': False, 'error': str(error)}
+        return {'index': index, 'success': False, 'outcome_unknown': True,
+                'error': f'Outcome unknown, check Odoo before resending: {error}'}
+
+    def _sandbox_invoice(self, invoice_id: int, partner: Dict, lines: List[Dict],
+                         invoice_date: str) -> Dict[str, Any]:
+        """Build a draft sandbox invoice record."""
+        total = sum(line.get('quantity', 1) * line.get('price', 0) for line in lines)
+
+        # Due date = invoice date + 30 days
+        inv_date = datetime.strptime(invoice_date, '%Y-%m-%d')
+        due_date = (inv_date + timedelta(days=30)).strftime('%Y-%m-%d')
+
+        return {
+            'id': invoice_id,
+            'name': f"INV/2026/{invoice_id - 1000:04d}",
+            'partner_id': partner['id'],
+            'partner_name': partner['name'],
+            'invoice_date': invoice_date,
+            'due_date': due_date,
+            'amount_total': total,
+            'amount_residual': total,
+            'state': 'draft',
+            'payment_state': 'not_paid',
+            'lines': lines
+        }
 
-            total_received = sum(p['amount'] for p in recent_payments if p['payment_type'] == 'inbound')
+    def _invoice_vals(self, partner_id: int, lines: List[Dict], invoice_date: str) -> Dict[str, Any]:
+        """Build account.move create values for a customer invoice."""
+        # Prepare invoice lines for Odoo
+        invoice_lines = []
+        for line in lines:
+            invoice_lines.append((0, 0, {
+                'name': line.get('product', 'Service'),
+                'quantity': line.get('quantity', 1),
+                'price_unit': line.get('price', 0),
+            }))
+
+        return {
+            'move_type': 'out_invoice',
+            'partner_id': partner_id,
+            'invoice_date': invoice_date,
+            'invoice_line_ids': invoice_lines,
+        }
 
-            return {
-                'success': True,
-                'payments': recent_payments,
-                'total_received': total_received,
-                'period_days': days,
-                'mode': 'sandbox'
-            }
+    def get_payments(self, days: int = 30, output: str = 'dicts') -> Dict[str, Any]:
+        """
+        Get recent payments from Odoo.
 
-        # Production: query Odoo
+        Args:
+            days: Number of days to look back
+            output: 'dicts', 'records' (Payment tuples) or 'columns'
+
+        Returns:
+            List of payments with details
+        """
         try:
-            cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            if self.mode == "sandbox":
+                # Filter payments by date
+                cutoff = datetime.now() - timedelta(days=days)
+                cutoff_str = cutoff.strftime('%Y-%m-%d')
 
-            result = self._json_rpc_call(
-                '/jsonrpc',
-                'call',
-                {
-                    'service': 'object',
-                    'method': 'execute_kw',
-                    'args': [
-                        self.db, self.uid, self.password,
-                        'account.payment', 'search_read',
-                        [[('payment_date', '>=', cutoff), ('state', '=', 'posted')]],
-                        {'fields': ['name', 'partner_id', 'payment_date', 'amount',
-                                   'payment_type', 'state', 'ref']}
-                    ]
+                recent = [('payment_date', '>=', cutoff_str)]
+                recent_payments, _ = self._sandbox_select(self.payments, Payment, recent, output=output)
+
+                total_received = self.payments.sum('amount', recent + [('payment_type', '=', 'inbound')])
+
+                return {
+                    'success': True,
+                    'payments': recent_payments,
+                    'total_received': total_received,
+                    'period_days': days,
+                    'mode': 'sandbox'
                 }
-            )
 
-            total_received = sum(p['amount'] for p in result if p['payment_type'] == 'inbound')
+            # Production: query Odoo (or the synced local copy)
+            local = self._local_payments(days, output)
+            if local is not None:
+                return local
 
-            return {
-                'success': True,
-                'payments': result,
-                'total_received': total_received,
-                'period_days': days,
-                'mode': 'production'
-            }
+            result = self._execute_kw(*self._payments_query(days))
+            return self._payments_response(result, days, output)
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
 
+    def _local_payments(self, days: int, output: str) -> Optional[Dict[str, Any]]:
+        """get_payments served from the local copy, or None when there is none."""
+        cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        local = self._local_select('account.payment', [('payment_date', '>=', cutoff)])
+        if local is None:
+            return None
+        return {**self._payments_response(local[0], days, output), **self._local_meta('account.payment')}
+
+    def _payments_query(self, days: int = 30) -> Tuple[str, str, List, Dict]:
+        """Build the execute_kw call for get_payments."""
+        cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        return ('account.payment', 'search_read',
+                [[('payment_date', '>=', cutoff), ('state', '=', 'posted')]],
+                {'fields': ['name', 'partner_id', 'payment_date', 'amount',
+                            'payment_type', 'state', 'ref']})
+
+    def _payments_response(self, result: List[Dict], days: int, output: str = 'dicts') -> Dict[str, Any]:
+        """Shape search_read rows into the get_payments result."""
+        total_received = sum(p['amount'] for p in result if p['payment_type'] == 'inbound')
+
+        return {
+            'success': True,
+            'payments': shape(Payment, result, output),
+            'total_received': total_received,
+            'period_days': days,
+            'mode': 'production'
+        }
+
     def get_account_balances(self) -> Dict[str, Any]:
         """
         Get account balances from Odoo.
@@ -522,40 +1433,155 @@ class OdooMCPServer:
             Account balances and totals
         """
         if self.mode == "sandbox":
-            assets = sum(a['balance'] for a in self.accounts if a['type'] == 'asset')
-            liabilities = abs(sum(a['balance'] for a in self.accounts if a['type'] == 'liability'))
+            by_type = {g['type']: g['balance'] for g in self.accounts.aggregate(['type'], ['balance'])}
+            assets = by_type.get('asset', 0)
+            liabilities = abs(by_type.get('liability', 0))
 
             return {
                 'success': True,
-                'accounts': self.accounts,
+                'accounts': self.accounts.select()[0],
                 'total_assets': assets,
                 'total_liabilities': liabilities,
                 'net_position': assets - liabilities,
                 'mode': 'sandbox'
             }
 
-        # Production: query Odoo account balances
+        # Production: query Odoo account balances (or the synced local copy)
         try:
-            result = self._json_rpc_call(
-                '/jsonrpc',
-                'call',
-                {
-                    'service': 'object',
-                    'method': 'execute_kw',
-                    'args': [
-                        self.db, self.uid, self.password,
-                        'account.account', 'search_read',
-                        [[('account_type', 'in', ['asset_current', 'liability_current'])]],
-                        {'fields': ['name', 'code', 'current_balance', 'account_type']}
-                    ]
-                }
-            )
+            local = self._local_balances()
+            if local is not None:
+                return local
 
+            result = self._execute_kw(*self._balances_query())
+            return self._balances_response(result)
+        except Exception as e:
             return {
-                'success': True,
-                'accounts': result,
-                'mode': 'production'
+                'success': False,
+                'error': str(e)
             }
+
+    def _local_balances(self) -> Optional[Dict[str, Any]]:
+        """get_account_balances served from the local copy, or None when there is none."""
+        local = self._local_select('account.account', [])
+        if local is None:
+            return None
+        return {**self._balances_response(local[0]), **self._local_meta('account.account')}
+
+    def _balances_query(self) -> Tuple[str, str, List, Dict]:
+        """Build the execute_kw call for get_account_balances."""
+        return ('account.account', 'search_read',
+                [[('account_type', 'in', ['asset_current', 'liability_current'])]],
+                {'fields': ['name', 'code', 'current_balance', 'account_type']})
+
+    def _balances_response(self, result: List[Dict]) -> Dict[str, Any]:
+        """Shape search_read rows into the get_account_balances result."""
+        assets = sum(a.get('current_balance') or 0 for a in result
+                     if str(a.get('account_type', '')).startswith('asset'))
+        liabilities = abs(sum(a.get('current_balance') or 0 for a in result
+                              if str(a.get('account_type', '')).startswith('liability')))
+
+        return {
+            'success': True,
+            'accounts': result,
+            'total_assets': assets,
+            'total_liabilities': liabilities,
+            'net_position': assets - liabilities,
+            'mode': 'production'
+        }
+
+    def _invoice_groups_query(self, move_type: str = 'out_invoice', days: Optional[int] = None,
+                              cancelled: bool = False) -> Tuple[str, str, List, Dict]:
+        """Build a read_group call totalling invoices/bills per (state, payment_state), optionally for the last days."""
+        domain = [('move_type', '=', move_type)]
+        if not cancelled:
+            domain.append(('state', '!=', 'cancel'))
+        if days is not None:
+            domain.append(('invoice_date', '>=', (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')))
+        return ('account.move', 'read_group',
+                [domain],
+                {'fields': ['amount_total:sum', 'amount_residual:sum'],
+                 'groupby': ['state', 'payment_state'],
+                 'lazy': False})
+
+    def _payment_groups_query(self, days: int = 30) -> Tuple[str, str, List, Dict]:
+        """Build a read_group call totalling posted payments per direction."""
+        cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        return ('account.payment', 'read_group',
+                [[('payment_date', '>=', cutoff), ('state', '=', 'posted')]],
+                {'fields': ['amount:sum'],
+                 'groupby': ['payment_type'],
+                 'lazy': False})
+
+    def _read_groups(self, query: Tuple[str, str, List, Dict]) -> Dict[str, Any]:
+        """Run a read_group aggregation in Odoo; only the group rows cross the wire."""
+        return {
+            'success': True,
+            'groups': self._execute_kw(*query)
+        }
+
+    def _sandbox_invoice_groups(self) -> List[Dict]:
+        """Aggregate sandbox invoices into read_group-shaped rows."""
+        return self.invoices.aggregate(['state', 'payment_state'], ['amount_total', 'amount_residual'])
+
+    @staticmethod
+    def _invoice_group_totals(groups: List[Dict]) -> Dict[str, Any]:
+        """
+        Reduce (state, payment_state) group rows to invoice totals and counts.
+
+        Returns:
+            Revenue totals, invoice counts and per-state breakdown
+        """
+        revenue = {'total_invoiced': 0, 'total_received': 0, 'outstanding': 0,
+                   'draft_invoices': 0, 'pending': 0, 'paid': 0}
+        counts = {'total_count': 0, 'paid_count': 0, 'unpaid_count': 0, 'pending_count': 0, 'by_state': {}}
+
+        for group in groups:
+            total = group.get('amount_total') or 0
+            residual = group.get('amount_residual') or 0
+            count = group.get('__count', 0)
+            state, payment_state = group.get('state'), group.get('payment_state')
+
+            revenue['total_invoiced'] += total
+            revenue['total_received'] += total - residual
+            if state == 'draft':
+                revenue['draft_invoices'] += total
+            else:
+                revenue['outstanding'] += residual
+            if state == 'posted' and payment_state != 'paid':
+                revenue['pending'] += total
+                counts['pending_count'] += count
+
+            counts['total_count'] += count
+            if payment_state == 'paid':
+                revenue['paid'] += total
+                counts['paid_count'] += count
+            elif payment_state in ('not_paid', 'partial'):
+                counts['unpaid_count'] += count
+
+            bucket = counts['by_state'].setdefault(state, {'count': 0, 'amount_total': 0, 'amount_residual': 0})
+            bucket['count'] += count
+            bucket['amount_total'] += total
+            bucket['amount_residual'] += residual
+
+        return {'revenue': revenue, 'invoices': counts}
+
+    def get_invoice_totals(self) -> Dict[str, Any]:
+        """
+        Get customer invoice counts and totals over the whole ledger.
+
+        Aggregated by Odoo with read_group (the sandbox aggregates its
+        columns) over the same invoices get_invoices lists, cancelled ones
+        included, so only the group rows cross the wire.
+
+        Returns:
+            Revenue totals and invoice counts (see _invoice_group_totals)
+        """
+        try:
+            if self.mode == "sandbox":
+                groups = self._sandbox_invoice_groups()
+            else:
+                groups = self._execute_kw(*self._invoice_groups_query(cancelled=True))
+            return {'success': True, **self._invoice_group_totals(groups), 'mode': self.mode}
         except Exception as e:
             return {
                 'success': False,
@@ -576,19 +1602,19 @@ class OdooMCPServer:
 
         if self.mode == "sandbox":
             # Calculate metrics from sandbox data
-            total_invoiced = sum(i['amount_total'] for i in self.invoices)
-            total_paid = sum(i['amount_total'] - i['amount_residual'] for i in self.invoices)
-            total_outstanding = sum(i['amount_residual'] for i in self.invoices if i['state'] != 'draft')
-            total_draft = sum(i['amount_total'] for i in self.invoices if i['state'] == 'draft')
+            invoice_totals = self._invoice_group_totals(self._sandbox_invoice_groups())
+            total_paid = invoice_totals['revenue']['total_received']
 
-            total_expenses = sum(e['amount_total'] for e in self.expenses)
-            pending_expenses = sum(e['amount_total'] for e in self.expenses if e['state'] == 'posted')
+            expenses_by_state = {g['state']: g['amount_total']
+                                 for g in self.expenses.aggregate(['state'], ['amount_total'])}
+            total_expenses = sum(expenses_by_state.values())
+            pending_expenses = expenses_by_state.get('posted', 0)
 
             # Get account balances
             balances = self.get_account_balances()
 
             revenue = total_paid
-            expenses_paid = sum(e['amount_total'] for e in self.expenses if e['state'] == 'paid')
+            expenses_paid = expenses_by_state.get('paid', 0)
             profit = revenue - expenses_paid
             profit_margin = (profit / revenue * 100) if revenue > 0 else 0
 
@@ -596,12 +1622,7 @@ class OdooMCPServer:
                 'success': True,
                 'period': period,
                 'generated_at': datetime.now().isoformat(),
-                'revenue': {
-                    'total_invoiced': total_invoiced,
-                    'total_received': total_paid,
-                    'outstanding': total_outstanding,
-                    'draft_invoices': total_draft
-                },
+                'revenue': invoice_totals['revenue'],
                 'expenses': {
                     'total': total_expenses,
                     'paid': expenses_paid,
@@ -616,88 +1637,191 @@ class OdooMCPServer:
                     'total_liabilities': balances['total_liabilities'],
                     'net_position': balances['net_position']
                 },
-                'invoices': {
-                    'total_count': len(self.invoices),
-                    'paid_count': len([i for i in self.invoices if i['payment_state'] == 'paid']),
-                    'unpaid_count': len([i for i in self.invoices if i['payment_state'] in ('not_paid', 'partial')])
-                },
+                'invoices': invoice_totals['invoices'],
                 'mode': 'sandbox'
             }
 
-        # Production: aggregate data from Odoo
+        # Production: totals computed in Odoo with read_group, reads issued concurrently
         try:
-            invoices = self.get_invoices(limit=100)
-            payments = self.get_payments(days=days)
-            balances = self.get_account_balances()
-
-            # Calculate summary from real data
-            return {
-                'success': True,
-                'period': period,
-                'generated_at': datetime.now().isoformat(),
-                'revenue': {
-                    'total_received': payments.get('total_received', 0),
-                    'invoice_count': invoices.get('total_count', 0)
-                },
-                'balances': balances,
-                'mode': 'production'
-            }
+            results = self.fan_out({
+                'invoices': lambda: self._read_groups(self._invoice_groups_query('out_invoice')),
+                # Bills for the same period as the payments they are netted against
+                'expenses': lambda: self._read_groups(self._invoice_groups_query('in_invoice', days)),
+                'payments': lambda: self._read_groups(self._payment_groups_query(days)),
+                'balances': lambda: self.get_account_balances(),
+            })
+            return self._summary_response(period, results)
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
 
-    def get_partners(self, is_customer: bool = True) -> Dict[str, Any]:
+    def _summary_response(self, period: str, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the production financial summary from its sub-call results.
+
+        Failed reads leave their fields at defaults and are reported under 'errors'.
+        """
+        errors = {name: r.get('error') for name, r in results.items() if not r.get('success')}
+
+        invoice_totals = self._invoice_group_totals(results['invoices'].get('groups', []))
+        expense_groups = results['expenses'].get('groups', [])
+        payment_groups = results['payments'].get('groups', [])
+        balances = results['balances']
+
+        # Revenue for the period is what was actually received; expenses are the period's bills
+        received = sum(g.get('amount') or 0 for g in payment_groups if g.get('payment_type') == 'inbound')
+        expenses_paid = sum(g.get('amount_total') or 0 for g in expense_groups if g.get('payment_state') == 'paid')
+        profit = received - expenses_paid
+        profit_margin = (profit / received * 100) if received > 0 else 0
+
+        summary = {
+            'success': len(errors) < len(results),
+            'period': period,
+            'generated_at': datetime.now().isoformat(),
+            'revenue': {
+                **invoice_totals['revenue'],
+                'total_received': received,
+                'invoice_count': invoice_totals['invoices']['total_count']
+            },
+            'expenses': {
+                'total': sum(g.get('amount_total') or 0 for g in expense_groups),
+                'paid': expenses_paid,
+                'pending': sum(g.get('amount_total') or 0 for g in expense_groups
+                               if g.get('state') == 'posted' and g.get('payment_state') != 'paid')
+            },
+            'profitability': {
+                'gross_profit': profit,
+                'profit_margin_percent': round(profit_margin, 1)
+            },
+            'balances': {
+                'total_assets': balances.get('total_assets', 0),
+                'total_liabilities': balances.get('total_liabilities', 0),
+                'net_position': balances.get('net_position', 0)
+            },
+            'invoices': invoice_totals['invoices'],
+            'mode': 'production'
+        }
+        if errors:
+            summary['partial'] = True
+            summary['errors'] = errors
+        return summary
+
+    def get_partners(self, is_customer: bool = True, limit: int = None, output: str = 'dicts',
+                     offset: int = 0, order: str = None, search: str = None) -> Dict[str, Any]:
         """
         Get customers/partners from Odoo.
 
         Args:
             is_customer: Filter for customers only
+            limit: Maximum number of partners to return (None for all;
+                   use iter_partners() for large partner tables)
+            output: 'dicts', 'records' (Partner tuples) or 'columns'
+            offset: Matching partners to skip
+            order: PARTNER_SORTS key, optionally suffixed with ' desc'
+            search: Case-insensitive substring of the partner name
 
         Returns:
-            List of partners
+            List of partners; total_count counts all matches
         """
-        if self.mode == "sandbox":
-            return {
-                'success': True,
-                'partners': self.partners,
-                'total_count': len(self.partners),
-                'mode': 'sandbox'
-            }
-
         try:
-            domain = []
-            if is_customer:
-                domain.append(('customer_rank', '>', 0))
+            odoo_order, sandbox_order = self._sort_order(PARTNER_SORTS, order)
 
-            result = self._json_rpc_call(
-                '/jsonrpc',
-                'call',
-                {
-                    'service': 'object',
-                    'method': 'execute_kw',
-                    'args': [
-                        self.db, self.uid, self.password,
-                        'res.partner', 'search_read',
-                        [domain],
-                        {'fields': ['name', 'email', 'phone', 'customer_rank']}
-                    ]
+            if self.mode == "sandbox":
+                filters = [('name', 'ilike', search)] if search else []
+                partners, total = self._sandbox_select(self.partners, Partner, filters, limit, output,
+                                                       order=sandbox_order, offset=offset)
+                return {
+                    'success': True,
+                    'partners': partners,
+                    'total_count': total,
+                    'mode': 'sandbox'
                 }
-            )
 
-            return {
-                'success': True,
-                'partners': result,
-                'total_count': len(result),
-                'mode': 'production'
-            }
+            local = self._local_partners(is_customer, limit, offset, odoo_order, search, output)
+            if local is not None:
+                return local
+
+            query = self._partners_query(is_customer, limit, offset, odoo_order, search)
+            if limit is None and not offset:
+                return self._partners_response(self._execute_kw(*query), output=output)
+
+            # Page and real total in one round trip
+            with self.batch() as batch:
+                rows = batch.execute_kw(*query)
+                count = batch.execute_kw(*self._count_query(query))
+            return self._partners_response(rows.result, count.result, output)
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
 
+    def iter_partners(self, is_customer: bool = True, page_size: int = 500,
+                      stream: bool = False) -> Iterator[Dict]:
+        """
+        Stream customers/partners page by page in constant memory.
+
+        Args:
+            is_customer: Filter for customers only
+            page_size: Records fetched per round trip
+            stream: One search_read decoded as it arrives instead of paging (production)
+
+        Yields:
+            Partner records in id order
+        """
+        if self.mode == "sandbox":
+            for start in range(0, len(self.partners), page_size):
+                yield from self.partners.rows(range(start, min(start + page_size, len(self.partners))))
+            return
+
+        model, _, args, kwargs = self._partners_query(is_customer)
+        if stream:
+            yield from self._stream_search_read(model, args[0], kwargs['fields'])
+            return
+        yield from self._iter_search_read(model, args[0], kwargs['fields'], page_size)
+
+    def _local_partners(self, is_customer: bool, limit: Optional[int], offset: int, odoo_order: Optional[str],
+                        search: Optional[str], output: str) -> Optional[Dict[str, Any]]:
+        """get_partners served from the local copy, or None when it cannot answer."""
+        # The local copy only holds customers, and has no text search
+        if not is_customer or search or not self._local_sortable('res.partner', odoo_order):
+            return None
+        local = self._local_select('res.partner', [], order=odoo_order or 'name', limit=limit, offset=offset)
+        if local is None:
+            return None
+        rows, total = local
+        return {**self._partners_response(rows, total, output), **self._local_meta('res.partner')}
+
+    def _partners_query(self, is_customer: bool = True, limit: int = None, offset: int = 0,
+                        order: str = None, search: str = None) -> Tuple[str, str, List, Dict]:
+        """Build the execute_kw call for get_partners (order is an Odoo order string)."""
+        domain = []
+        if is_customer:
+            domain.append(('customer_rank', '>', 0))
+        if search:
+            domain.append(('name', 'ilike', search))
+
+        kwargs = {'fields': ['name', 'email', 'phone', 'customer_rank']}
+        if limit is not None:
+            kwargs['limit'] = limit
+        if offset:
+            kwargs['offset'] = offset
+        if order:
+            kwargs['order'] = f"{order}, id"
+        return ('res.partner', 'search_read', [domain], kwargs)
+
+    def _partners_response(self, result: List[Dict], total_count: int = None,
+                           output: str = 'dicts') -> Dict[str, Any]:
+        """Shape search_read rows (and optional search_count) into the get_partners result."""
+        return {
+            'success': True,
+            'partners': shape(Partner, result, output),
+            'total_count': len(result) if total_count is None else total_count,
+            'mode': 'production'
+        }
+
     def create_partner(self, name: str, email: str = None, phone: str = None) -> Dict[str, Any]:
         """
         Create a new customer/partner in Odoo.
@@ -711,14 +1835,12 @@ class OdooMCPServer:
             Created partner details
         """
         if self.mode == "sandbox":
-            new_id = max(p['id'] for p in self.partners) + 1 if self.partners else 1
-            new_partner = {
-                'id': new_id,
+            new_partner = self.partners.insert({
                 'name': name,
                 'email': email or f"{name.lower().replace(' ', '_')}@example.com",
                 'phone': phone or 'N/A'
-            }
-            self.partners.append(new_partner)
+            })
+            self.partner_index.add(new_partner['id'], name)
             return {
                 'success': True,
                 'partner': new_partner,
@@ -728,24 +1850,16 @@ class OdooMCPServer:
 
         # Production: create partner via Odoo API
         try:
-            partner_id = self._json_rpc_call(
-                '/jsonrpc',
-                'call',
-                {
-                    'service': 'object',
-                    'method': 'execute_kw',
-                    'args': [
-                        self.db, self.uid, self.password,
-                        'res.partner', 'create',
-                        [{
-                            'name': name,
-                            'email': email,
-                            'phone': phone,
-                            'customer_rank': 1,
-                        }]
-                    ]
-                }
+            partner_id = self._execute_kw(
+                'res.partner', 'create',
+                [{
+                    'name': name,
+                    'email': email,
+                    'phone': phone,
+                    'customer_rank': 1,
+                }]
             )
+            self.partner_index.add(partner_id, name)
 
             return {
                 'success': True,
@@ -760,6 +1874,221 @@ class OdooMCPServer:
                 'error': str(e)
             }
 
+    def upsert_partners(self, records: List[Dict], chunk_size: int = None) -> Dict[str, Any]:
+        """
+        Import customers, reusing partners that already exist.
+
+        Incoming records are deduplicated by lowercased email and normalized
+        name, existing partners are looked up with one search_read, and the
+        rest are created with one multi-record create per chunk.
+
+        Args:
+            records: Partner records [{'name': str, 'email': str, 'phone': str}]
+            chunk_size: Partners per create call, defaults to BULK_CHUNK_SIZE
+
+        Returns:
+            Per-item status (created/matched/skipped/failed) and counts
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        results: List[Optional[Dict]] = [None] * len(records)
+
+        # Deduplicate the batch itself: first record per email/name wins
+        seen: Dict[str, int] = {}
+        unique = []
+        for index, record in enumerate(records):
+            name = (record.get('name') or '').strip()
+            if not normalize_name(name):
+                results[index] = {'index': index, 'status': 'skipped', 'reason': 'name is required'}
+                continue
+            keys = self._partner_keys(name, record.get('email'))
+            duplicate_of = next((seen[key] for key in keys if key in seen), None)
+            if duplicate_of is not None:
+                results[index] = {'index': index, 'status': 'skipped',
+                                  'reason': f'duplicate of record {duplicate_of + 1}'}
+                continue
+            for key in keys:
+                seen[key] = index
+            unique.append((index, keys, {
+                'name': name,
+                'email': (record.get('email') or '').strip() or False,
+                'phone': (record.get('phone') or '').strip() or False,
+                'customer_rank': 1,
+            }))
+
+        # Resolve existing partners in one lookup
+        try:
+            if self.mode == "sandbox":
+                existing_rows = self.partners
+            else:
+                names = [vals['name'] for _, _, vals in unique]
+                emails = [vals['email'] for _, _, vals in unique if vals['email']]
+                domain = ['|', ('name', 'in', names), ('email', 'in', emails)] if emails else [('name', 'in', names)]
+                existing_rows = self._execute_kw('res.partner', 'search_read', [domain], {'fields': ['name', 'email']}) if names else []
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+        existing: Dict[str, int] = {}
+        for row in existing_rows:
+            for key in self._partner_keys(row['name'], row.get('email')):
+                existing.setdefault(key, row['id'])
+
+        to_create = []
+        for index, keys, vals in unique:
+            partner_id = next((existing[key] for key in keys if key in existing), None)
+            if partner_id is None and self.partner_index.loaded:
+                # Odoo's name 'in' is exact; the index also catches case/spacing variants
+                best = self.partner_index.search(vals['name'], limit=1)
+                if best and best[0]['score'] == 1.0:
+                    partner_id = best[0]['id']
+            if partner_id is not None:
+                results[index] = {'index': index, 'status': 'matched', 'partner_id': partner_id}
+            else:
+                to_create.append((index, vals))
+
+        # Create the rest, one create call per chunk
+        if self.mode == "sandbox":
+            for start in range(0, len(to_create), chunk_size):
+                created = []
+                for index, vals in to_create[start:start + chunk_size]:
+                    next_id = self.partners.next_id()
+                    created.append({
+                        'id': next_id,
+                        'name': vals['name'],
+                        'email': vals['email'] or f"{vals['name'].lower().replace(' ', '_')}@example.com",
+                        'phone': vals['phone'] or 'N/A'
+                    })
+                    results[index] = {'index': index, 'status': 'created', 'partner_id': next_id}
+                    self.partner_index.add(next_id, vals['name'])
+                self.partners.extend(created)
+        else:
+            for start in range(0, len(to_create), chunk_size):
+                chunk = to_create[start:start + chunk_size]
+                try:
+                    ids = self._execute_kw('res.partner', 'create', [[vals for _, vals in chunk]])
+                except Exception as e:
+                    for index, _ in chunk:
+                        results[index] = {'index': index, 'status': 'failed', 'reason': str(e)}
+                    continue
+                for (index, vals), partner_id in zip(chunk, ids):
+                    results[index] = {'index': index, 'status': 'created', 'partner_id': partner_id}
+                    self.partner_index.add(partner_id, vals['name'])
+
+        counts = {status: sum(1 for r in results if r['status'] == status)
+                  for status in ('created', 'matched', 'skipped', 'failed')}
+        return {
+            'success': counts['failed'] == 0,
+            **counts,
+            'results': results,
+            'mode': self.mode
+        }
+
+    @staticmethod
+    def _partner_keys(name: str, email: Optional[str]) -> List[str]:
+        """Dedup keys for a partner: normalized name and lowercased email."""
+        keys = [f"name:{normalize_name(name)}"]
+        if email and email.strip():
+            keys.append(f"email:{email.strip().lower()}")
+        return keys
+
+    # Minimum score for resolve_partner() to treat a candidate as the customer
+    PARTNER_MATCH_SCORE = 0.9
+
+    def _refresh_partner_index(self):
+        """
+        Bring the partner name index up to date.
+
+        The first call loads every customer name; later calls (at most every
+        partner_index_ttl seconds) pull only partners changed since the
+        index's write_date watermark, then drop partners that were deleted
+        or stopped being customers.
+        """
+        index = self.partner_index
+        if self.mode == "sandbox":
+            if not index.loaded:
+                for partner in self.partners:
+                    index.add(partner['id'], partner['name'])
+                index.loaded = True
+            return
+
+        now = time.monotonic()
+        if index.loaded and now - self._partner_index_checked < self.partner_index_ttl:
+            return
+
+        domain = [('customer_rank', '>', 0)]
+        if index.loaded and index.watermark:
+            domain.append(('write_date', '>=', index.watermark))
+
+        watermark = index.watermark
+        for partner in self._iter_search_read('res.partner', domain, ['name', 'write_date'], 1000):
+            index.add(partner['id'], partner['name'])
+            if partner.get('write_date') and (watermark is None or partner['write_date'] > watermark):
+                watermark = partner['write_date']
+
+        if index.loaded:
+            # The index now holds every current customer, so it has extra ids
+            # exactly when the counts differ; only then diff the ids (uncached)
+            customers = [('customer_rank', '>', 0)]
+            count = self._json_rpc_call('/jsonrpc', 'call', self._execute_kw_params(
+                'res.partner', 'search_count', [customers]))
+            if count != len(index):
+                remote_ids = set(self._json_rpc_call('/jsonrpc', 'call', self._execute_kw_params(
+                    'res.partner', 'search', [customers])))
+                for partner_id in index.ids() - remote_ids:
+                    index.remove(partner_id)
+
+        index.watermark = watermark
+        index.loaded = True
+        self._partner_index_checked = now
+
+    def resolve_partner(self, name: str, limit: int = 5) -> Dict[str, Any]:
+        """
+        Find the customer a free-text name refers to.
+
+        Served from the local partner name index; in production, Odoo's
+        name_search is consulted when the index has no confident match.
+
+        Args:
+            name: Customer name as typed by the user
+            limit: Maximum candidates returned
+
+        Returns:
+            Ranked candidates and the confident match (or None)
+        """
+        source = 'index'
+        try:
+            self._refresh_partner_index()
+        except Exception as e:
+            logger.warning(f"Partner index refresh failed: {e}")
+
+        # An exact name needs no trigram ranking
+        candidates = self.partner_index.lookup(name)[:limit] or self.partner_index.search(name, limit)
+
+        if self.mode == "production" and (not candidates or candidates[0]['score'] < self.PARTNER_MATCH_SCORE):
+            try:
+                found = self._execute_kw('res.partner', 'name_search', [name], {'limit': limit})
+                for partner_id, display_name in found:
+                    self.partner_index.add(partner_id, display_name)
+                if found:
+                    candidates = self.partner_index.search(name, limit)
+                    source = 'name_search'
+            except Exception as e:
+                return {
+                    'success': False,
+                    'error': str(e)
+                }
+
+        match = candidates[0] if candidates and candidates[0]['score'] >= self.PARTNER_MATCH_SCORE else None
+        return {
+            'success': True,
+            'match': match,
+            'candidates': candidates,
+            'source': source,
+            'mode': self.mode
+        }
+
     def get_tools_definition(self) -> List[Dict]:
         """
         Get MCP tools definition for Claude Code integration.
@@ -775,7 +2104,10 @@ class OdooMCPServer:
                     'type': 'object',
                     'properties': {
                         'state': {'type': 'string', 'enum': ['draft', 'posted', 'paid', 'unpaid']},
-                        'limit': {'type': 'integer', 'default': 10}
+                        'limit': {'type': 'integer', 'default': 10},
+                        'offset': {'type': 'integer', 'default': 0},
+                        'order': {'type': 'string', 'description': f"One of {', '.join(INVOICE_SORTS)}, optionally followed by ' desc'"},
+                        'search': {'type': 'string', 'description': 'Customer name contains'}
                     }
                 }
             },
@@ -802,6 +2134,38 @@ class OdooMCPServer:
                     'required': ['partner_id', 'lines']
                 }
             },
+            {
+                'name': 'odoo_create_invoices_bulk',
+                'description': 'Create many customer invoices at once (e.g. month-end billing)',
+                'input_schema': {
+                    'type': 'object',
+                    'properties': {
+                        'invoices': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'properties': {
+                                    'partner_id': {'type': 'integer'},
+                                    'lines': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'product': {'type': 'string'},
+                                                'quantity': {'type': 'number'},
+                                                'price': {'type': 'number'}
+                                            }
+                                        }
+                                    },
+                                    'invoice_date': {'type': 'string', 'format': 'date'}
+                                },
+                                'required': ['partner_id', 'lines']
+                            }
+                        }
+                    },
+                    'required': ['invoices']
+                }
+            },
             {
                 'name': 'odoo_get_payments',
                 'description': 'Get recent payments received',
@@ -836,9 +2200,68 @@ class OdooMCPServer:
                 'input_schema': {
                     'type': 'object',
                     'properties': {
-                        'is_customer': {'type': 'boolean', 'default': True}
+                        'is_customer': {'type': 'boolean', 'default': True},
+                        'limit': {'type': 'integer'},
+                        'offset': {'type': 'integer', 'default': 0},
+                        'order': {'type': 'string', 'description': f"One of {', '.join(PARTNER_SORTS)}, optionally followed by ' desc'"},
+                        'search': {'type': 'string', 'description': 'Name contains'}
                     }
                 }
+            },
+            {
+                'name': 'odoo_resolve_partner',
+                'description': 'Find the customer matching a name (tolerates partial names and typos)',
+                'input_schema': {
+                    'type': 'object',
+                    'properties': {
+                        'name': {'type': 'string'},
+                        'limit': {'type': 'integer', 'default': 5}
+                    },
+                    'required': ['name']
+                }
+            },
+            {
+                'name': 'odoo_upsert_partners',
+                'description': 'Import customers in bulk, skipping duplicates and reusing existing partners',
+                'input_schema': {
+                    'type': 'object',
+                    'properties': {
+                        'partners': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'properties': {
+                                    'name': {'type': 'string'},
+                                    'email': {'type': 'string'},
+                                    'phone': {'type': 'string'}
+                                },
+                                'required': ['name']
+                            }
+                        }
+                    },
+                    'required': ['partners']
+                }
+            },
+            {
+                'name': 'odoo_batch',
+                'description': 'Run several Odoo tools in one call; read-only tools share a single round trip',
+                'input_schema': {
+                    'type': 'object',
+                    'properties': {
+                        'calls': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'properties': {
+                                    'tool': {'type': 'string'},
+                                    'params': {'type': 'object'}
+                                },
+                                'required': ['tool']
+                            }
+                        }
+                    },
+                    'required': ['calls']
+                }
             }
         ]
 
@@ -856,13 +2279,17 @@ class OdooMCPServer:
         tool_map = {
             'odoo_get_invoices': lambda p: self.get_invoices(
                 state=p.get('state'),
-                limit=p.get('limit', 10)
+                limit=p.get('limit', 10),
+                offset=p.get('offset', 0),
+                order=p.get('order'),
+                search=p.get('search')
             ),
             'odoo_create_invoice': lambda p: self.create_invoice(
                 partner_id=p['partner_id'],
                 lines=p['lines'],
                 invoice_date=p.get('invoice_date')
             ),
+            'odoo_create_invoices_bulk': lambda p: self.create_invoices_bulk(p['invoices']),
             'odoo_get_payments': lambda p: self.get_payments(
                 days=p.get('days', 30)
             ),
@@ -871,8 +2298,23 @@ class OdooMCPServer:
                 period=p.get('period', 'month')
             ),
             'odoo_get_partners': lambda p: self.get_partners(
-                is_customer=p.get('is_customer', True)
-            )
+                is_customer=p.get('is_customer', True),
+                limit=p.get('limit'),
+                offset=p.get('offset', 0),
+                order=p.get('order'),
+                search=p.get('search')
+            ),
+            'odoo_resolve_partner': lambda p: self.resolve_partner(
+                name=p['name'],
+                limit=p.get('limit', 5)
+            ),
+            'odoo_upsert_partners': lambda p: self.upsert_partners(p['partners']),
+            'odoo_batch': lambda p: {
+                'success': True,
+                'results': self.execute_tools(
+                    [(c['tool'], c.get('params', {})) for c in p.get('calls', [])]
+                )
+            }
         }
 
         if tool_name not in tool_map:
@@ -881,13 +2323,117 @@ class OdooMCPServer:
                 'error': f'Unknown tool: {tool_name}'
             }
 
-        return tool_map[tool_name](params)
+        started = time.perf_counter()
+        result = None
+        try:
+            result = tool_map[tool_name](params)
+            return result
+        finally:
+            self.metrics.record_tool(tool_name, (time.perf_counter() - started) * 1000,
+                                     error=not (isinstance(result, dict) and result.get('success')))
+
+    def _batchable_tool(self, tool_name: str, params: Dict) -> Optional[Tuple[List[Tuple], Any]]:
+        """
+        Split a read-only tool into its execute_kw calls and result shaper.
+
+        The shaper receives the calls' results in order. Returns None for
+        tools that cannot be batched (writes, composites).
+        """
+        if tool_name == 'odoo_get_invoices':
+            order, _ = self._sort_order(INVOICE_SORTS, params.get('order'))
+            query = self._invoices_query(params.get('state'), params.get('limit', 10), params.get('offset', 0),
+                                         order, params.get('search'))
+            return ([query, self._count_query(query)],
+                    lambda results: self._invoices_response(*results))
+        if tool_name == 'odoo_get_payments':
+            days = params.get('days', 30)
+            return [self._payments_query(days)], lambda results: self._payments_response(results[0], days)
+        if tool_name == 'odoo_get_balances':
+            return [self._balances_query()], lambda results: self._balances_response(results[0])
+        if tool_name == 'odoo_get_partners':
+            order, _ = self._sort_order(PARTNER_SORTS, params.get('order'))
+            query = self._partners_query(params.get('is_customer', True), params.get('limit'),
+                                         params.get('offset', 0), order, params.get('search'))
+            return ([query, self._count_query(query)],
+                    lambda results: self._partners_response(*results))
+        return None
+
+    def execute_tools(self, calls: List[Tuple[str, Dict]], parallel: bool = False) -> List[Dict[str, Any]]:
+        """
+        Execute several MCP tools, batching read-only ones into one round trip.
+
+        Args:
+            calls: List of (tool_name, params) pairs
+            parallel: Run each tool concurrently via fan_out() instead of batching
+
+        Returns:
+            Tool execution results in the same order as calls
+        """
+        if parallel:
+            results = self.fan_out({
+                str(index): (lambda name=name, params=params: self.execute_tool(name, params))
+                for index, (name, params) in enumerate(calls)
+            })
+            return [results[str(index)] for index in range(len(calls))]
+
+        # Sandbox and local-mirror reads never hit the network
+        if self.mode == "sandbox" or self.sync is not None:
+            return [self.execute_tool(name, params) for name, params in calls]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        pending = []
+        try:
+            with self.batch() as batch:
+                for index, (name, params) in enumerate(calls):
+                    try:
+                        split = self._batchable_tool(name, params)
+                    except ValueError as e:
+                        # A bad order fails only its own call, not the batch
+                        results[index] = {'success': False, 'error': str(e)}
+                        continue
+                    if split is None:
+                        continue
+                    queries, shape = split
+                    pending.append((index, [batch.execute_kw(*query) for query in queries], shape))
+        except Exception as e:
+            for index, _, _ in pending:
+                results[index] = {'success': False, 'error': str(e)}
+            pending = []
+
+        for index, batch_calls, shape in pending:
+            try:
+                results[index] = shape([call.result for call in batch_calls])
+            except Exception as e:
+                results[index] = {'success': False, 'error': str(e)}
+
+        for index, (name, params) in enumerate(calls):
+            if results[index] is None:
+                results[index] = self.execute_tool(name, params)
+
+        return results
 
 
 def main():
     """CLI interface for testing Odoo MCP Server."""
     import sys
 
+    if len(sys.argv) >= 2 and sys.argv[1].lower() == 'sync':
+        sync_main()
+        return
+
+    if len(sys.argv) >= 2 and sys.argv[1].lower() == 'generate':
+        from odoo_dataset import main as generate_main
+        generate_main(sys.argv[2:])
+        return
+
+    if len(sys.argv) >= 3 and sys.argv[1].lower() == 'import-invoices':
+        import_invoices_main(sys.argv[2], production='--production' in sys.argv[3:])
+        return
+
+    if len(sys.argv) >= 3 and sys.argv[1].lower() == 'import-partners':
+        import_partners_main(sys.argv[2], production='--production' in sys.argv[3:])
+        return
+
     server = OdooMCPServer(mode='sandbox')
 
     if len(sys.argv) < 2:
@@ -902,6 +2448,15 @@ def main():
         print("  partners       - List customers")
         print("  create         - Create test invoice")
         print("  tools          - Show MCP tools definition")
+        print("  stats [file]   - Show the last RPC stats snapshot (written when ODOO_STATS_INTERVAL is set)")
+        print("  export [file]  - Stream all invoices to CSV (default: invoices.csv)")
+        print("  sync           - Refresh local SQLite mirror from production Odoo (ODOO_* env)")
+        print("  generate [--invoices N --partners N --expenses N --seed S --out DIR]")
+        print("                 - Generate a synthetic dataset snapshot (load with ODOO_SANDBOX_SNAPSHOT=DIR)")
+        print("  import-invoices <file.csv> [--production]")
+        print("                 - Bulk-create invoices from CSV (partner_id,product,quantity,price[,invoice_date,ref])")
+        print("  import-partners <file.csv> [--production]")
+        print("                 - Import customers from CSV (name[,email,phone]), skipping duplicates")
         return
 
     command = sys.argv[1].lower()
@@ -976,6 +2531,36 @@ def main():
         else:
             print(f"\n❌ Error: {result['error']}")
 
+    elif command == 'export':
+        import csv
+
+        path = sys.argv[2] if len(sys.argv) > 2 else 'invoices.csv'
+        fields = ['id', 'name', 'partner_id', 'invoice_date', 'amount_total',
+                  'amount_residual', 'state', 'payment_state']
+        count = 0
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+            writer.writeheader()
+            for inv in server.iter_invoices():
+                writer.writerow(inv)
+                count += 1
+        print(f"\n📤 Exported {count} invoices to {path}")
+
+    elif command == 'stats':
+        path = sys.argv[2] if len(sys.argv) > 2 else server.stats_log
+        snapshot = read_last_snapshot(path)
+        if snapshot is None:
+            print(f"\n📭 No stats in {path}")
+            print("   Set ODOO_STATS_INTERVAL=<seconds> on the running server to record them.")
+        else:
+            print(f"\n📈 Odoo RPC Stats ({path}):")
+            for line in format_snapshot(snapshot):
+                print(line)
+            resilience = snapshot.get('resilience')
+            if resilience:
+                print(f"\n  Retries: {resilience['retries']}  Breaker: {resilience['breaker_state']}  "
+                      f"Stale reads: {resilience['stale_served']}")
+
     elif command == 'tools':
         tools = server.get_tools_definition()
         print("\n🔧 MCP Tools Definition:")
@@ -988,5 +2573,116 @@ def main():
         print("Run without arguments to see available commands.")
 
 
+def sync_main():
+    """Refresh the local SQLite mirror from the production Odoo in ODOO_* env vars."""
+    server = OdooMCPServer(mode='production', config={'local_mirror': 'sqlite'})
+
+    auth = server.authenticate()
+    if not auth['success']:
+        print(f"\n❌ {auth['message']}")
+        return
+
+    result = server.sync_local_mirror()
+    print(f"\n🔄 Local Mirror Sync ({server.sync.store.path}):")
+    for model, counts in result['results'].items():
+        if 'error' in counts:
+            print(f"  ❌ {model}: {counts['error']}")
+        else:
+            kind = 'full' if counts['full'] else 'incremental'
+            print(f"  ✅ {model}: {counts['changed']} changed, {counts['deleted']} deleted ({kind})")
+
+    print("\n  Watermarks:")
+    for model, status in result['status'].items():
+        print(f"    • {model}: {status['watermark'] or '-'} (synced {status['synced_at'] or 'never'})")
+
+
+def load_invoice_specs(path: str) -> List[Dict]:
+    """
+    Read invoice specs for create_invoices_bulk() from a CSV file.
+
+    One row per invoice line with columns partner_id, product, quantity,
+    price and optional invoice_date and ref. Rows sharing a ref become lines
+    of the same invoice; rows without one are invoices of their own.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Invoice specs in file order
+    """
+    import csv
+
+    specs: List[Dict] = []
+    by_ref: Dict[str, Dict] = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            line = {
+                'product': row.get('product') or 'Service',
+                'quantity': float(row.get('quantity') or 1),
+                'price': float(row.get('price') or 0),
+            }
+            ref = (row.get('ref') or '').strip()
+            if ref and ref in by_ref:
+                by_ref[ref]['lines'].append(line)
+                continue
+
+            spec = {
+                'partner_id': int(row['partner_id']) if row.get('partner_id') else None,
+                'lines': [line],
+                'invoice_date': row.get('invoice_date') or None,
+            }
+            specs.append(spec)
+            if ref:
+                by_ref[ref] = spec
+    return specs
+
+
+def import_invoices_main(path: str, production: bool = False):
+    """Bulk-create the invoices in a CSV file (sandbox unless production is set)."""
+    server = OdooMCPServer(mode='production' if production else 'sandbox')
+
+    if production:
+        auth = server.authenticate()
+        if not auth['success']:
+            print(f"\n❌ {auth['message']}")
+            return
+
+    specs = load_invoice_specs(path)
+    result = server.create_invoices_bulk(specs)
+
+    print(f"\n🧾 Bulk Invoice Import ({path}, {server.mode}):")
+    print(f"  ✅ Created: {result['created']}")
+    print(f"  ❌ Failed: {result['failed']}")
+    for item in result['results']:
+        if not item['success']:
+            print(f"    • Invoice {item['index'] + 1}: {item['error']}")
+
+
+def import_partners_main(path: str, production: bool = False):
+    """Import the customers in a CSV file (sandbox unless production is set)."""
+    import csv
+
+    server = OdooMCPServer(mode='production' if production else 'sandbox')
+
+    if production:
+        auth = server.authenticate()
+        if not auth['success']:
+            print(f"\n❌ {auth['message']}")
+            return
+
+    with open(path, newline='') as f:
+        records = list(csv.DictReader(f))
+    result = server.upsert_partners(records)
+    if not result['success'] and 'error' in result:
+        print(f"\n❌ Error: {result['error']}")
+        return
+
+    print(f"\n👥 Partner Import ({path}, {server.mode}):")
+    print(f"  ✅ Created: {result['created']}")
+    print(f"  🔗 Matched existing: {result['matched']}")
+    print(f"  ⏭️  Skipped: {result['skipped']}")
+    print(f"  ❌ Failed: {result['failed']}")
+
+
 if __name__ == '__main__':
     main()
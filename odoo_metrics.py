@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Odoo Metrics - per-call instrumentation for OdooMCPServer
+
+Records, per Odoo model/method and per MCP tool, what each call cost so
+the slow or chatty ones stand out:
+- Call count, errors (transport failures and Odoo faults) and cache hits
+- Latency histogram with total/max and estimated p50/p95
+- Request/response bytes on the wire (uncompressed JSON)
+- Optional background thread appending snapshots to a JSONL file
+  (Logs/odoo_rpc_stats.jsonl), read back by `python odoo_mcp_server.py stats`
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; slower calls land in the last, open bucket
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+DEFAULT_STATS_LOG = '../AI_Employee_Vault/Logs/odoo_rpc_stats.jsonl'
+
+
+def rpc_label(params: Any) -> str:
+    """'model.method' for an execute_kw call, 'common.method' for common-service calls."""
+    if not isinstance(params, dict):
+        return 'unknown'
+    args = params.get('args') or []
+    if params.get('method') == 'execute_kw' and len(args) > 4:
+        return f"{args[3]}.{args[4]}"
+    return f"{params.get('service', 'unknown')}.{params.get('method', 'unknown')}"
+
+
+class _CallStats:
+    """Counters for one call label."""
+
+    __slots__ = ('count', 'errors', 'cache_hits', 'total_ms', 'max_ms',
+                 'request_bytes', 'response_bytes', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def _percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of calls (max_ms for the open bucket)."""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for i, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else round(self.max_ms, 1)
+        return round(self.max_ms, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'cache_hits': self.cache_hits,
+            'total_ms': round(self.total_ms, 1),
+            'mean_ms': round(self.total_ms / self.count, 2) if self.count else None,
+            'p50_ms': self._percentile(0.5),
+            'p95_ms': self._percentile(0.95),
+            'max_ms': round(self.max_ms, 1),
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'histogram': {label: hits for label, hits in zip(labels, self.buckets) if hits},
+        }
+
+
+class OdooMetrics:
+    """Thread-safe RPC and tool call statistics."""
+
+    def __init__(self):
+        self._rpc: Dict[str, _CallStats] = {}
+        self._tools: Dict[str, _CallStats] = {}
+        self._lock = threading.Lock()
+        self._since = datetime.now().isoformat()
+        self._dumper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def _entry(table: Dict[str, _CallStats], label: str) -> _CallStats:
+        entry = table.get(label)
+        if entry is None:
+            entry = table[label] = _CallStats()
+        return entry
+
+    def record_rpc(self, labels: Iterable[str], elapsed_ms: float, request_bytes: int = 0,
+                   response_bytes: int = 0, error: bool = False):
+        """
+        Record one HTTP round trip.
+
+        Args:
+            labels: Call labels it carried (several for a JSON-RPC batch)
+            elapsed_ms: Round trip time, retries included
+            request_bytes: Request body size
+            response_bytes: Response body size
+            error: Whether the round trip failed
+        """
+        labels = list(labels)
+        with self._lock:
+            for label in labels:
+                entry = self._entry(self._rpc, label)
+                entry.observe(elapsed_ms)
+                entry.errors += error
+            if len(labels) == 1:
+                target = self._entry(self._rpc, labels[0])
+            else:
+                # Bytes of a batch are not split per call; they go on its own row
+                target = self._entry(self._rpc, 'jsonrpc.batch')
+                target.observe(elapsed_ms)
+                target.errors += error
+            target.request_bytes += request_bytes
+            target.response_bytes += response_bytes
+
+    def record_fault(self, label: str):
+        """Record an Odoo error returned for a call that did reach the server."""
+        with self._lock:
+            self._entry(self._rpc, label).errors += 1
+
+    def record_cache_hit(self, label: str):
+        """Record a read answered from the read cache (no round trip)."""
+        with self._lock:
+            self._entry(self._rpc, label).cache_hits += 1
+
+    def record_tool(self, name: str, elapsed_ms: float, error: bool = False):
+        """Record one execute_tool call."""
+        with self._lock:
+            entry = self._entry(self._tools, name)
+            entry.observe(elapsed_ms)
+            entry.errors += error
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters, slowest (by total time) first."""
+        def rows(table: Dict[str, _CallStats]) -> Dict[str, Dict]:
+            ranked = sorted(table.items(), key=lambda item: -item[1].total_ms)
+            return {label: stats.to_dict() for label, stats in ranked}
+
+        with self._lock:
+            return {
+                'since': self._since,
+                'timestamp': datetime.now().isoformat(),
+                'rpc': rows(self._rpc),
+                'tools': rows(self._tools),
+            }
+
+    def reset(self):
+        """Drop all counters."""
+        with self._lock:
+            self._rpc.clear()
+            self._tools.clear()
+            self._since = datetime.now().isoformat()
+
+    def dump(self, path: str, extra: Optional[Dict[str, Any]] = None):
+        """Append the current snapshot (plus extra fields) as one JSON line."""
+        log_file = Path(path)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_file, 'a') as f:
+            f.write(json.dumps({**self.snapshot(), **(extra or {})}, default=str) + '\n')
+
+    def start_dumper(self, path: str, interval: float, extra=None):
+        """
+        Append a snapshot to path every interval seconds from a daemon thread.
+
+        Args:
+            path: JSONL file
+            interval: Seconds between snapshots
+            extra: Optional zero-argument callable returning more fields to log
+        """
+        if self._dumper is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.dump(path, extra() if extra else None)
+                except Exception as e:
+                    logger.warning(f"Could not write Odoo stats to {path}: {e}")
+
+        self._stop.clear()
+        self._dumper = threading.Thread(target=run, name='odoo-stats-dumper', daemon=True)
+        self._dumper.start()
+
+    def stop_dumper(self):
+        if self._dumper is not None:
+            self._stop.set()
+            self._dumper.join()
+            self._dumper = None
+
+
+def read_last_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    """Last snapshot in a stats JSONL file, or None if there is none."""
+    log_file = Path(path)
+    if not log_file.exists():
+        return None
+    last = None
+    with open(log_file) as f:
+        for line in f:
+            if line.strip():
+                last = line
+    return json.loads(last) if last else None
+
+
+def format_snapshot(snapshot: Dict[str, Any], top: int = 15) -> List[str]:
+    """Text table lines for the CLI, slowest calls first."""
+    lines = [f"  Since {snapshot.get('since')} (snapshot {snapshot.get('timestamp')})"]
+    for section, title in (('rpc', 'Odoo calls'), ('tools', 'MCP tools')):
+        rows = list(snapshot.get(section, {}).items())[:top]
+        if not rows:
+            continue
+        lines.append(f"\n  {title}:")
+        lines.append(f"    {'call':<34} {'count':>7} {'errors':>6} {'cached':>6} {'total ms':>10} "
+                     f"{'mean':>8} {'p95':>8} {'KB in':>9}")
+        for label, stats in rows:
+            mean = stats['mean_ms'] if stats['mean_ms'] is not None else 0
+            p95 = stats['p95_ms'] if stats['p95_ms'] is not None else 0
+            lines.append(f"    {label:<34} {stats['count']:>7} {stats['errors']:>6} {stats['cache_hits']:>6} "
+                         f"{stats['total_ms']:>10,.1f} {mean:>8.1f} {p95:>8.1f} "
+                         f"{stats['response_bytes'] / 1024:>9,.1f}")
+    return lines
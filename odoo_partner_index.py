@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Partner Name Index - fast fuzzy customer lookup
+
+In-memory normalized-name + trigram index over Odoo partners, used by
+OdooMCPServer.resolve_partner() so invoice creation does not download
+the whole partner table to find one customer:
+- Exact normalized-name lookup in O(1)
+- Trigram candidate generation with Jaccard ranking for typos/partials,
+  scoring only the candidates that share the most selective trigrams
+- Incremental add/remove as partners are created or synced
+"""
+
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Set
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    ascii_name = decomposed.encode('ascii', 'ignore').decode('ascii').lower()
+    return _NON_ALNUM.sub(' ', ascii_name).strip()
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Character trigrams of a normalized name, padded so short names still index."""
+    padded = f'  {normalized} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PartnerNameIndex:
+    """
+    Thread-safe partner lookup index.
+
+    Scores: 1.0 exact normalized match, 0.9 query contained in the name
+    (the chat tool's old substring rule), otherwise trigram Jaccard similarity.
+    """
+
+    # Trigrams shared by more partners than this are not used to find candidates
+    COMMON_GRAM_MIN = 1000
+
+    # Candidates scored per search, those sharing the most selective trigrams first
+    MAX_SCORED = 256
+
+    def __init__(self):
+        self._names: Dict[int, str] = {}
+        self._normalized: Dict[int, str] = {}
+        self._gram_counts: Dict[int, int] = {}
+        self._exact: Dict[str, Set[int]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._lock = threading.Lock()
+        self.watermark: Optional[str] = None
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, partner_id: int, name: str):
+        """Index (or re-index) a partner."""
+        with self._lock:
+            self._remove(partner_id)
+            normalized = normalize_name(name)
+            self._names[partner_id] = name
+            self._normalized[partner_id] = normalized
+            self._exact.setdefault(normalized, set()).add(partner_id)
+            grams = trigrams(normalized)
+            self._gram_counts[partner_id] = len(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(partner_id)
+
+    def ids(self) -> Set[int]:
+        """Ids of every indexed partner."""
+        with self._lock:
+            return set(self._names)
+
+    def remove(self, partner_id: int):
+        """Drop a partner from the index."""
+        with self._lock:
+            self._remove(partner_id)
+
+    def _remove(self, partner_id: int):
+        normalized = self._normalized.pop(partner_id, None)
+        if normalized is None:
+            return
+        self._names.pop(partner_id, None)
+        self._gram_counts.pop(partner_id, None)
+        self._exact.get(normalized, set()).discard(partner_id)
+        for gram in trigrams(normalized):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(partner_id)
+                if not postings:
+                    del self._postings[gram]
+
+    def lookup(self, query: str) -> List[Dict]:
+        """Partners whose normalized name equals the query's [{'id', 'name', 'score': 1.0}]."""
+        normalized = normalize_name(query)
+        with self._lock:
+            ids = sorted(self._exact.get(normalized, ()), key=lambda pid: (len(self._names[pid]), pid))
+            return [{'id': pid, 'name': self._names[pid], 'score': 1.0} for pid in ids]
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.3) -> List[Dict]:
+        """
+        Rank partners by similarity to query.
+
+        Returns:
+            Up to limit candidates [{'id', 'name', 'score'}], best first
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        with self._lock:
+            scores: Dict[int, float] = {pid: 1.0 for pid in self._exact.get(normalized, ())}
+
+            # Candidates come from the selective trigrams; grams shared by a
+            # large share of partners ("ltd", "inc") only add scoring work
+            query_grams = trigrams(normalized)
+            common_cutoff = max(self.COMMON_GRAM_MIN, len(self._names) // 50)
+            postings = sorted((self._postings.get(gram, ()) for gram in query_grams), key=len)
+            selective = [ids for ids in postings if len(ids) <= common_cutoff] or postings[:1]
+            common_grams = postings[len(selective):]
+
+            # Only the candidates sharing the most selective grams are scored;
+            # shared grams are counted from the postings, not rebuilt per name
+            hits = Counter()
+            for ids in selective:
+                hits.update(ids)
+
+            for pid, shared in hits.most_common(self.MAX_SCORED):
+                if pid in scores:
+                    continue
+                name = self._normalized[pid]
+                if normalized in name:
+                    scores[pid] = 0.9
+                    continue
+                common = shared + sum(1 for ids in common_grams if pid in ids)
+                union = len(query_grams) + self._gram_counts[pid] - common
+                score = common / union if union else 0
+                if score >= min_score:
+                    scores[pid] = round(score, 3)
+
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], len(self._names[item[0]]), item[0]))
+            return [{'id': pid, 'name': self._names[pid], 'score': score} for pid, score in ranked[:limit]]
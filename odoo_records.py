@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Odoo Records - compact typed records for invoices, partners and payments
+
+Read results are normalized once, where they leave OdooMCPServer, into
+NamedTuples (a tuple per record, no per-record dict) so the dashboard and
+chat tools can use them directly without copying them again:
+- Odoo quirks handled in one place: many2one [id, name] pairs, False for
+  empty fields, invoice_date_due vs the sandbox's due_date
+- Columnar output: the same fields as parallel lists, ready for a dataframe
+
+get_invoices/get_partners/get_payments keep returning plain dicts unless
+called with output='records' or output='columns'.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+# Result shapes accepted by the read methods' output argument
+OUTPUTS = ('dicts', 'records', 'columns')
+
+# (field, operator, value) filter understood by the local copy and sandbox tables
+Filter = Tuple[str, str, Any]
+
+
+def _value(value: Any) -> Any:
+    """Odoo sends False for empty fields; use None instead."""
+    return None if value is False else value
+
+
+def _many2one(row: Dict, field: str, name_field: str):
+    """(id, display name) from an Odoo [id, name] pair or the sandbox's split columns."""
+    value = row.get(field)
+    if isinstance(value, (list, tuple)):
+        return value[0], value[1]
+    return _value(value), _value(row.get(name_field))
+
+
+class Invoice(NamedTuple):
+    id: int
+    name: Optional[str]
+    partner_id: Optional[int]
+    partner_name: Optional[str]
+    invoice_date: Optional[str]
+    due_date: Optional[str]
+    amount_total: float
+    amount_residual: float
+    state: str
+    payment_state: str
+
+    @classmethod
+    def from_row(cls, row: Dict) -> 'Invoice':
+        partner_id, partner_name = _many2one(row, 'partner_id', 'partner_name')
+        return cls(
+            row['id'],
+            _value(row.get('name')),
+            partner_id,
+            partner_name,
+            _value(row.get('invoice_date')),
+            _value(row.get('invoice_date_due', row.get('due_date'))),
+            row.get('amount_total') or 0.0,
+            row.get('amount_residual') or 0.0,
+            row.get('state') or 'draft',
+            row.get('payment_state') or 'not_paid',
+        )
+
+
+class Partner(NamedTuple):
+    id: int
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+
+    @classmethod
+    def from_row(cls, row: Dict) -> 'Partner':
+        return cls(
+            row['id'],
+            _value(row.get('name')),
+            _value(row.get('email')),
+            _value(row.get('phone')),
+        )
+
+
+class Payment(NamedTuple):
+    id: int
+    name: Optional[str]
+    partner_id: Optional[int]
+    partner_name: Optional[str]
+    payment_date: Optional[str]
+    amount: float
+    payment_type: Optional[str]
+    state: Optional[str]
+    ref: Optional[str]
+
+    @classmethod
+    def from_row(cls, row: Dict) -> 'Payment':
+        partner_id, partner_name = _many2one(row, 'partner_id', 'partner_name')
+        return cls(
+            row['id'],
+            _value(row.get('name')),
+            partner_id,
+            partner_name,
+            _value(row.get('payment_date')),
+            row.get('amount') or 0.0,
+            _value(row.get('payment_type')),
+            _value(row.get('state')),
+            _value(row.get('ref')),
+        )
+
+
+def to_records(record_type: Type[NamedTuple], rows: Iterable[Dict]) -> List[NamedTuple]:
+    """Normalize Odoo (or sandbox) rows into records."""
+    return [record_type.from_row(row) for row in rows]
+
+
+def to_columns(record_type: Type[NamedTuple], records: Sequence[NamedTuple]) -> Dict[str, List]:
+    """Transpose records into {field: values} parallel lists."""
+    if not records:
+        return {field: [] for field in record_type._fields}
+    return {field: list(values) for field, values in zip(record_type._fields, zip(*records))}
+
+
+def shape(record_type: Type[NamedTuple], rows: List[Dict], output: str = 'dicts') -> Any:
+    """
+    Return read results in the requested output shape.
+
+    Args:
+        record_type: Invoice, Partner or Payment
+        rows: search_read (or sandbox) rows
+        output: 'dicts' (rows unchanged), 'records' or 'columns'
+
+    Returns:
+        rows, a list of records, or a dict of parallel lists
+    """
+    if output == 'dicts':
+        return rows
+    if output == 'records':
+        return to_records(record_type, rows)
+    if output == 'columns':
+        return to_columns(record_type, to_records(record_type, rows))
+    raise ValueError(f"Unknown output {output!r}, expected one of {', '.join(OUTPUTS)}")
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Odoo Resilience - retries and circuit breaking for the JSON-RPC transport
+
+Used by OdooMCPServer and AsyncOdooMCPServer so a flaky or hung Odoo
+neither blocks a Streamlit session nor fails a tool call on one bad hop:
+- Per-call deadline that also caps each attempt's read timeout
+- Jittered exponential backoff retries, for idempotent reads only
+- Circuit breaker that fails fast while Odoo is down and sends one probe
+  request after a cool-down
+- Retry, trip and short-circuit counters for tuning
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting and proxy/gateway errors in front of Odoo
+RETRYABLE_STATUS = (429, 502, 503, 504)
+
+# execute_kw methods that never change data and are safe to send twice
+IDEMPOTENT_METHODS = frozenset({
+    'search_read', 'search', 'search_count', 'read', 'read_group',
+    'name_search', 'fields_get', 'name_get', 'check_access_rights',
+})
+
+
+class OdooUnavailableError(Exception):
+    """Odoo could not be reached (transient failures exhausted the retries)."""
+
+
+class CircuitOpenError(OdooUnavailableError):
+    """The circuit breaker is open; the call was not sent."""
+
+
+class OdooRPCError(Exception):
+    """Odoo processed the call and answered with a JSON-RPC error (a write was rolled back)."""
+
+
+def is_idempotent(params: Any) -> bool:
+    """
+    Whether a JSON-RPC call is safe to retry.
+
+    common-service calls (authenticate, version) are read-only; object
+    calls are retried only for the methods in IDEMPOTENT_METHODS.
+    """
+    if not isinstance(params, dict):
+        return False
+    if params.get('service') == 'common':
+        return True
+    args = params.get('args') or []
+    return params.get('method') == 'execute_kw' and len(args) > 4 and args[4] in IDEMPOTENT_METHODS
+
+
+def is_transient(exc: BaseException, transient_types: Tuple[Type[BaseException], ...] = ()) -> bool:
+    """
+    Whether an exception is a transient transport failure.
+
+    Args:
+        exc: Exception raised while sending a request
+        transient_types: Client library connection/timeout exception classes
+
+    Returns:
+        True for connection errors, timeouts and RETRYABLE_STATUS responses
+    """
+    # requests.HTTPError carries .response.status_code, aiohttp.ClientResponseError carries .status
+    response = getattr(exc, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(exc, 'status', None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS
+    return isinstance(exc, transient_types + (ConnectionError, TimeoutError, asyncio.TimeoutError))
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by attempts and a deadline."""
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 0.2,
+                 max_delay: float = 2.0, deadline: float = 45.0):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            base_delay: Backoff cap in seconds before the first retry
+            max_delay: Upper bound on any single backoff
+            deadline: Seconds a call may take in total, retries included
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def backoff(self, attempt: int) -> float:
+        """Sleep before retry number attempt + 1: uniform in [0, min(max_delay, base * 2^attempt)]."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed / open / half-open circuit breaker.
+
+    After failure_threshold consecutive transient failures the circuit
+    opens and calls fail immediately. Once reset_timeout has passed one
+    probe call is let through; its success closes the circuit, its
+    failure re-opens it for another reset_timeout.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (0 disables it)
+            reset_timeout: Seconds to stay open before sending a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        self.trips = 0
+        self.short_circuits = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may be sent now. Counts a short circuit when not."""
+        if self.failure_threshold <= 0:
+            return True
+
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.short_circuits += 1
+            return False
+
+    def record_success(self):
+        """A call reached Odoo: close the circuit."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Odoo reachable again, closing circuit breaker")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """A call failed transiently: open the circuit at the threshold or after a failed probe."""
+        if self.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                    self._state == self.CLOSED and self._failures >= self.failure_threshold):
+                logger.warning(f"Odoo unreachable after {self._failures} failures, "
+                               f"opening circuit breaker for {self.reset_timeout:g}s")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+                self.trips += 1
+
+    def reset(self):
+        """Force the circuit closed."""
+        self.record_success()
+
+
+class OdooResilience:
+    """
+    Runs transport calls under a RetryPolicy and a shared CircuitBreaker.
+
+    Only transient failures (see is_transient) are retried and counted
+    against the breaker; Odoo application errors pass straight through.
+    """
+
+    def __init__(self, retry: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None):
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.stale_served = 0
+
+    def _start(self) -> float:
+        """Check the breaker and return the call's deadline (monotonic clock)."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Odoo unavailable: circuit breaker open (retrying in up to {self.breaker.reset_timeout:g}s)"
+            )
+        with self._lock:
+            self.calls += 1
+        return time.monotonic() + self.retry.deadline
+
+    def _on_failure(self, exc: Exception, attempt: int, deadline_at: float, idempotent: bool,
+                    transient_types: Tuple[Type[BaseException], ...]) -> float:
+        """
+        Record a failed attempt and decide whether to retry.
+
+        Returns:
+            Seconds to sleep before the next attempt
+
+        Raises:
+            The original exception for non-transient failures, or
+            OdooUnavailableError once retrying is not allowed or useful
+        """
+        if not is_transient(exc, transient_types):
+            # Odoo answered, just not successfully: the transport is fine
+            self.breaker.record_success()
+            raise exc
+
+        self.breaker.record_failure()
+        with self._lock:
+            self.failures += 1
+
+        delay = self.retry.backoff(attempt)
+        if (not idempotent or attempt >= self.retry.max_retries
+                or time.monotonic() + delay >= deadline_at
+                or self.breaker.state == CircuitBreaker.OPEN):
+            raise OdooUnavailableError(f"Odoo unavailable after {attempt + 1} attempt(s): {exc}") from exc
+
+        with self._lock:
+            self.retries += 1
+        logger.warning(f"Transient Odoo error ({exc}), retry {attempt + 1}/{self.retry.max_retries} in {delay:.2f}s")
+        return delay
+
+    def call(self, send: Callable[[float], Any], idempotent: bool,
+             transient_types: Tuple[Type[BaseException], ...] = ()) -> Any:
+        """
+        Send a request with retries.
+
+        Args:
+            send: Callable taking the seconds left before the deadline
+            idempotent: Whether the request may be sent more than once
+            transient_types: Client library connection/timeout exception classes
+
+        Returns:
+            Whatever send returns
+        """
+        deadline_at = self._start()
+        attempt = 0
+        while True:
+            try:
+                result = send(max(deadline_at - time.monotonic(), 0.001))
+            except Exception as e:
+                time.sleep(self._on_failure(e, attempt, deadline_at, idempotent, transient_types))
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def acall(self, send: Callable[[float], Any], idempotent: bool,
+                    transient_types: Tuple[Type[BaseException], ...] = ()) -> Any:
+        """Coroutine variant of call(); send returns an awaitable."""
+        deadline_at = self._start()
+        attempt = 0
+        while True:
+            try:
+                result = await send(max(deadline_at - time.monotonic(), 0.001))
+            except Exception as e:
+                await asyncio.sleep(self._on_failure(e, attempt, deadline_at, idempotent, transient_types))
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    def served_stale(self):
+        """Count a read answered from an expired cache entry while Odoo was unavailable."""
+        with self._lock:
+            self.stale_served += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get retry and circuit breaker counters."""
+        with self._lock:
+            counters = {
+                'calls': self.calls,
+                'retries': self.retries,
+                'failures': self.failures,
+                'stale_served': self.stale_served,
+            }
+        return {
+            **counters,
+            'breaker_state': self.breaker.state,
+            'breaker_trips': self.breaker.trips,
+            'short_circuits': self.breaker.short_circuits,
+            'max_retries': self.retry.max_retries,
+            'deadline': self.retry.deadline,
+        }
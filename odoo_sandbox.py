@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+"""
+Odoo Sandbox Store - columnar, indexed tables for sandbox mode
+
+Backs OdooMCPServer's sandbox data so load tests can run against a
+million synthetic invoices:
+- One compact typed array per column (array module; NumPy used when installed)
+- Low-cardinality strings stored as category codes
+- Secondary indexes (value -> row positions) on filter columns
+- Id counter instead of max(id) scans on insert
+- Rows are only materialized as dicts for the page being returned
+- Whole-store snapshots to a directory of raw column files for fast reload
+"""
+
+import json
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from odoo_records import Filter
+
+# Column kinds -> array typecode ('' = plain Python list)
+COLUMN_KINDS = {
+    'int': 'q',
+    'float': 'd',
+    'category': 'I',
+    'date': 'l',
+    'datetime': 'q',
+    'text': '',
+}
+
+# Sandbox tables: column kinds and the columns with secondary indexes
+SANDBOX_TABLES = {
+    'partners': {
+        'columns': {'name': 'text', 'email': 'text', 'phone': 'text'},
+        'indexed': (),
+    },
+    'invoices': {
+        'columns': {
+            'name': 'text', 'partner_id': 'int', 'partner_name': 'category',
+            'invoice_date': 'date', 'due_date': 'date',
+            'amount_total': 'float', 'amount_residual': 'float',
+            'state': 'category', 'payment_state': 'category',
+        },
+        'indexed': ('state', 'payment_state', 'partner_id'),
+    },
+    'payments': {
+        'columns': {
+            'name': 'text', 'partner_id': 'int', 'partner_name': 'category',
+            'payment_date': 'date', 'amount': 'float',
+            'payment_type': 'category', 'state': 'category', 'ref': 'text',
+        },
+        'indexed': ('partner_id', 'state'),
+    },
+    'expenses': {
+        'columns': {
+            'name': 'text', 'partner_name': 'category', 'invoice_date': 'date',
+            'amount_total': 'float', 'state': 'category', 'category': 'category',
+        },
+        'indexed': ('state',),
+    },
+    'accounts': {
+        'columns': {'name': 'text', 'code': 'text', 'balance': 'float', 'type': 'category'},
+        'indexed': ('type',),
+    },
+}
+
+
+def _numpy():
+    """NumPy if installed (vectorized scans and sums), else None."""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+def _encode_date(value: Optional[str]) -> int:
+    """'YYYY-MM-DD' -> YYYYMMDD int (0 for no date)."""
+    return int(value[:10].replace('-', '')) if value else 0
+
+
+def _decode_date(value: int) -> Optional[str]:
+    return f"{value // 10000:04d}-{value // 100 % 100:02d}-{value % 100:02d}" if value else None
+
+
+def _encode_datetime(value: Optional[str]) -> int:
+    """'YYYY-MM-DD HH:MM:SS' -> YYYYMMDDHHMMSS int (0 for none)."""
+    if not value:
+        return 0
+    digits = ''.join(ch for ch in value[:19] if ch.isdigit())
+    return int(digits.ljust(14, '0'))
+
+
+def _decode_datetime(value: int) -> Optional[str]:
+    if not value:
+        return None
+    text = str(value)
+    return f"{text[:4]}-{text[4:6]}-{text[6:8]} {text[8:10]}:{text[10:12]}:{text[12:14]}"
+
+
+_DATE_CODECS = {
+    'date': (_encode_date, _decode_date),
+    'datetime': (_encode_datetime, _decode_datetime),
+}
+
+# Filter operators ColumnarTable understands ('ilike' only on text columns)
+FILTER_OPERATORS = ('=', '!=', 'in', 'not in', '>', '>=', '<', '<=', 'ilike')
+
+
+class ColumnarTable:
+    """
+    Append-mostly table of records stored column by column.
+
+    Records go in and come out as plain dicts, so sandbox code reads like
+    it did with lists of dicts. Keys outside the schema (invoice lines,
+    for example) are kept per row in a sparse side dict.
+    """
+
+    def __init__(self, name: str, columns: Dict[str, str], indexed: Sequence[str] = (),
+                 first_id: int = 1):
+        """
+        Initialize an empty table.
+
+        Args:
+            name: Table name (for error messages)
+            columns: Column name -> kind ('int', 'float', 'category', 'date', 'datetime', 'text')
+            indexed: Columns with a value -> row positions index
+            first_id: Id handed out by the counter when the table is empty
+        """
+        self.name = name
+        self.kinds = dict(columns)
+        self.ids = array('q')
+        self.columns: Dict[str, Any] = {
+            column: array(COLUMN_KINDS[kind]) if COLUMN_KINDS[kind] else []
+            for column, kind in self.kinds.items()
+        }
+        self._labels: Dict[str, List[Any]] = {c: [] for c, k in self.kinds.items() if k == 'category'}
+        self._codes: Dict[str, Dict[Any, int]] = {c: {} for c in self._labels}
+        self._indexes: Dict[str, Dict[Any, array]] = {column: {} for column in indexed}
+        self._dirty_indexes: set = set()
+        self._positions: Dict[int, int] = {}
+        self._extras: Dict[int, Dict] = {}
+        self._next_id = first_id
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.rows(range(len(self)))
+
+    # ----- writes -----
+
+    def next_id(self) -> int:
+        """Reserve the next record id."""
+        with self._lock:
+            record_id = self._next_id
+            self._next_id += 1
+            return record_id
+
+    def _encode(self, column: str, value: Any) -> Any:
+        kind = self.kinds[column]
+        if kind == 'category':
+            codes = self._codes[column]
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(self._labels[column])
+                self._labels[column].append(value)
+            return code
+        if kind in _DATE_CODECS:
+            return _DATE_CODECS[kind][0](value)
+        if kind in ('int', 'float'):
+            return value or 0
+        return value
+
+    def _decode(self, column: str, raw: Any) -> Any:
+        kind = self.kinds[column]
+        if kind == 'category':
+            return self._labels[column][raw]
+        if kind in _DATE_CODECS:
+            return _DATE_CODECS[kind][1](raw)
+        return raw
+
+    def insert(self, record: Dict) -> Dict:
+        """
+        Append a record, assigning an id from the counter if it has none.
+
+        Returns:
+            The stored record (with its id)
+        """
+        return self.extend([record])[0]
+
+    def extend(self, records: Iterable[Dict]) -> List[Dict]:
+        """Append records in one locked pass. Returns the stored records."""
+        stored = []
+        with self._lock:
+            for record in records:
+                record_id = record.get('id') or self.next_id()
+                if record_id in self._positions:
+                    raise ValueError(f"{self.name}: duplicate id {record_id}")
+                self._next_id = max(self._next_id, record_id + 1)
+
+                position = len(self.ids)
+                self.ids.append(record_id)
+                self._positions[record_id] = position
+                for column, values in self.columns.items():
+                    encoded = self._encode(column, record.get(column))
+                    values.append(encoded)
+                    index = self._indexes.get(column)
+                    if index is not None:
+                        index.setdefault(encoded, array('q')).append(position)
+
+                extra = {k: v for k, v in record.items() if k != 'id' and k not in self.kinds}
+                if extra:
+                    self._extras[position] = extra
+                stored.append({**record, 'id': record_id})
+        return stored
+
+    def load_columns(self, ids: Sequence[int], columns: Dict[str, Sequence[Any]]):
+        """
+        Bulk-append rows given column by column (generators, snapshots).
+
+        Much faster than extend() for large loads: values are encoded a
+        column at a time and indexes are rebuilt once at the end.
+
+        Args:
+            ids: Record ids, unused by the table so far
+            columns: Column name -> values (same length as ids); missing columns get defaults
+        """
+        with self._lock:
+            base = len(self.ids)
+            if self._positions and not self._positions.keys().isdisjoint(ids):
+                raise ValueError(f"{self.name}: duplicate ids in bulk load")
+
+            self.ids.extend(ids)
+            for column, values in self.columns.items():
+                incoming = columns.get(column)
+                if incoming is None:
+                    incoming = [None] * len(ids)
+                kind = self.kinds[column]
+                if kind == 'category' or kind in _DATE_CODECS:
+                    memo: Dict[Any, Any] = {}
+                    encoded = []
+                    for value in incoming:
+                        code = memo.get(value)
+                        if code is None:
+                            code = memo[value] = self._encode(column, value)
+                        encoded.append(code)
+                    incoming = encoded
+                elif kind in ('int', 'float'):
+                    incoming = [v or 0 for v in incoming]
+                values.extend(incoming)
+
+            self._positions.update(zip(ids, range(base, base + len(ids))))
+            if len(ids):
+                self._next_id = max(self._next_id, max(ids) + 1)
+            self._dirty_indexes.update(self._indexes)
+
+    def update(self, record_id: int, values: Dict):
+        """Overwrite fields of one record (indexes are rebuilt lazily)."""
+        with self._lock:
+            position = self._positions[record_id]
+            for column, value in values.items():
+                if column in self.columns:
+                    self.columns[column][position] = self._encode(column, value)
+                    if column in self._indexes:
+                        self._dirty_indexes.add(column)
+                else:
+                    self._extras.setdefault(position, {})[column] = value
+
+    def _index(self, column: str) -> Dict[Any, array]:
+        """Secondary index for column, rebuilt first if an update invalidated it."""
+        if column in self._dirty_indexes:
+            values = self.columns[column]
+            np = _numpy()
+            index: Dict[Any, array] = {}
+            if np is not None and len(values):
+                # Stable sort keeps each value's positions ascending
+                order = np.argsort(np.frombuffer(values, dtype=values.typecode), kind='stable')
+                keys, starts = np.unique(np.frombuffer(values, dtype=values.typecode)[order], return_index=True)
+                for key, chunk in zip(keys.tolist(), np.split(order, starts[1:])):
+                    index[key] = array('q', chunk.astype(np.int64).tobytes())
+            else:
+                for position, encoded in enumerate(values):
+                    index.setdefault(encoded, array('q')).append(position)
+            self._indexes[column] = index
+            self._dirty_indexes.discard(column)
+        return self._indexes[column]
+
+    # ----- reads -----
+
+    def get(self, record_id: int) -> Optional[Dict]:
+        """Record by id, None if absent."""
+        position = self._positions.get(record_id)
+        return self.row(position) if position is not None else None
+
+    def row(self, position: int) -> Dict:
+        """Materialize the record at a row position."""
+        record = {'id': self.ids[position]}
+        for column, values in self.columns.items():
+            record[column] = self._decode(column, values[position])
+        extra = self._extras.get(position)
+        if extra:
+            record.update(extra)
+        return record
+
+    def rows(self, positions: Iterable[int]) -> Iterator[Dict]:
+        for position in positions:
+            yield self.row(position)
+
+    def _encode_filter(self, field: str, op: str, value: Any) -> Tuple[str, Any]:
+        """Encode a filter value into column storage; None when it cannot match."""
+        kind = self.kinds.get(field)
+        if op == 'ilike' and kind not in ('text', 'category'):
+            raise ValueError(f"{self.name}.{field}: ilike only applies to text and category columns")
+        if kind == 'category':
+            codes = self._codes[field]
+            if op == 'ilike':
+                # Match the labels once, then scan codes like an 'in' filter
+                needle = str(value).lower()
+                return 'in', [code for label, code in codes.items() if label is not None and needle in str(label).lower()]
+            if op in ('in', 'not in'):
+                return op, [codes[v] for v in value if v in codes]
+            if op not in ('=', '!='):
+                raise ValueError(f"{self.name}.{field}: only =, !=, in and not in apply to category columns")
+            return op, codes.get(value)
+        if kind in _DATE_CODECS:
+            encode = _DATE_CODECS[kind][0]
+            if op in ('in', 'not in'):
+                return op, [encode(v) for v in value]
+            return op, encode(value)
+        return op, value
+
+    def positions(self, filters: Optional[List[Filter]] = None) -> Sequence[int]:
+        """
+        Row positions matching every filter, in insertion (id) order.
+
+        Equality and 'in' filters on indexed columns are answered from the
+        index; the remaining filters scan only the surviving rows (the whole
+        column when nothing narrowed it down). With NumPy the result is an
+        int64 array, otherwise a list or range.
+        """
+        filters = list(filters or [])
+        np = _numpy()
+        with self._lock:
+            candidates: Optional[Sequence[int]] = None
+            remaining = []
+            for field, op, value in filters:
+                if field not in self.columns and field != 'id':
+                    raise ValueError(f"{self.name}.{field} is not a column")
+                if field in self._indexes and op in ('=', 'in'):
+                    op, encoded = self._encode_filter(field, op, value)
+                    index = self._index(field)
+                    codes = [encoded] if op == '=' else sorted(set(encoded))
+                    postings = [index[code] for code in codes if code is not None and code in index]
+                    candidates = self._intersect(candidates, self._union(postings, np), np)
+                else:
+                    remaining.append((field, op, value))
+
+            for field, op, value in remaining:
+                candidates = self._scan(field, op, value, candidates, np)
+
+            return range(len(self)) if candidates is None else candidates
+
+    @staticmethod
+    def _union(postings: List[array], np) -> Sequence[int]:
+        """Merge sorted position arrays from an index into one sorted sequence."""
+        if np is not None:
+            if not postings:
+                return np.empty(0, dtype=np.int64)
+            merged = np.concatenate([np.frombuffer(p, dtype=np.int64) for p in postings])
+            return merged if len(postings) == 1 else np.sort(merged)
+        if len(postings) == 1:
+            return postings[0]
+        return sorted(p for posting in postings for p in posting)
+
+    @staticmethod
+    def _intersect(candidates: Optional[Sequence[int]], hits: Sequence[int], np) -> Sequence[int]:
+        if candidates is None:
+            return hits
+        if np is not None:
+            return np.intersect1d(candidates, hits, assume_unique=True)
+        keep = set(hits)
+        return [p for p in candidates if p in keep]
+
+    def _scan(self, field: str, op: str, value: Any, candidates: Optional[Sequence[int]], np) -> Sequence[int]:
+        values = self.ids if field == 'id' else self.columns[field]
+        op, encoded = self._encode_filter(field, op, value) if field != 'id' else (op, value)
+        dated = self.kinds.get(field) in _DATE_CODECS
+
+        if np is not None and isinstance(values, array):
+            column = np.frombuffer(values, dtype=values.typecode) if len(values) else np.empty(0)
+            if candidates is not None:
+                candidates = np.asarray(candidates, dtype=np.int64)
+                column = column[candidates]
+            if op == '=':
+                mask = column == encoded if encoded is not None else np.zeros(len(column), bool)
+            elif op == '!=':
+                mask = column != encoded if encoded is not None else np.ones(len(column), bool)
+            elif op == 'in':
+                mask = np.isin(column, list(encoded))
+            elif op == 'not in':
+                mask = ~np.isin(column, list(encoded))
+            elif op == '>':
+                mask = column > encoded
+            elif op == '>=':
+                mask = column >= encoded
+            elif op == '<':
+                mask = column < encoded
+            elif op == '<=':
+                mask = column <= encoded
+            else:
+                raise ValueError(f"Unsupported filter operator: {op}")
+            if dated and op in ('>', '>=', '<', '<='):
+                mask &= column != 0  # missing dates never match a range
+            return np.flatnonzero(mask) if candidates is None else candidates[mask]
+
+        # Missing dates (0) never satisfy a range filter, as in Odoo
+        if op == '=':
+            test = lambda v: v == encoded
+        elif op == '!=':
+            test = lambda v: v != encoded
+        elif op == 'in':
+            allowed = set(encoded)
+            test = lambda v: v in allowed
+        elif op == 'not in':
+            excluded = set(encoded)
+            test = lambda v: v not in excluded
+        elif op == '>':
+            test = lambda v: v is not None and v > encoded and not (dated and v == 0)
+        elif op == '>=':
+            test = lambda v: v is not None and v >= encoded and not (dated and v == 0)
+        elif op == '<':
+            test = lambda v: v is not None and v < encoded and not (dated and v == 0)
+        elif op == '<=':
+            test = lambda v: v is not None and v <= encoded and not (dated and v == 0)
+        elif op == 'ilike':
+            needle = str(value).lower()
+            test = lambda v: v is not None and needle in str(v).lower()
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+
+        source = range(len(values)) if candidates is None else candidates
+        return [p for p in source if test(values[p])]
+
+    def select(self, filters: Optional[List[Filter]] = None, order: Optional[str] = None,
+               limit: Optional[int] = None, offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Query the table. Same contract as odoo_sync.MemoryStore.select.
+
+        Returns:
+            (rows, total matching count)
+        """
+        positions, total = self.page(filters, order, limit, offset)
+        return list(self.rows(positions)), total
+
+    def page(self, filters: Optional[List[Filter]] = None, order: Optional[str] = None,
+             limit: Optional[int] = None, offset: int = 0) -> Tuple[Sequence[int], int]:
+        """
+        Row positions of one sorted page of matching rows.
+
+        Returns:
+            (positions, total matching count)
+        """
+        positions = self.positions(filters)
+        total = len(positions)
+
+        if order:
+            positions = self._order(positions, order)
+
+        end = offset + limit if limit else None
+        return positions[offset:end], total
+
+    def _order(self, positions: Sequence[int], order: str) -> Sequence[int]:
+        """Sort positions by one column ('field' or 'field desc'); ties keep id order."""
+        field, _, direction = order.strip().partition(' ')
+        descending = direction.strip().lower() == 'desc'
+        values = self.ids if field == 'id' else self.columns[field]
+        np = _numpy()
+
+        if np is not None and isinstance(values, array):
+            picked = np.asarray(positions, dtype=np.int64)
+            keys = np.frombuffer(values, dtype=values.typecode)[picked] if len(values) else np.empty(0)
+            if self.kinds.get(field) == 'category':
+                # Codes are in first-seen order; rank them by label
+                labels = self._labels[field]
+                rank = np.empty(len(labels), dtype=np.int64)
+                rank[sorted(range(len(labels)), key=lambda code: (labels[code] is None, labels[code] or ''))] = np.arange(len(labels))
+                keys = rank[keys]
+            if descending:
+                keys = -keys.astype(np.float64)
+            return picked[np.argsort(keys, kind='stable')]
+
+        key = values.__getitem__
+        if self.kinds.get(field) == 'category':
+            labels = self._labels[field]
+            key = lambda p: (labels[values[p]] is None, labels[values[p]] or '')
+        elif self.kinds.get(field) == 'text':
+            key = lambda p: (values[p] is None, values[p] or '')
+        return sorted(positions, key=key, reverse=descending)
+
+    def column(self, name: str, positions: Optional[Sequence[int]] = None) -> List[Any]:
+        """Decoded values of one column, in row order or at the given row positions."""
+        values = self.ids if name == 'id' else self.columns[name]
+        if positions is not None:
+            np = _numpy()
+            if np is not None and isinstance(values, array):
+                picked = np.asarray(positions, dtype=np.int64)
+                values = np.frombuffer(values, dtype=values.typecode)[picked].tolist() if len(values) else []
+            else:
+                values = [values[p] for p in positions]
+        if name == 'id' or self.kinds[name] in ('int', 'float', 'text'):
+            return list(values)
+        if self.kinds[name] == 'category':
+            labels = self._labels[name]
+            return [labels[code] for code in values]
+        decode = _DATE_CODECS[self.kinds[name]][1]
+        return [decode(v) for v in values]
+
+    def count(self, filters: Optional[List[Filter]] = None) -> int:
+        return len(self.positions(filters))
+
+    def sum(self, column: str, filters: Optional[List[Filter]] = None) -> float:
+        """Sum a numeric column over the matching rows."""
+        return self.aggregate([], [column], filters)[0][column]
+
+    def aggregate(self, groupby: List[str], sums: List[str],
+                  filters: Optional[List[Filter]] = None) -> List[Dict]:
+        """
+        Group matching rows and sum numeric columns, like Odoo read_group(lazy=False).
+
+        Returns:
+            One row per group: groupby values, summed columns and '__count'
+        """
+        positions = self.positions(filters)
+        np = _numpy()
+
+        vectorized = all(isinstance(self.columns[c], array) for c in list(groupby) + list(sums))
+        if np is not None and vectorized and len(positions):
+            picked = None if isinstance(positions, range) else np.asarray(positions, dtype=np.int64)
+
+            def column(name):
+                values = np.frombuffer(self.columns[name], dtype=self.columns[name].typecode)
+                return values if picked is None else values[picked]
+
+            if groupby:
+                # Category codes (or ints) folded into one mixed-radix key per row
+                radices = [len(self._labels[g]) if g in self._labels else None for g in groupby]
+                raw = [column(g).astype(np.int64) for g in groupby]
+                if None in radices:
+                    keys = np.stack(raw, axis=1)
+                    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+                    inverse = inverse.reshape(-1)
+                else:
+                    inverse = np.zeros(len(positions), dtype=np.int64)
+                    for codes, radix in zip(raw, radices):
+                        inverse = inverse * radix + codes
+                    occupied = np.bincount(inverse)
+                    present = np.flatnonzero(occupied)
+                    unique = []
+                    for key in present.tolist():
+                        parts = []
+                        for radix in reversed(radices):
+                            key, code = divmod(key, radix)
+                            parts.append(code)
+                        unique.append(tuple(reversed(parts)))
+                    dense = np.zeros(len(occupied), dtype=np.int64)
+                    dense[present] = np.arange(len(present))
+                    inverse = dense[inverse]
+                counts = np.bincount(inverse, minlength=len(unique))
+                totals = {s: np.bincount(inverse, weights=column(s), minlength=len(unique)) for s in sums}
+            else:
+                unique = [()]
+                counts = [len(positions)]
+                totals = {s: [column(s).sum()] for s in sums}
+
+            groups = []
+            for g, key in enumerate(unique):
+                group = {name: self._decode(name, int(code)) for name, code in zip(groupby, key)}
+                group.update({s: float(totals[s][g]) for s in sums})
+                group['__count'] = int(counts[g])
+                groups.append(group)
+            return groups
+
+        grouped: Dict[Tuple, Dict] = {}
+        for position in positions:
+            key = tuple(self.columns[g][position] for g in groupby)
+            group = grouped.get(key)
+            if group is None:
+                group = grouped[key] = {name: self._decode(name, code) for name, code in zip(groupby, key)}
+                group.update({s: 0.0 for s in sums})
+                group['__count'] = 0
+            for s in sums:
+                group[s] += self.columns[s][position]
+            group['__count'] += 1
+        if not groupby and not grouped:
+            return [{**{s: 0.0 for s in sums}, '__count': 0}]
+        return list(grouped.values())
+
+    # ----- snapshots -----
+
+    def save(self, directory: Path):
+        """Write the table as raw column files plus a JSON manifest entry."""
+        with self._lock:
+            with open(directory / f'{self.name}.id.bin', 'wb') as f:
+                self.ids.tofile(f)
+            for column, values in self.columns.items():
+                if isinstance(values, array):
+                    with open(directory / f'{self.name}.{column}.bin', 'wb') as f:
+                        values.tofile(f)
+                else:
+                    with open(directory / f'{self.name}.{column}.json', 'w') as f:
+                        json.dump(values, f)
+            with open(directory / f'{self.name}.extras.json', 'w') as f:
+                json.dump({str(k): v for k, v in self._extras.items()}, f)
+            return {'rows': len(self.ids), 'next_id': self._next_id, 'labels': self._labels}
+
+    def restore(self, directory: Path, meta: Dict):
+        """Load a table written by save() into this (empty) table."""
+        with self._lock:
+            rows = meta['rows']
+            with open(directory / f'{self.name}.id.bin', 'rb') as f:
+                self.ids.fromfile(f, rows)
+            for column, values in self.columns.items():
+                if isinstance(values, array):
+                    with open(directory / f'{self.name}.{column}.bin', 'rb') as f:
+                        values.fromfile(f, rows)
+                else:
+                    with open(directory / f'{self.name}.{column}.json') as f:
+                        values.extend(json.load(f))
+            for column, labels in meta['labels'].items():
+                self._labels[column] = list(labels)
+                self._codes[column] = {label: code for code, label in enumerate(labels)}
+            with open(directory / f'{self.name}.extras.json') as f:
+                self._extras = {int(k): v for k, v in json.load(f).items()}
+            self._positions = dict(zip(self.ids, range(rows)))
+            self._next_id = meta['next_id']
+            self._dirty_indexes.update(self._indexes)
+
+
+def create_sandbox_tables() -> Dict[str, ColumnarTable]:
+    """Empty sandbox tables, one per SANDBOX_TABLES entry."""
+    return {
+        name: ColumnarTable(name, spec['columns'], spec['indexed'])
+        for name, spec in SANDBOX_TABLES.items()
+    }
+
+
+def save_snapshot(tables: Dict[str, ColumnarTable], path: str, info: Optional[Dict] = None):
+    """
+    Snapshot sandbox tables to a directory for fast reload.
+
+    Args:
+        tables: Tables from create_sandbox_tables()
+        path: Snapshot directory (created if missing)
+        info: Extra metadata stored in the manifest (e.g. generator settings)
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        'version': 1,
+        'info': info or {},
+        'tables': {name: table.save(directory) for name, table in tables.items()},
+    }
+    with open(directory / 'manifest.json', 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def load_snapshot(path: str) -> Dict[str, ColumnarTable]:
+    """
+    Load sandbox tables written by save_snapshot().
+
+    Returns:
+        Tables ready to hand to OdooMCPServer.load_sandbox()
+    """
+    directory = Path(path)
+    with open(directory / 'manifest.json') as f:
+        manifest = json.load(f)
+
+    tables = create_sandbox_tables()
+    for name, meta in manifest['tables'].items():
+        tables[name].restore(directory, meta)
+    return tables
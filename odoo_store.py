@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Odoo SQLite Mirror - indexed local store for synced Odoo records
+
+Drop-in replacement for odoo_sync.MemoryStore that persists invoices,
+partners, payments and accounts to SQLite:
+- Full records kept as JSON, filter/sort fields as indexed columns
+- Indexes on partner, state, payment_state and invoice_date
+- Watermarks and last sync time survive restarts
+
+Dashboard metrics and unpaid lists become local SQL queries instead of
+Odoo round trips.
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from odoo_records import Filter
+
+# model -> (table, indexed columns, indexes)
+MIRROR_TABLES = {
+    'account.move': ('invoices', {
+        'partner_id': 'INTEGER', 'state': 'TEXT', 'payment_state': 'TEXT', 'invoice_date': 'TEXT',
+        'amount_total': 'REAL', 'amount_residual': 'REAL', 'write_date': 'TEXT',
+    }, ['partner_id', 'state', 'payment_state', 'invoice_date']),
+    'res.partner': ('partners', {
+        'name': 'TEXT', 'email': 'TEXT', 'customer_rank': 'INTEGER', 'write_date': 'TEXT',
+    }, ['name', 'email']),
+    'account.payment': ('payments', {
+        'partner_id': 'INTEGER', 'payment_date': 'TEXT', 'amount': 'REAL', 'payment_type': 'TEXT',
+        'state': 'TEXT', 'write_date': 'TEXT',
+    }, ['partner_id', 'payment_date', 'state']),
+    'account.account': ('accounts', {
+        'code': 'TEXT', 'account_type': 'TEXT', 'current_balance': 'REAL',
+    }, ['account_type']),
+}
+
+SQL_OPERATORS = {'=': '=', '!=': '!=', '>=': '>=', '<=': '<='}
+
+
+def _column_value(value: Any) -> Any:
+    """Flatten Odoo values for SQL columns: many2one [id, name] -> id, False -> NULL."""
+    if isinstance(value, (list, tuple)):
+        return value[0] if value else None
+    if value is False:
+        return None
+    return value
+
+
+class SqliteStore:
+    """
+    SQLite-backed local copy of synced Odoo records.
+
+    Implements the same interface as odoo_sync.MemoryStore. Rows come back
+    in Odoo's search_read shape, so consumers cannot tell the difference.
+    """
+
+    def __init__(self, path: str = 'odoo_mirror.db'):
+        """
+        Open (or create) the mirror database.
+
+        Args:
+            path: SQLite file path, ':memory:' for a throwaway mirror
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            for table, columns, indexes in MIRROR_TABLES.values():
+                column_sql = ''.join(f', {name} {kind}' for name, kind in columns.items())
+                self._conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, data TEXT NOT NULL{column_sql})'
+                )
+                for column in indexes:
+                    self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS sync_state (model TEXT PRIMARY KEY, watermark TEXT, synced_at REAL)'
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _table(self, model: str) -> Tuple[str, Dict[str, str]]:
+        table, columns, _ = MIRROR_TABLES[model]
+        return table, columns
+
+    def _write_rows(self, model: str, records: List[Dict]):
+        """INSERT OR REPLACE records; the caller holds the lock and the transaction."""
+        table, columns = self._table(model)
+        names = list(columns)
+        placeholders = ', '.join('?' * (len(names) + 2))
+        rows = [
+            (r['id'], json.dumps(r), *(_column_value(r.get(name)) for name in names))
+            for r in records
+        ]
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO {table} (id, data, {', '.join(names)}) VALUES ({placeholders})", rows
+        )
+
+    def upsert(self, model: str, records: List[Dict]):
+        with self._lock, self._conn:
+            self._write_rows(model, records)
+
+    def replace(self, model: str, records: List[Dict]):
+        # One transaction, so readers never see the table emptied
+        table, _ = self._table(model)
+        with self._lock, self._conn:
+            self._conn.execute(f'DELETE FROM {table}')
+            self._write_rows(model, records)
+
+    def ids(self, model: str) -> set:
+        table, _ = self._table(model)
+        with self._lock:
+            return {row[0] for row in self._conn.execute(f'SELECT id FROM {table}')}
+
+    def delete(self, model: str, ids: List[int]):
+        table, _ = self._table(model)
+        with self._lock, self._conn:
+            self._conn.executemany(f'DELETE FROM {table} WHERE id = ?', [(i,) for i in ids])
+
+    def get_watermark(self, model: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute('SELECT watermark FROM sync_state WHERE model = ?', (model,)).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, model: str, watermark: Optional[str]):
+        if not watermark:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO sync_state (model, watermark) VALUES (?, ?) '
+                'ON CONFLICT(model) DO UPDATE SET watermark = excluded.watermark', (model, watermark)
+            )
+
+    def mark_synced(self, model: str, synced_at: float):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO sync_state (model, synced_at) VALUES (?, ?) '
+                'ON CONFLICT(model) DO UPDATE SET synced_at = excluded.synced_at', (model, synced_at)
+            )
+
+    def synced_at(self, model: str) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute('SELECT synced_at FROM sync_state WHERE model = ?', (model,)).fetchone()
+        return row[0] if row else None
+
+    def _where(self, model: str, filters: Optional[List[Filter]]) -> Tuple[str, List]:
+        """Translate (field, op, value) filters into an indexed WHERE clause."""
+        _, columns = self._table(model)
+        clauses, params = [], []
+        for field, op, value in filters or []:
+            if field != 'id' and field not in columns:
+                raise ValueError(f"{model}.{field} is not a mirrored column")
+            if op == 'in':
+                values = list(value)
+                clauses.append(f"{field} IN ({', '.join('?' * len(values))})" if values else '0')
+                params.extend(values)
+            elif op in SQL_OPERATORS:
+                clauses.append(f'{field} {SQL_OPERATORS[op]} ?')
+                params.append(_column_value(value))
+            else:
+                raise ValueError(f"Unsupported filter operator: {op}")
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def select(self, model: str, filters: Optional[List[Filter]] = None,
+               order: Optional[str] = None, limit: Optional[int] = None,
+               offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Query the mirror. Same contract as MemoryStore.select.
+
+        Returns:
+            (rows, total matching count)
+        """
+        table, columns = self._table(model)
+        where, params = self._where(model, filters)
+
+        order_sql = ''
+        if order:
+            field, _, direction = order.partition(' ')
+            if field != 'id' and field not in columns:
+                raise ValueError(f"{model}.{field} is not a mirrored column")
+            order_sql = f" ORDER BY {field} {'DESC' if direction.strip().lower() == 'desc' else 'ASC'}, id"
+
+        page_sql = ''
+        if limit:
+            page_sql = ' LIMIT ? OFFSET ?'
+        elif offset:
+            page_sql = ' LIMIT -1 OFFSET ?'
+
+        with self._lock:
+            total = self._conn.execute(f'SELECT COUNT(*) FROM {table}{where}', params).fetchone()[0]
+            page_params = [limit, offset] if limit else ([offset] if offset else [])
+            rows = self._conn.execute(
+                f'SELECT data FROM {table}{where}{order_sql}{page_sql}', params + page_params
+            ).fetchall()
+
+        return [json.loads(row[0]) for row in rows], total
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Odoo Stream - incremental decoding of large JSON-RPC responses
+
+Decodes the `result` array of a JSON-RPC response chunk by chunk and
+yields each element (a search_read record) as soon as it is complete, so
+a large search_read never holds the whole body, the whole parsed list and
+the caller's copies in memory at the same time.
+
+Backends (ODOO_JSON_BACKEND):
+- 'json' (default): stdlib. Streams use the scanner below, which decodes
+  one element at a time with the C json decoder
+- 'orjson': whole (non-streamed) bodies decode about 1.8x faster but
+  take about twice the memory; streams still use the stdlib scanner
+  (pip install orjson)
+- 'ijson': streams through ijson (pip install ijson), a true incremental
+  parser whose memory stays flat even for a single huge value, at a
+  higher per-record cost than the stdlib scanner
+
+Used by OdooMCPServer._post()/_json_rpc_stream() and by
+iter_invoices/iter_partners with stream=True.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+from odoo_resilience import OdooRPCError
+
+# Bytes read from the socket per chunk
+CHUNK_SIZE = 64 * 1024
+
+BACKENDS = ('json', 'orjson', 'ijson')
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def _check_backend(backend: str):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+
+
+def loads(body: bytes, backend: str = 'json') -> Any:
+    """Decode a whole response body."""
+    _check_backend(backend)
+    if backend == 'orjson':
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError("orjson library required for the orjson JSON backend: pip install orjson")
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def iter_result(chunks: Iterable[bytes], backend: str = 'json') -> Iterator[Any]:
+    """
+    Yield the elements of a JSON-RPC response's result array as they are decoded.
+
+    Args:
+        chunks: Response body as an iterable of byte chunks
+        backend: 'ijson', otherwise the stdlib scanner
+
+    Yields:
+        Result elements in order
+
+    Raises:
+        OdooRPCError: The response carries an Odoo error
+        ValueError: The body is not a JSON-RPC response with an array result
+    """
+    _check_backend(backend)
+    if backend == 'ijson':
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError("ijson library required for the ijson JSON backend: pip install ijson")
+        return _iter_ijson(ijson, chunks)
+    return iter(_ResultScanner(chunks))
+
+
+class _ChunkReader:
+    """Minimal file-like view of a chunk iterator, for ijson."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b''
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b''
+            self._pending = chunk
+        if size < 0 or size >= len(self._pending):
+            data, self._pending = self._pending, b''
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+# ijson events that complete a value at the prefix they are reported for
+_VALUE_END = frozenset({'end_map', 'end_array', 'string', 'number', 'boolean', 'null', 'integer', 'double'})
+
+
+def _iter_ijson(ijson, chunks: Iterable[bytes]) -> Iterator[Any]:
+    builder: Optional[Any] = None
+    error = None
+    found = False
+
+    for prefix, event, value in ijson.parse(_ChunkReader(chunks), use_float=True):
+        if prefix == 'result' and event == 'start_array':
+            found = True
+        elif prefix == 'result.item' or prefix.startswith('result.item.'):
+            if builder is None:
+                builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            if prefix == 'result.item' and event in _VALUE_END:
+                yield builder.value
+                builder = None
+        elif prefix == 'error' or prefix.startswith('error.'):
+            if error is None:
+                error = ijson.ObjectBuilder()
+            error.event(event, value)
+            if prefix == 'error' and event in _VALUE_END:
+                raise OdooRPCError(f"Odoo Error: {error.value}")
+        elif prefix == 'result' and event != 'end_array':
+            raise ValueError("JSON-RPC result is not an array")
+
+    if not found:
+        raise ValueError("JSON-RPC response has no result")
+
+
+class _ResultScanner:
+    """
+    Stdlib incremental scanner for {"...": ..., "result": [...]} bodies.
+
+    Only the top-level object and the result array are walked by hand;
+    each key, element and other value is decoded with json raw_decode once
+    the buffer holds all of it. Consumed text is dropped on every refill,
+    so the buffer stays about one chunk plus one partial element.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. False once the body is exhausted."""
+        if self._eof:
+            return False
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos:] + self._utf8.decode(chunk)
+                self._pos = 0
+                return True
+        self._buf = self._buf[self._pos:] + self._utf8.decode(b'', final=True)
+        self._pos = 0
+        self._eof = True
+        return False
+
+    def _peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end of body)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _take(self, expected: str) -> str:
+        char = self._peek()
+        if char not in expected or not char:
+            raise ValueError(f"Malformed JSON-RPC response: expected {expected!r}, got {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def __iter__(self) -> Iterator[Any]:
+        self._take('{')
+        found = False
+        if self._peek() != '}':
+            while True:
+                key = self._value()
+                self._take(':')
+                if key == 'result':
+                    if self._peek() != '[':
+                        raise ValueError("JSON-RPC result is not an array")
+                    found = True
+                    self._pos += 1
+                    if self._peek() == ']':
+                        self._pos += 1
+                    else:
+                        while True:
+                            yield self._value()
+                            if self._take(',]') == ']':
+                                break
+                else:
+                    value = self._value()
+                    if key == 'error':
+                        raise OdooRPCError(f"Odoo Error: {value}")
+                if self._take(',}') == '}':
+                    break
+
+        if not found:
+            raise ValueError("JSON-RPC response has no result")
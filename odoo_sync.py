@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Odoo Incremental Sync - write_date watermark replication
+
+Keeps a local copy of the Odoo records the AI Employee reads most
+(invoices, partners, payments, accounts) and refreshes it incrementally:
+- Per-model write_date watermark, only changed records are pulled
+- Deleted records detected with an ids-only search and dropped locally
+- Models without reliable write_date (computed balances) fully refreshed
+
+OdooMCPServer serves get_invoices/get_partners/get_payments/
+get_account_balances from the local copy once a sync engine is attached,
+so the dashboard and weekly audit stop pulling full result sets.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from odoo_records import Filter
+
+logger = logging.getLogger(__name__)
+
+# Synced models: base domain, fields, and whether write_date sync applies
+SYNC_MODELS = {
+    'account.move': {
+        'domain': [('move_type', '=', 'out_invoice')],
+        'fields': ['name', 'partner_id', 'invoice_date', 'invoice_date_due', 'amount_total',
+                   'amount_residual', 'state', 'payment_state', 'write_date'],
+        'incremental': True,
+    },
+    'res.partner': {
+        'domain': [('customer_rank', '>', 0)],
+        'fields': ['name', 'email', 'phone', 'customer_rank', 'write_date'],
+        'incremental': True,
+    },
+    'account.payment': {
+        'domain': [('state', '=', 'posted')],
+        'fields': ['name', 'partner_id', 'payment_date', 'amount',
+                   'payment_type', 'state', 'ref', 'write_date'],
+        'incremental': True,
+    },
+    # current_balance is computed, so write_date does not move with it
+    'account.account': {
+        'domain': [('account_type', 'in', ['asset_current', 'liability_current'])],
+        'fields': ['name', 'code', 'current_balance', 'account_type'],
+        'incremental': False,
+    },
+}
+
+
+class MemoryStore:
+    """
+    In-process local copy of synced Odoo records.
+
+    Records are kept per model in id-keyed dicts alongside each model's
+    write_date watermark and last sync time.
+    """
+
+    def __init__(self):
+        self._records: Dict[str, Dict[int, Dict]] = {}
+        self._watermarks: Dict[str, str] = {}
+        self._synced_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def upsert(self, model: str, records: List[Dict]):
+        with self._lock:
+            table = self._records.setdefault(model, {})
+            for record in records:
+                table[record['id']] = record
+
+    def replace(self, model: str, records: List[Dict]):
+        with self._lock:
+            self._records[model] = {r['id']: r for r in records}
+
+    def ids(self, model: str) -> set:
+        with self._lock:
+            return set(self._records.get(model, {}))
+
+    def delete(self, model: str, ids: List[int]):
+        with self._lock:
+            table = self._records.get(model, {})
+            for record_id in ids:
+                table.pop(record_id, None)
+
+    def get_watermark(self, model: str) -> Optional[str]:
+        return self._watermarks.get(model)
+
+    def set_watermark(self, model: str, watermark: Optional[str]):
+        if watermark:
+            self._watermarks[model] = watermark
+
+    def mark_synced(self, model: str, synced_at: float):
+        self._synced_at[model] = synced_at
+
+    def synced_at(self, model: str) -> Optional[float]:
+        return self._synced_at.get(model)
+
+    def select(self, model: str, filters: Optional[List[Filter]] = None,
+               order: Optional[str] = None, limit: Optional[int] = None,
+               offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Query the local copy.
+
+        Args:
+            filters: (field, op, value) triples; op is one of '=', '!=', 'in', '>=', '<='
+            order: Field name, optionally suffixed with ' desc'
+            limit: Maximum rows returned
+            offset: Rows to skip
+
+        Returns:
+            (rows, total matching count)
+        """
+        with self._lock:
+            rows = list(self._records.get(model, {}).values())
+
+        for field, op, value in filters or []:
+            rows = [r for r in rows if _matches(r.get(field), op, value)]
+
+        if order:
+            field, _, direction = order.partition(' ')
+            rows.sort(key=lambda r: _sort_key(r.get(field)),
+                      reverse=direction.strip().lower() == 'desc')
+
+        total = len(rows)
+        end = offset + limit if limit else None
+        return rows[offset:end], total
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    # Odoo reports empty fields as False; only those sort as missing, 0 and 0.0 keep their place
+    missing = value is None or value is False
+    return missing, 0 if missing else value
+
+
+def _matches(actual: Any, op: str, value: Any) -> bool:
+    if op == '=':
+        return actual == value
+    if op == '!=':
+        return actual != value
+    if op == 'in':
+        return actual in value
+    if actual is None or actual is False:
+        return False
+    if op == '>=':
+        return actual >= value
+    if op == '<=':
+        return actual <= value
+    raise ValueError(f"Unsupported filter operator: {op}")
+
+
+class OdooSyncEngine:
+    """
+    Incremental replication of Odoo models into a local store.
+
+    Each sync pulls records whose write_date is at or after the model's
+    watermark (re-pulling the boundary record is harmless, upserts are
+    idempotent), then drops local ids Odoo no longer returns.
+    """
+
+    def __init__(self, server, store=None, page_size: int = 500,
+                 max_age: float = 60, models: Optional[Dict[str, Dict]] = None):
+        """
+        Initialize sync engine.
+
+        Args:
+            server: Production-mode OdooMCPServer used for RPC
+            store: Local store (defaults to an in-memory MemoryStore)
+            page_size: Records per search_read page
+            max_age: Seconds before ensure_fresh() triggers an incremental sync
+            models: Model specs, defaults to SYNC_MODELS
+        """
+        self.server = server
+        self.store = store if store is not None else MemoryStore()
+        self.page_size = page_size
+        self.max_age = max_age
+        self.models = models or SYNC_MODELS
+        self._stale: set = set()
+        self._lock = threading.Lock()
+
+    def _search_read_pages(self, model: str, domain: List, fields: List[str]) -> List[Dict]:
+        """
+        Pull every record matching domain, page by page, oldest change first.
+
+        Pages follow a (write_date, id) keyset cursor rather than an offset:
+        a record written or deleted mid-sync moves within (or out of) the
+        ordering, which would shift offset pages and skip a row. Models
+        synced without write_date page by id alone.
+        """
+        keyset = 'write_date' in fields
+        order = 'write_date asc, id asc' if keyset else 'id asc'
+        records = []
+        cursor: List = []
+        while True:
+            page = self.server._json_rpc_call('/jsonrpc', 'call', self.server._execute_kw_params(
+                model, 'search_read', [domain + cursor],
+                {'fields': fields, 'order': order, 'limit': self.page_size}
+            ))
+            records.extend(page)
+            if len(page) < self.page_size:
+                return records
+            last = page[-1]
+            if keyset:
+                cursor = ['|', ('write_date', '>', last['write_date']),
+                          '&', ('write_date', '=', last['write_date']), ('id', '>', last['id'])]
+            else:
+                cursor = [('id', '>', last['id'])]
+
+    def sync_model(self, model: str) -> Dict[str, Any]:
+        """
+        Bring one model's local copy up to date.
+
+        Returns:
+            Counts of changed and deleted records
+        """
+        spec = self.models[model]
+        base_domain = list(spec['domain'])
+        watermark = self.store.get_watermark(model) if spec['incremental'] else None
+
+        if watermark:
+            changed = self._search_read_pages(model, base_domain + [('write_date', '>=', watermark)], spec['fields'])
+            self.store.upsert(model, changed)
+
+            # Deletions (and records leaving the domain): ids-only diff
+            remote_ids = set(self.server._json_rpc_call('/jsonrpc', 'call', self.server._execute_kw_params(
+                model, 'search', [base_domain]
+            )))
+            deleted = list(self.store.ids(model) - remote_ids)
+            self.store.delete(model, deleted)
+        else:
+            changed = self._search_read_pages(model, base_domain, spec['fields'])
+            self.store.replace(model, changed)
+            deleted = []
+
+        if spec['incremental'] and changed:
+            self.store.set_watermark(model, max(r['write_date'] for r in changed if r.get('write_date')))
+        self.store.mark_synced(model, time.time())
+
+        return {'changed': len(changed), 'deleted': len(deleted), 'full': not watermark}
+
+    def sync(self, models: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Sync the given models (default: all).
+
+        Returns:
+            Per-model counts, or an error entry for models that failed
+        """
+        if self.server.mode == "sandbox":
+            raise RuntimeError("Odoo sync requires production mode")
+
+        results = {}
+        with self._lock:
+            for model in models or list(self.models):
+                try:
+                    results[model] = self.sync_model(model)
+                    self._stale.discard(model)
+                except Exception as e:
+                    logger.warning(f"Odoo sync failed for {model}: {e}")
+                    results[model] = {'error': str(e)}
+        return results
+
+    def mark_stale(self, model: str):
+        """Force the next ensure_fresh() to sync model (called after writes)."""
+        if model in self.models:
+            self._stale.add(model)
+
+    def age(self, model: str) -> Optional[float]:
+        """Seconds since model was last synced, None if never."""
+        synced_at = self.store.synced_at(model)
+        return time.time() - synced_at if synced_at else None
+
+    def ensure_fresh(self, model: str):
+        """Incrementally sync model if it is stale or older than max_age."""
+        age = self.age(model)
+        if model in self._stale or age is None or age > self.max_age:
+            self.sync([model])
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Watermark, last sync time and age per model."""
+        status = {}
+        for model in self.models:
+            synced_at = self.store.synced_at(model)
+            status[model] = {
+                'watermark': self.store.get_watermark(model),
+                'synced_at': datetime.fromtimestamp(synced_at).isoformat() if synced_at else None,
+                'age_seconds': round(self.age(model), 1) if synced_at else None,
+                'stale': model in self._stale,
+            }
+        return status
@@ -50,10 +50,18 @@ class WeeklyAuditGenerator:
         """Collect financial data from Odoo"""
         print("📊 Collecting financial data from Odoo...")
 
-        summary = self.odoo.get_financial_summary(period='week')
-        balances = self.odoo.get_account_balances()
-        payments = self.odoo.get_payments(days=7)
-        invoices = self.odoo.get_invoices(state='unpaid')
+        # Independent reads run concurrently; a failed read leaves its section empty
+        summary, balances, payments, invoices = self.odoo.execute_tools([
+            ('odoo_get_summary', {'period': 'week'}),
+            ('odoo_get_balances', {}),
+            ('odoo_get_payments', {'days': 7}),
+            ('odoo_get_invoices', {'state': 'unpaid'}),
+        ], parallel=True)
+
+        for name, result in (('summary', summary), ('balances', balances),
+                             ('payments', payments), ('invoices', invoices)):
+            if not result.get('success'):
+                print(f"   ⚠️  Odoo {name} unavailable: {result.get('error', 'Unknown error')}")
 
         # Map Odoo data to expected format
         return {